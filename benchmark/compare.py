@@ -0,0 +1,51 @@
+"""Compare two result files of suite.py, and list the operations that got slower.
+
+Operations are matched on their name, dictionary size, document length and
+max_cost, and compared on their fastest time. Exits with status 1 if an operation
+is slower than `--threshold` allows.
+
+Usage:
+    python benchmark/compare.py before.json after.json --threshold 0.1
+"""
+import argparse
+import json
+import sys
+
+KEY_FIELDS = ('operation', 'dictionary_size', 'document_length', 'max_cost')
+
+
+def load(path):
+    """Timed results of a result file, by operation and inputs."""
+    with open(path) as f:
+        results = json.load(f)['results']
+    return dict((tuple(result.get(field) for field in KEY_FIELDS), result)
+                for result in results if 'min' in result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="slowdown reported as a regression, 0.1 for 10%%")
+    args = parser.parse_args()
+    before = load(args.before)
+    after = load(args.after)
+
+    regressions = 0
+    for key in sorted(set(before) & set(after), key=lambda key: tuple(str(field) for field in key)):
+        ratio = after[key]['min'] / before[key]['min']
+        regression = ratio > 1 + args.threshold
+        regressions += regression
+        print('{:<28} {:>10} {:>10} {:>4}  {:>10.6f}s -> {:>10.6f}s  x{:.2f}{}'.format(
+            key[0], key[1], key[2] if key[2] is not None else '-', key[3] if key[3] is not None else '-',
+            before[key]['min'], after[key]['min'], ratio, '  REGRESSION' if regression else ''))
+    for key in sorted(set(before) ^ set(after), key=lambda key: tuple(str(field) for field in key)):
+        print('{:<28} {:>10} {:>10} {:>4}  only in {}'.format(
+            key[0], key[1], key[2] if key[2] is not None else '-', key[3] if key[3] is not None else '-',
+            args.before if key in before else args.after))
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
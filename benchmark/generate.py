@@ -0,0 +1,123 @@
+"""Synthetic keyword dictionaries and documents for the benchmarks.
+
+Everything is generated from a seed, so that runs on different machines or releases
+measure the same inputs. Words are made of random syllables, keywords of one to three
+words, and documents of words of the same vocabulary with keywords spread among them,
+some of them misspelled for the fuzzy benchmarks.
+
+Usage:
+    python benchmark/generate.py --keywords 100000 --dictionary keywords.txt
+    python benchmark/generate.py --keywords 100000 --length 1000000 --document document.txt
+"""
+import argparse
+import random
+
+SYLLABLES = [consonant + vowel for consonant in 'bcdfghjklmnprstvwz' for vowel in 'aeiou']
+PUNCTUATION = ['.', ',', ';', '!', '?']
+
+
+def make_vocabulary(size, seed=0):
+    """`size` distinct words of two to four syllables."""
+    rng = random.Random(seed)
+    words = set()
+    vocabulary = []
+    while len(vocabulary) < size:
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in words:
+            words.add(word)
+            vocabulary.append(word)
+    return vocabulary
+
+
+def make_dictionary(size, seed=0, categories=100):
+    """`size` distinct keywords, with their clean names.
+
+    Keywords are one word for 70% of them, two or three words otherwise. Half of them
+    are their own clean name, the others are tagged with one of `categories` names.
+
+    Returns:
+        keywords (list(tuple)): (keyword, clean_name) pairs.
+    """
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(max(1000, size // 4), seed)
+    seen = set()
+    keywords = []
+    while len(keywords) < size:
+        word_count = 1 if rng.random() < 0.7 else rng.randint(2, 3)
+        keyword = ' '.join(rng.choice(vocabulary) for _ in range(word_count))
+        if keyword in seen:
+            continue
+        seen.add(keyword)
+        clean_name = keyword if rng.random() < 0.5 else 'category{}'.format(rng.randrange(categories))
+        keywords.append((keyword, clean_name))
+    return keywords
+
+
+def misspell(word, rng):
+    """`word` with one character deleted, replaced or inserted."""
+    idx = rng.randrange(len(word))
+    edit = rng.randrange(3)
+    if edit == 0 and len(word) > 1:
+        return word[:idx] + word[idx + 1:]
+    if edit == 1:
+        return word[:idx] + rng.choice('aeiou') + word[idx + 1:]
+    return word[:idx] + rng.choice('bcdfg') + word[idx:]
+
+
+def make_document(length, keywords, seed=0, density=0.1, typos=0.02):
+    """A document of `length` characters, made of words with keywords among them.
+
+    Args:
+        length (int): Number of characters of the document.
+        keywords (list(tuple)): (keyword, clean_name) pairs, see make_dictionary.
+        seed (int): Seed of the random choices.
+        density (float): Share of the words that start a keyword.
+        typos (float): Share of the keywords that are misspelled.
+
+    Returns:
+        document (str): The document, ending at a word boundary when possible.
+    """
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(1000, seed + 1)
+    parts = []
+    size = 0
+    while size < length:
+        if keywords and rng.random() < density:
+            word = rng.choice(keywords)[0]
+            if rng.random() < typos:
+                word = misspell(word, rng)
+        else:
+            word = rng.choice(vocabulary)
+        if rng.random() < 0.05:
+            word += rng.choice(PUNCTUATION)
+        parts.append(word)
+        size += len(word) + 1
+    document = ' '.join(parts)[:length]
+    return document
+
+
+def write_dictionary(path, keywords):
+    """Write `keywords` in the format read by add_keyword_from_file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for keyword, clean_name in keywords:
+            f.write('{}=>{}\n'.format(keyword, clean_name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--keywords', type=int, default=10000, help="number of keywords")
+    parser.add_argument('--length', type=int, default=10000, help="length of the document, in characters")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dictionary', help="file to write the keywords to")
+    parser.add_argument('--document', help="file to write the document to")
+    args = parser.parse_args()
+    keywords = make_dictionary(args.keywords, args.seed)
+    if args.dictionary:
+        write_dictionary(args.dictionary, keywords)
+    if args.document:
+        with open(args.document, 'w', encoding='utf-8') as f:
+            f.write(make_document(args.length, keywords, args.seed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""Benchmarks of flashtext on synthetic dictionaries and documents, saved as json.
+
+Every operation is timed `--repeat` times on inputs generated from `--seed`, see
+generate.py, and the fastest and median times are saved along with the python
+version and platform. Regular expressions are timed on the same inputs as a baseline.
+Compare two result files with compare.py.
+
+Usage:
+    python benchmark/suite.py --preset quick --output results.json
+    python benchmark/suite.py --dictionary-sizes 1000 100000 --document-lengths 100 1000000
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from flashtext import KeywordProcessor  # noqa: E402
+from generate import make_dictionary, make_document, write_dictionary  # noqa: E402
+
+PRESETS = {
+    'quick': ([1000, 10000], [100, 10000]),
+    'standard': ([1000, 10000, 100000, 1000000], [100, 10000, 1000000]),
+    'full': ([1000, 10000, 100000, 1000000, 10000000], [100, 10000, 1000000, 10000000]),
+}
+
+DOCUMENT_OPERATIONS = ['extract', 'extract_compiled', 'replace', 'fuzzy', 'regex_extract', 'regex_replace']
+DICTIONARY_OPERATIONS = ['add_keyword_from_file', 'get_all_keywords', 'remove_keywords_from_list']
+
+
+def timed(function, repeat, setup=None):
+    """Run `function` `repeat` times, `setup` before every run if given.
+
+    Returns:
+        times, result (tuple): seconds taken by every run, and what the last run returned.
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        result = function(argument) if setup is not None else function()
+        times.append(time.perf_counter() - start)
+    return times, result
+
+
+def regex_pattern(keywords):
+    """Alternation of the keywords between word boundaries, the longest ones first."""
+    alternatives = sorted((keyword for keyword, _ in keywords), key=len, reverse=True)
+    return re.compile(r'\b(?:{})\b'.format('|'.join(map(re.escape, alternatives))), re.IGNORECASE)
+
+
+def benchmark_documents(keyword_processor, keywords, document_length, args, record):
+    """Time the operations on a document of `document_length` characters."""
+    document = make_document(document_length, keywords, args.seed)
+    repeat = args.repeat
+
+    if 'extract' in args.operations:
+        times, result = timed(lambda: keyword_processor.extract_keywords(document), repeat)
+        record('extract', times, document_length=document_length, matches=len(result))
+    if 'replace' in args.operations:
+        times, _ = timed(lambda: keyword_processor.replace_keywords(document), repeat)
+        record('replace', times, document_length=document_length)
+    if 'fuzzy' in args.operations:
+        for max_cost in args.max_costs:
+            if document_length > args.fuzzy_max_length:
+                record('fuzzy', None, document_length=document_length, max_cost=max_cost,
+                       skipped='document longer than --fuzzy-max-length')
+                continue
+            # every run starts with an empty cache of fuzzy matches
+            times, result = timed(lambda _: keyword_processor.extract_keywords(document, max_cost=max_cost),
+                                  repeat, keyword_processor.fuzzy_cache.clear)
+            record('fuzzy', times, document_length=document_length, max_cost=max_cost, matches=len(result))
+    if 'extract_compiled' in args.operations:
+        keyword_processor.compile()
+        times, result = timed(lambda: keyword_processor.extract_keywords(document), repeat)
+        keyword_processor.automaton = None
+        record('extract_compiled', times, document_length=document_length, matches=len(result))
+
+    regex_operations = [name for name in ('regex_extract', 'regex_replace') if name in args.operations]
+    if regex_operations and len(keywords) > args.regex_max_keywords:
+        for name in regex_operations:
+            record(name, None, document_length=document_length, skipped='more keywords than --regex-max-keywords')
+    elif regex_operations:
+        pattern = regex_pattern(keywords)
+        clean_names = dict((keyword.lower(), clean_name) for keyword, clean_name in keywords)
+        if 'regex_extract' in args.operations:
+            times, result = timed(lambda: [clean_names[match.lower()] for match in pattern.findall(document)],
+                                  repeat)
+            record('regex_extract', times, document_length=document_length, matches=len(result))
+        if 'regex_replace' in args.operations:
+            times, _ = timed(lambda: pattern.sub(lambda match: clean_names[match.group(0).lower()], document),
+                             repeat)
+            record('regex_replace', times, document_length=document_length)
+
+
+def benchmark_dictionary(keywords, args, record):
+    """Time loading, listing and removing `keywords`."""
+    repeat = args.repeat
+    if 'add_keyword_from_file' in args.operations:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'keywords.txt')
+            write_dictionary(path, keywords)
+            times, _ = timed(lambda: KeywordProcessor().add_keyword_from_file(path), repeat)
+        record('add_keyword_from_file', times)
+    if 'get_all_keywords' in args.operations or 'remove_keywords_from_list' in args.operations:
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keywords_from_list([keyword for keyword, _ in keywords])
+        if 'get_all_keywords' in args.operations:
+            times, _ = timed(keyword_processor.get_all_keywords, repeat)
+            record('get_all_keywords', times)
+    if 'remove_keywords_from_list' in args.operations:
+        # a tenth of the keywords, removed from a new processor every time
+        removed = [keyword for keyword, _ in keywords[::10]]
+
+        def setup():
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_list([keyword for keyword, _ in keywords])
+            return keyword_processor
+
+        times, _ = timed(lambda keyword_processor: keyword_processor.remove_keywords_from_list(removed),
+                         repeat, setup)
+        record('remove_keywords_from_list', times, removed=len(removed))
+
+
+def flashtext_version():
+    try:
+        from importlib.metadata import version
+        return version('flashtext')
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='quick',
+                        help="dictionary sizes and document lengths, unless given")
+    parser.add_argument('--dictionary-sizes', type=int, nargs='+')
+    parser.add_argument('--document-lengths', type=int, nargs='+', help="in characters")
+    parser.add_argument('--operations', nargs='+', choices=DOCUMENT_OPERATIONS + DICTIONARY_OPERATIONS,
+                        default=DOCUMENT_OPERATIONS + DICTIONARY_OPERATIONS)
+    parser.add_argument('--max-costs', type=int, nargs='+', default=[1, 2, 3])
+    parser.add_argument('--fuzzy-max-length', type=int, default=100000,
+                        help="longest document fuzzy matching is timed on")
+    parser.add_argument('--regex-max-keywords', type=int, default=10000,
+                        help="largest dictionary the regex baseline is timed with")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json')
+    args = parser.parse_args()
+    dictionary_sizes, document_lengths = PRESETS[args.preset]
+    args.dictionary_sizes = args.dictionary_sizes or dictionary_sizes
+    args.document_lengths = args.document_lengths or document_lengths
+
+    results = []
+    for dictionary_size in args.dictionary_sizes:
+        keywords = make_dictionary(dictionary_size, args.seed)
+
+        def record(operation, times, **fields):
+            result = {'operation': operation, 'dictionary_size': dictionary_size}
+            result.update(fields)
+            if times is not None:
+                result.update({'repeat': len(times), 'min': min(times), 'median': statistics.median(times)})
+            results.append(result)
+            print(json.dumps(result))
+
+        benchmark_dictionary(keywords, args, record)
+        if any(operation in DOCUMENT_OPERATIONS for operation in args.operations):
+            keyword_processor = KeywordProcessor()
+            for keyword, clean_name in keywords:
+                keyword_processor.add_keyword(keyword, clean_name)
+            for document_length in args.document_lengths:
+                benchmark_documents(keyword_processor, keywords, document_length, args, record)
+
+    output = {
+        'meta': {
+            'flashtext': flashtext_version(),
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
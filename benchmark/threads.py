@@ -0,0 +1,56 @@
+"""Throughput of extract_keywords_threaded as the number of threads grows.
+
+All the threads share one KeywordProcessor. On a free-threaded build of Python
+(3.13t and later) the throughput should grow almost linearly with the number of
+threads, up to the number of cores; with the GIL it stays flat.
+
+Usage:
+    python benchmark/threads.py --keywords 100000 --sentences 20000 --threads 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from flashtext import KeywordProcessor  # noqa: E402
+from generate import make_dictionary, make_document  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--keywords', type=int, default=100000)
+    parser.add_argument('--sentences', type=int, default=20000)
+    parser.add_argument('--length', type=int, default=300, help="characters per sentence")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--compile', action='store_true', help="compile the keywords first")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    keywords = make_dictionary(args.keywords, args.seed)
+    keyword_processor = KeywordProcessor()
+    for keyword, clean_name in keywords:
+        keyword_processor.add_keyword(keyword, clean_name)
+    if args.compile:
+        keyword_processor.compile()
+    document = make_document(args.length * args.sentences, keywords, args.seed)
+    sentences = [document[start:start + args.length] for start in range(0, len(document), args.length)]
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('python {}, GIL {}, {} cpus'.format(sys.version.split()[0], 'enabled' if gil_enabled else 'disabled',
+                                               os.cpu_count()))
+    baseline = None
+    for threads in args.threads:
+        start = time.perf_counter()
+        for _ in keyword_processor.extract_keywords_threaded(sentences, threads=threads):
+            pass
+        elapsed = time.perf_counter() - start
+        rate = len(sentences) / elapsed
+        if baseline is None:
+            baseline = rate
+        print('{:>3} threads: {:>10.0f} sentences/s  x{:.2f}'.format(threads, rate, rate / baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+import asyncio
+import weakref
+
+# calls waiting for the next executor call, by event loop then by processor, executor and arguments
+_pending_calls = weakref.WeakKeyDictionary()
+
+# marks the end of the texts in aiter_keywords queues
+_END = object()
+
+
+def _extract_all(keyword_processor, sentences, span_info, max_cost):
+    return [keyword_processor.extract_keywords(sentence, span_info=span_info, max_cost=max_cost)
+            for sentence in sentences]
+
+
+def _extract_each(keyword_processor, sentences, span_info, max_cost):
+    """Keywords of every sentence, or the error extracting them raised, so that a call
+    does not fail for the sentence of another."""
+    results = []
+    for sentence in sentences:
+        try:
+            results.append((None, keyword_processor.extract_keywords(sentence, span_info=span_info,
+                                                                     max_cost=max_cost)))
+        except Exception as error:
+            results.append((error, None))
+    return results
+
+
+def _flush(loop, key):
+    """Extract the keywords of the calls waiting under `key` in a single executor call."""
+    calls = _pending_calls.get(loop, {}).pop(key, None)
+    if not calls:
+        return
+    keyword_processor, executor, span_info, max_cost = key
+    sentences = [sentence for sentence, _ in calls]
+    try:
+        results = loop.run_in_executor(executor, _extract_each, keyword_processor, sentences, span_info, max_cost)
+    except Exception as error:
+        # the executor was shut down, for instance: every call of the batch fails with it
+        for _, future in calls:
+            if not future.done():
+                future.set_exception(error)
+        return
+
+    def done(results):
+        for idx, (_, future) in enumerate(calls):
+            if future.done():
+                # the caller was cancelled
+                continue
+            if results.cancelled():
+                future.cancel()
+            elif results.exception() is not None:
+                future.set_exception(results.exception())
+            else:
+                error, keywords_extracted = results.result()[idx]
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(keywords_extracted)
+
+    results.add_done_callback(done)
+
+
+def aextract_keywords(keyword_processor, sentence, span_info=False, max_cost=0, executor=None, max_batch=64):
+    """Extract keywords from `sentence` in `executor`, without blocking the event loop.
+
+    Calls made during the same iteration of the event loop, for instance from many
+    tasks handling small messages, are grouped into a single executor call of up to
+    `max_batch` sentences, rather than handed over to the executor one by one.
+
+    Args:
+        keyword_processor (KeywordProcessor): Keywords to look for.
+        sentence (str): Line of text.
+        span_info (bool): Also return the span of every keyword.
+        max_cost (int): Maximum levensthein distance of the fuzzy matches.
+        executor (concurrent.futures.Executor): Executor to extract in, the default
+            executor of the event loop if None.
+        max_batch (int): Number of sentences extracted in one executor call at most.
+
+    Returns:
+        keywords_extracted (list): Result of extract_keywords, once awaited.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    key = (keyword_processor, executor, span_info, max_cost)
+    pending = _pending_calls.setdefault(loop, {})
+    calls = pending.get(key)
+    if calls is None:
+        calls = pending[key] = []
+        # every call made until the loop runs its callbacks joins this batch
+        loop.call_soon(_flush, loop, key)
+    calls.append((sentence, future))
+    if len(calls) >= max_batch:
+        _flush(loop, key)
+    return future
+
+
+async def _read_texts(texts, queue):
+    """Put the texts of `texts` in `queue`, then _END, or the error reading them raised."""
+    try:
+        if hasattr(texts, '__aiter__'):
+            async for text in texts:
+                await queue.put(text)
+        else:
+            for text in texts:
+                await queue.put(text)
+    except Exception as error:
+        await queue.put(error)
+        return
+    await queue.put(_END)
+
+
+async def _submit_batches(keyword_processor, texts_queue, batches, in_flight, span_info, max_cost, executor,
+                          batch_size):
+    """Group the texts already read into batches, and extract each batch in `executor`.
+
+    The futures of the batches are put in `batches`, followed by _END or the error
+    raised reading the texts or submitting a batch. A batch is only submitted once
+    `in_flight` is acquired.
+    """
+    loop = asyncio.get_running_loop()
+    end = None
+    while end is None:
+        text = await texts_queue.get()
+        chunk = []
+        while True:
+            if text is _END or isinstance(text, Exception):
+                end = text
+                break
+            chunk.append(text)
+            if len(chunk) >= batch_size or texts_queue.empty():
+                break
+            text = texts_queue.get_nowait()
+        if chunk:
+            await in_flight.acquire()
+            try:
+                batch = loop.run_in_executor(executor, _extract_all, keyword_processor, chunk, span_info, max_cost)
+            except Exception as error:
+                end = error
+                break
+            batches.put_nowait(batch)
+    batches.put_nowait(end)
+
+
+async def aiter_keywords(keyword_processor, texts, span_info=False, max_cost=0, executor=None, batch_size=64,
+                         max_pending=4):
+    """Extract keywords from a stream of texts in `executor`, without blocking the event loop.
+
+    Texts are read into a queue of at most `batch_size` * `max_pending` texts. The texts
+    waiting in the queue are extracted together in one executor call, up to `batch_size`
+    at a time, and at most `max_pending` calls are in flight or waiting to be consumed:
+    when keywords are not consumed as fast as texts come, reading the texts waits.
+
+    Args:
+        keyword_processor (KeywordProcessor): Keywords to look for.
+        texts (iterable(str)): Lines of text, an async iterable or a plain one.
+        span_info (bool): Also return the span of every keyword.
+        max_cost (int): Maximum levensthein distance of the fuzzy matches.
+        executor (concurrent.futures.Executor): Executor to extract in, the default
+            executor of the event loop if None.
+        batch_size (int): Number of texts extracted in one executor call at most.
+        max_pending (int): Number of executor calls in flight at most.
+
+    Yields:
+        keywords_extracted (list): Result of extract_keywords for every text, in order.
+
+    Raises:
+        ValueError: If `batch_size` or `max_pending` is less than 1.
+    """
+    if batch_size < 1 or max_pending < 1:
+        raise ValueError("batch_size and max_pending should be at least 1")
+    texts_queue = asyncio.Queue(batch_size * max_pending)
+    # executor calls whose keywords are not consumed yet
+    in_flight = asyncio.Semaphore(max_pending)
+    batches = asyncio.Queue()
+    tasks = [
+        asyncio.ensure_future(_read_texts(texts, texts_queue)),
+        asyncio.ensure_future(_submit_batches(keyword_processor, texts_queue, batches, in_flight, span_info,
+                                              max_cost, executor, batch_size)),
+    ]
+    try:
+        while True:
+            batch = await batches.get()
+            if batch is _END:
+                break
+            if isinstance(batch, Exception):
+                raise batch
+            for keywords_extracted in await batch:
+                yield keywords_extracted
+            in_flight.release()
+    finally:
+        for task in tasks:
+            task.cancel()
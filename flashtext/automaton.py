@@ -0,0 +1,461 @@
+import heapq
+from array import array
+
+from flashtext.characters import WordCharacters
+
+
+class KeywordAutomaton(object):
+    """Immutable, compiled form of a keyword trie.
+
+    The trie is stored as a double array: every character of the keywords is
+    given a small integer code, and the transition from `state` on a character
+    of code `code` leads to state ``base[state] + code`` if
+    ``check[base[state] + code] == state``. Following a transition costs the
+    same whatever the number of children of a state. `terminals[state]` is an
+    index into `clean_names`, or -1 if no keyword ends on that state. The root
+    is state 0, unused slots have a check of -1.
+
+    `build_failure_links()` adds Aho-Corasick failure and output links, which let
+    `iter_matches` scan a sentence in a single left to right pass.
+
+    Attributes:
+        alphabet (str): Characters of the keywords, the character of code `i` being ``alphabet[i - 1]``.
+            A list when the keys of the trie are not single characters, like for a TokenAutomaton.
+        codes (dict): Code of every character in `alphabet`.
+        base (array): Offset of the children of every state.
+        check (array): Parent state of every slot, -1 for unused slots.
+        terminals (array): Index in `clean_names` for every state, -1 when not terminal.
+        order (array): States in breadth first order.
+        clean_names (list): Interned clean names the terminals point to.
+        failure_links (tuple): ``(fail, outputs, depths)`` arrays once build_failure_links()
+            was called, None otherwise.
+
+    Examples:
+        >>> from flashtext import KeywordProcessor
+        >>> keyword_processor = KeywordProcessor()
+        >>> keyword_processor.add_keyword('Big Apple', 'New York')
+        >>> keyword_processor.compile()
+        >>> keyword_processor.extract_keywords('I love big apple.')
+        >>> # ['New York']
+    """
+
+    def __init__(self, alphabet, base, check, terminals, order, clean_names):
+        self.alphabet = alphabet
+        self.codes = dict((char, code) for code, char in enumerate(alphabet, 1))
+        self.base = base
+        self.check = check
+        self.terminals = terminals
+        self.order = order
+        self.clean_names = clean_names
+        self.failure_links = None
+        self._character_codes = None
+
+    @classmethod
+    def from_trie(cls, trie_dict, keyword='_keyword_'):
+        """Build the automaton from a trie of nested dicts.
+
+        Args:
+            trie_dict (dict): Root of the trie, as built by KeywordProcessor.
+            keyword (str): Key under which the clean names are stored in the trie.
+
+        Returns:
+            automaton (KeywordAutomaton): compiled copy of `trie_dict`.
+        """
+        # most frequent characters get the lowest codes, which keeps the arrays dense
+        nodes = [trie_dict]
+        char_counts = {}
+        for node in nodes:
+            for char in node:
+                if char != keyword:
+                    char_counts[char] = char_counts.get(char, 0) + 1
+                    nodes.append(node[char])
+        alphabet = sorted(char_counts, key=lambda char: (-char_counts[char], char))
+        if all(len(char) == 1 for char in alphabet):
+            alphabet = ''.join(alphabet)
+        codes = dict((char, code) for code, char in enumerate(alphabet, 1))
+
+        # place the children of the nodes with most children first, single children
+        # then fill the gaps left between them.
+        widths = array('i', (len(node) - (keyword in node) for node in nodes))
+        wide_nodes = [node_index for node_index, width in enumerate(widths) if width > 1]
+        wide_nodes.sort(key=widths.__getitem__, reverse=True)
+        offsets = array('i', [0]) * len(nodes)
+        occupied = bytearray(len(nodes) + len(alphabet) + 1)
+        occupied[0] = 1
+        next_free = 1
+        for node_index in wide_nodes:
+            child_codes = [codes[char] for char in nodes[node_index] if char != keyword]
+            lowest = min(child_codes)
+            highest = max(child_codes)
+            slot = next_free
+            trials = 0
+            while True:
+                offset = slot - lowest
+                if offset >= 0:
+                    if offset + highest >= len(occupied):
+                        occupied.extend(bytes(max(len(occupied), offset + highest + 1 - len(occupied))))
+                    if not any(occupied[offset + code] for code in child_codes):
+                        break
+                trials += 1
+                if trials == 16:
+                    # too crowded for the nodes with several children, search further next time
+                    next_free = slot
+                slot = occupied.find(0, slot + 1)
+                if slot < 0:
+                    slot = len(occupied)
+            offsets[node_index] = offset
+            for code in child_codes:
+                occupied[offset + code] = 1
+        next_free = occupied.find(0, 1)
+        for node_index, width in enumerate(widths):
+            if width != 1:
+                continue
+            for char in nodes[node_index]:
+                if char != keyword:
+                    code = codes[char]
+            slot = next_free if next_free >= code else occupied.find(0, code)
+            if slot < 0 or slot >= len(occupied):
+                slot = len(occupied)
+                occupied.extend(bytes(len(occupied)))
+            offsets[node_index] = slot - code
+            occupied[slot] = 1
+            if slot == next_free:
+                next_free = occupied.find(0, next_free)
+                if next_free < 0:
+                    next_free = len(occupied)
+                    occupied.extend(bytes(len(occupied)))
+        del occupied
+
+        # number the states breadth first, every node taking the slot given by its parent offset
+        size = max(offsets) + len(alphabet) + 1
+        base = array('i', [0]) * size
+        check = array('i', [-1]) * size
+        terminals = array('i', [-1]) * size
+        order = array('i', [0]) * len(nodes)
+        clean_names = []
+        clean_name_index = {}
+        next_node = 1
+        for node_index, node in enumerate(nodes):
+            state = order[node_index]
+            if keyword in node:
+                clean_name = node[keyword]
+                try:
+                    terminal = clean_name_index.get(clean_name)
+                except TypeError:
+                    # unhashable clean names are not interned
+                    terminal = None
+                if terminal is None:
+                    terminal = len(clean_names)
+                    clean_names.append(clean_name)
+                    try:
+                        clean_name_index[clean_name] = terminal
+                    except TypeError:
+                        pass
+                terminals[state] = terminal
+            offset = base[state] = offsets[node_index]
+            for char in node:
+                if char != keyword:
+                    check[offset + codes[char]] = state
+                    order[next_node] = offset + codes[char]
+                    next_node += 1
+        return cls(alphabet, base, check, terminals, order, clean_names)
+
+    def build_failure_links(self):
+        """Compute the Aho-Corasick failure and output links of the automaton.
+
+        `fail[state]` is the state of the longest proper suffix of the path to `state`
+        that is also a path from the root, `outputs[state]` the closest terminal state
+        on that failure chain (-1 if there is none) and `depths[state]` the length of
+        the path to `state`. The links are computed once, later calls are free.
+
+        Returns:
+            failure_links (tuple): ``(fail, outputs, depths)`` arrays.
+        """
+        if self.failure_links is not None:
+            return self.failure_links
+        base, check, terminals = self.base, self.check, self.terminals
+        size = len(check)
+        fail = array('i', [0]) * size
+        outputs = array('i', [-1]) * size
+        depths = array('i', [0]) * size
+        # the failure chain of a state only goes through states of lower depth,
+        # which come first in breadth first order.
+        for state in self.order[1:]:
+            parent = check[state]
+            depths[state] = depths[parent] + 1
+            if parent:
+                code = state - base[parent]
+                fail_state = fail[parent]
+                while True:
+                    child = base[fail_state] + code
+                    if check[child] == fail_state:
+                        fail[state] = child
+                        break
+                    if not fail_state:
+                        break
+                    fail_state = fail[fail_state]
+            fail_state = fail[state]
+            if terminals[fail_state] >= 0:
+                outputs[state] = fail_state
+            else:
+                outputs[state] = outputs[fail_state]
+        self.failure_links = (fail, outputs, depths)
+        return self.failure_links
+
+    def __len__(self):
+        """Number of states in the automaton"""
+        return len(self.order)
+
+    @property
+    def nbytes(self):
+        """Memory used by the transition and terminal tables, in bytes."""
+        tables = (self.base, self.check, self.terminals, self.order)
+        return sum(table.itemsize * len(table) for table in tables)
+
+    @property
+    def max_depth(self):
+        """Length of the longest path from the root, that is of the longest keyword."""
+        # the last state in breadth first order is one of the deepest
+        state = self.order[-1]
+        depth = 0
+        while state:
+            state = self.check[state]
+            depth += 1
+        return depth
+
+    def to_trie(self, keyword='_keyword_'):
+        """Rebuild the trie of nested dicts the automaton was compiled from.
+
+        Args:
+            keyword (str): Key under which the clean names are stored in the trie.
+
+        Returns:
+            trie_dict (dict): Root of the rebuilt trie.
+        """
+        alphabet, base, check, terminals = self.alphabet, self.base, self.check, self.terminals
+        nodes = {}
+        for state in self.order:
+            node = nodes[state] = {}
+            if terminals[state] >= 0:
+                node[keyword] = self.clean_names[terminals[state]]
+            if state:
+                parent = check[state]
+                nodes[parent][alphabet[state - base[parent] - 1]] = node
+        return nodes[0]
+
+    def get(self, word):
+        """Return the clean name mapped to `word`, or None if `word` is not a keyword.
+
+        Args:
+            word (str): keyword to look for, already folded if matching is case insensitive.
+        """
+        base, check = self.base, self.check
+        get_code = self.codes.get
+        state = 0
+        for char in word:
+            child = base[state] + get_code(char, 0)
+            if check[child] != state:
+                return None
+            state = child
+        terminal = self.terminals[state]
+        if terminal < 0:
+            return None
+        return self.clean_names[terminal]
+
+    def character_codes(self, word_chars, fold=None):
+        """Table giving the code of every character of a sentence, see CharacterCodes.
+
+        The table built for the last `word_chars` and `fold` is kept, so that it is
+        filled across calls.
+
+        Args:
+            word_chars (WordCharacters): Whether a character is part of a word. A set of
+                word characters is accepted as well.
+            fold (dict): Character each character of the sentence is matched as, for
+                instance its lowercase form. Characters are matched as they are if None.
+
+        Returns:
+            char_codes (CharacterCodes): code of every character.
+        """
+        if not isinstance(word_chars, WordCharacters):
+            word_chars = WordCharacters(word_chars)
+        char_codes = self._character_codes
+        if char_codes is None or char_codes.word_chars is not word_chars or char_codes.fold is not fold:
+            char_codes = self._character_codes = CharacterCodes(self.codes, word_chars, fold)
+        return char_codes
+
+    def iter_matches(self, sentence, word_chars, overlapping=False, fold=None):
+        """Scan `sentence` for the longest, non overlapping keywords.
+
+        A keyword is matched when it starts at the beginning of the sentence or
+        right after a word boundary, and ends at the end of the sentence or right
+        before a word boundary. This gives the same matches as
+        KeywordProcessor.extract_keywords on the uncompiled trie.
+
+        If the failure links were built, the sentence is scanned by
+        `iter_matches_aho_corasick` in a single pass, otherwise every position where
+        a keyword may start is looked ahead from.
+
+        Args:
+            sentence (str): Line of text.
+            word_chars (WordCharacters): Whether a character is part of a word. A set of
+                word characters is accepted as well.
+            overlapping (bool): Report every keyword found, including the ones overlapping
+                a longer keyword. Builds the failure links if needed.
+            fold (dict): Character each character of the sentence is matched as, for
+                instance its lowercase form. Characters are matched as they are if None.
+
+        Yields:
+            clean_name, start, end (tuple): clean name and span of every keyword found.
+        """
+        char_codes = self.character_codes(word_chars, fold)
+        if overlapping or self.failure_links is not None:
+            return self.iter_matches_aho_corasick(sentence, char_codes, overlapping)
+        return self._iter_matches_lookahead(sentence, char_codes)
+
+    def iter_matches_aho_corasick(self, sentence, char_codes, overlapping=False):
+        """Scan `sentence` for keywords following the failure links.
+
+        Every character is read exactly once. Keywords ending on a position are found
+        through the output links and kept as candidates until no keyword still being
+        matched can start before them, so the longest, leftmost candidate is yielded
+        without going back in the sentence.
+
+        Args:
+            sentence (str): Line of text.
+            char_codes (CharacterCodes): Code of every character, from character_codes().
+            overlapping (bool): Yield every keyword found, ordered by end position,
+                instead of the longest non overlapping ones.
+
+        Yields:
+            clean_name, start, end (tuple): clean name and span of every keyword found.
+        """
+        fail, outputs, depths = self.build_failure_links()
+        base, check, terminals = self.base, self.check, self.terminals
+        clean_names = self.clean_names
+        sentence_len = len(sentence)
+        # heap of (start, -end, terminal), the leftmost longest first; candidates starting
+        # before next_start are overlapped by a keyword yielded, and dropped once on top
+        candidates = []
+        next_start = 0
+        state = 0
+        code = 0
+        for idx in range(sentence_len + 1):
+            if idx < sentence_len:
+                code = char_codes[sentence[idx]]
+            if idx == sentence_len or code < 0:
+                # keywords ending here end on a word boundary
+                terminal_state = state if terminals[state] >= 0 else outputs[state]
+                while terminal_state >= 0:
+                    start = idx - depths[terminal_state]
+                    if start >= next_start and (start == 0 or char_codes[sentence[start - 1]] < 0):
+                        if overlapping:
+                            yield clean_names[terminals[terminal_state]], start, idx
+                        else:
+                            heapq.heappush(candidates, (start, -idx, terminals[terminal_state]))
+                    terminal_state = outputs[terminal_state]
+                if idx == sentence_len:
+                    break
+                code = -1 - code
+            while True:
+                child = base[state] + code
+                if check[child] == state:
+                    state = child
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            # keywords still being matched can not start before horizon
+            horizon = idx + 1 - depths[state]
+            while candidates:
+                start, neg_end, terminal = candidates[0]
+                if start < next_start:
+                    heapq.heappop(candidates)
+                    continue
+                if start >= horizon:
+                    break
+                heapq.heappop(candidates)
+                yield clean_names[terminal], start, -neg_end
+                # the boundary following the keyword is consumed with it
+                next_start = 1 - neg_end
+        while candidates:
+            start, neg_end, terminal = heapq.heappop(candidates)
+            if start >= next_start:
+                yield clean_names[terminal], start, -neg_end
+                next_start = 1 - neg_end
+
+    def _iter_matches_lookahead(self, sentence, char_codes):
+        base, check, terminals = self.base, self.check, self.terminals
+        clean_names = self.clean_names
+        sentence_len = len(sentence)
+        idx = 0
+        while idx < sentence_len:
+            # idx is a position where a keyword may start
+            state = 0
+            longest = -1
+            sequence_end_pos = idx
+            boundary_pos = -1
+            idy = idx
+            while idy < sentence_len:
+                code = char_codes[sentence[idy]]
+                if code < 0:
+                    if boundary_pos < 0:
+                        boundary_pos = idy
+                    if terminals[state] >= 0:
+                        # a keyword ends right before a word boundary
+                        longest = terminals[state]
+                        sequence_end_pos = idy
+                    code = -1 - code
+                child = base[state] + code
+                if check[child] != state:
+                    break
+                state = child
+                idy += 1
+            else:
+                # end of sentence reached.
+                if terminals[state] >= 0:
+                    longest = terminals[state]
+                    sequence_end_pos = sentence_len
+            if longest >= 0:
+                yield clean_names[longest], idx, sequence_end_pos
+                # the boundary following the keyword is consumed with it
+                idx = sequence_end_pos + 1
+            elif boundary_pos >= 0:
+                # next keyword can only start after the next word boundary
+                idx = boundary_pos + 1
+            else:
+                # jump to the start of the next word
+                idx = idy
+                while idx < sentence_len and char_codes[sentence[idx]] >= 0:
+                    idx += 1
+                idx += 1
+
+
+class CharacterCodes(dict):
+    """Code of every character of a sentence, filled as characters are looked up.
+
+    A single lookup tells both how to move in the automaton and whether the character
+    is a word boundary: word characters get the code of their folded form in the
+    alphabet of the automaton (0 if no keyword uses it), word boundaries get
+    ``-1 - code``.
+
+    Args:
+        codes (dict): Code of every character in the alphabet of the automaton.
+        word_chars (WordCharacters): Whether a folded character is part of a word.
+        fold (dict): Character each character of the sentence is matched as, None to
+            match characters as they are.
+    """
+
+    def __init__(self, codes, word_chars, fold=None):
+        super(CharacterCodes, self).__init__()
+        self.codes = codes
+        self.word_chars = word_chars
+        self.fold = fold
+
+    def __missing__(self, char):
+        folded = char if self.fold is None else self.fold[char]
+        code = self.codes.get(folded, 0)
+        if not self.word_chars[folded]:
+            code = -1 - code
+        self[char] = code
+        return code
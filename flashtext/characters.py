@@ -0,0 +1,69 @@
+class CharacterFold(dict):
+    """Character every character of a sentence is matched as, filled as characters are looked up.
+
+    With `lowercase`, characters are matched as their lowercase form, unless it is longer
+    than one character (like for 'İ'). Folding never changes the length of a string, so
+    spans found while matching folded characters index the original sentence.
+
+    Args:
+        lowercase (bool): Match characters as their lowercase form, otherwise as they are.
+
+    Examples:
+        >>> fold = CharacterFold()
+        >>> fold['A']
+        >>> 'a'
+        >>> fold.fold('Big Apple')
+        >>> 'big apple'
+    """
+
+    def __init__(self, lowercase=True):
+        super(CharacterFold, self).__init__()
+        self.lowercase = lowercase
+
+    def __missing__(self, char):
+        folded = char.lower() if self.lowercase else char
+        if len(folded) != 1:
+            folded = char
+        self[char] = folded
+        return folded
+
+    def fold(self, text):
+        """Fold every character of `text`."""
+        return ''.join([self[char] for char in text])
+
+
+class WordCharacters(dict):
+    """Whether a character is part of a word, filled as characters are looked up.
+
+    Any other character is a word boundary: keywords have to start and end next to one.
+
+    Args:
+        non_word_boundaries (set(str)): Characters that are part of a word.
+        unicode_words (bool): Also count every letter, digit or underscore as part of a
+            word, whatever its script, like the ``\\w`` of regular expressions.
+
+    Examples:
+        >>> word_chars = WordCharacters(set('abc'), unicode_words=True)
+        >>> word_chars['a'], word_chars['é'], word_chars['中'], word_chars[' ']
+        >>> (True, True, True, False)
+    """
+
+    def __init__(self, non_word_boundaries, unicode_words=False):
+        super(WordCharacters, self).__init__()
+        self.non_word_boundaries = frozenset(non_word_boundaries)
+        self.unicode_words = unicode_words
+
+    def __missing__(self, char):
+        is_word_char = char in self.non_word_boundaries or (
+            self.unicode_words and (char.isalnum() or char == '_'))
+        self[char] = is_word_char
+        return is_word_char
+
+    def describes(self, non_word_boundaries, unicode_words):
+        """True if the table was built for these settings, and can be used for them."""
+        return self.unicode_words == unicode_words and self.non_word_boundaries == non_word_boundaries
+
+
+# shared by all keyword processors, the tables only depend on the characters
+lowercase_fold = CharacterFold()
+unchanged_fold = CharacterFold(lowercase=False)
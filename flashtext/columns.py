@@ -0,0 +1,91 @@
+from array import array
+from itertools import chain, repeat
+
+# rows converted to str at once: the conversion runs in pyarrow or numpy, and only
+# this many rows are held as python strings at a time
+BLOCK_SIZE = 4096
+
+
+def _is_arrow_string(pyarrow, data_type):
+    is_string_view = getattr(pyarrow.types, 'is_string_view', None)
+    return (pyarrow.types.is_string(data_type) or pyarrow.types.is_large_string(data_type)
+            or (is_string_view is not None and is_string_view(data_type)))
+
+
+def _arrow_texts(pyarrow, column):
+    """(row, text) of the rows of a pyarrow Array or ChunkedArray of strings that are not null."""
+    if not _is_arrow_string(pyarrow, column.type):
+        raise TypeError("expected an array of strings, got {}".format(column.type))
+    chunks = column.chunks if isinstance(column, pyarrow.ChunkedArray) else [column]
+    row_offset = 0
+    for chunk in chunks:
+        for block_start in range(0, len(chunk), BLOCK_SIZE):
+            texts = chunk.slice(block_start, BLOCK_SIZE).to_pylist()
+            for row, text in enumerate(texts, row_offset + block_start):
+                if text:
+                    yield row, text
+        row_offset += len(chunk)
+
+
+def _numpy_texts(column):
+    """(row, text) of the rows of a numpy unicode or object array that are strings."""
+    if column.ndim != 1:
+        raise ValueError("expected a 1-dimensional array, got {} dimensions".format(column.ndim))
+    if column.dtype.kind not in 'UO':
+        raise TypeError("expected a unicode or object array, got {}".format(column.dtype))
+    for block_start in range(0, len(column), BLOCK_SIZE):
+        texts = column[block_start:block_start + BLOCK_SIZE].tolist()
+        for row, text in enumerate(texts, block_start):
+            # missing values of pandas columns are None or nan
+            if text and isinstance(text, str):
+                yield row, text
+
+
+def iter_column_texts(column):
+    """(row, text) of the rows of `column` that hold some text.
+
+    Rows are converted to python strings a block at a time. pyarrow is imported
+    when a column of its own is given, neither pyarrow nor numpy is needed otherwise.
+
+    Args:
+        column: pyarrow StringArray, LargeStringArray or ChunkedArray of them, or
+            1-dimensional numpy array of unicode strings or of objects.
+
+    Yields:
+        row, text (tuple): index of the row in the column and its text, for every row that
+            is not null, missing or empty.
+
+    Raises:
+        TypeError: If `column` is not an array of strings.
+    """
+    module = type(column).__module__.split('.')[0]
+    if module == 'pyarrow':
+        import pyarrow
+        return _arrow_texts(pyarrow, column)
+    if module == 'numpy':
+        return _numpy_texts(column)
+    raise TypeError("expected a pyarrow or numpy array, got {}".format(type(column).__name__))
+
+
+def extract_column(keyword_processor, column, max_cost=0):
+    """Keywords found in every row of a column of strings, as columns.
+
+    Args:
+        keyword_processor (KeywordProcessor): Keywords to look for, with keyword_ids.
+        column: Array of strings, see `iter_column_texts`.
+        max_cost (int): maximum levensthein distance to accept when extracting keywords.
+
+    Returns:
+        rows, starts, ends, keyword_ids (tuple(array)): array('i') of the row, the start and
+            end in the row and the id of every keyword found, in row order.
+    """
+    rows = array('i')
+    # id, start and end of every match, one after the other
+    matches = array('i')
+    iter_matches = keyword_processor._iter_matches
+    for row, text in iter_column_texts(column):
+        found = len(matches)
+        matches.extend(chain.from_iterable(iter_matches(text, max_cost)))
+        if len(matches) > found:
+            rows.extend(repeat(row, (len(matches) - found) // 3))
+    return rows, matches[1::3], matches[2::3], matches[0::3]
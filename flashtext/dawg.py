@@ -0,0 +1,84 @@
+import sys
+
+
+def _payload_key(clean_name):
+    """Hashable stand-in for a clean name, equal only for clean names that are equal."""
+    try:
+        hash(clean_name)
+    except TypeError:
+        return id(clean_name)
+    return type(clean_name), clean_name
+
+
+def minimize_trie(trie_dict, keyword='_keyword_'):
+    """Merge the equivalent subtrees of a trie of nested dicts, in place.
+
+    Two nodes are equivalent if they map the same characters to equivalent children,
+    in the same order, and hold the same clean name if any. Nodes are visited children
+    first, and every node is replaced in its parent by the first equivalent node seen:
+    the trie becomes a minimal acyclic automaton, a DAWG, where the suffixes shared by
+    many keywords, like inflections or the last words of phrases, are stored once.
+    Keywords and clean names are unchanged, and so is the order in which children
+    are walked.
+
+    Nodes can then be reached by several paths, changing one changes every keyword
+    going through it.
+
+    Args:
+        trie_dict (dict): Root of the trie, as built by KeywordProcessor.
+        keyword (str): Key under which the clean names are stored in the trie.
+
+    Returns:
+        trie_dict (dict): the root of the trie, merged in place.
+    """
+    registry = {}
+    # equivalent node of every node visited, by id; visited keeps the merged nodes alive
+    canonical = {}
+    visited = []
+    stack = [(trie_dict, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if id(node) in canonical:
+            continue
+        if not children_done:
+            stack.append((node, True))
+            for char, child in node.items():
+                if char != keyword and id(child) not in canonical:
+                    stack.append((child, False))
+            continue
+        signature = []
+        for char, child in node.items():
+            if char == keyword:
+                signature.append((char, _payload_key(child)))
+            else:
+                child = node[char] = canonical[id(child)]
+                signature.append((char, id(child)))
+        canonical[id(node)] = registry.setdefault(tuple(signature), node)
+        visited.append(node)
+    return trie_dict
+
+
+def trie_size(trie_dict, keyword='_keyword_'):
+    """Number of distinct nodes of a trie and the memory they use.
+
+    Nodes reached by several paths are counted once. The memory is the size of the
+    dicts themselves, the characters and clean names they hold are not counted.
+
+    Args:
+        trie_dict (dict): Root of the trie.
+        keyword (str): Key under which the clean names are stored in the trie.
+
+    Returns:
+        nodes, nbytes (tuple): Number of nodes, and their size in bytes.
+    """
+    seen = {id(trie_dict)}
+    nbytes = 0
+    stack = [trie_dict]
+    while stack:
+        node = stack.pop()
+        nbytes += sys.getsizeof(node)
+        for char, child in node.items():
+            if char != keyword and id(child) not in seen:
+                seen.add(id(child))
+                stack.append(child)
+    return len(seen), nbytes
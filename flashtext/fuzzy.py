@@ -0,0 +1,374 @@
+import collections
+import threading
+from operator import itemgetter
+
+
+def _deletions(term, count):
+    """Every string left once at most `count` characters are deleted from `term`."""
+    variants = {term}
+    frontier = {term}
+    for _ in range(count):
+        frontier = {variant[:idx] + variant[idx + 1:] for variant in frontier for idx in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+def _distance(word, term):
+    """Levenshtein distance between `word` and `term`."""
+    rows = range(len(word) + 1)
+    for char in term:
+        new_rows = [rows[0] + 1]
+        for col in range(1, len(rows)):
+            new_rows.append(min(new_rows[col - 1] + 1, rows[col] + 1,
+                                rows[col - 1] + (word[col - 1] != char)))
+        rows = new_rows
+    return rows[-1]
+
+
+class TrieWalkMatcher(object):
+    """Finds the fuzzy matches of a word by walking the keyword trie.
+
+    Every node visited gets a row of the levenshtein table of the word against the
+    characters leading to it, computed from the row of its parent. A node where a word
+    ends (it holds a keyword, or is followed by a word boundary) matches if the word is
+    at most `max_cost` edits away, and its children are then not visited. Nodes whose
+    every prefix of the word is too far away are skipped with their children.
+
+    Args:
+        trie_dict (dict): Root of the trie, as built by KeywordProcessor.
+        keyword (str): Key under which the clean names are stored in the trie.
+        stop_chars (set(str)): Characters ending a word in the trie.
+
+    Examples:
+        >>> matcher = TrieWalkMatcher(keyword_processor.keyword_trie_dict, '_keyword_', {' '})
+        >>> next(matcher.search('Maria', max_cost=1))
+        >>> ({'_keyword_': 'Mary'}, 1, 5)
+    """
+
+    def __init__(self, trie_dict, keyword='_keyword_', stop_chars=()):
+        self.trie_dict = trie_dict
+        self.keyword = keyword
+        self.stop_keys = frozenset(stop_chars) | {keyword}
+
+    def search(self, word, max_cost, start_node=None):
+        """Nodes where a word at most `max_cost` edits away from `word` ends.
+
+        Args:
+            word (str): word to find a fuzzy match for
+            max_cost (int): maximum levenshtein distance when performing the fuzzy match
+            start_node (dict): Trie node from which the search is performed, the root if None
+
+        Yields:
+            node, cost, depth (tuple): the node, the distance of `word` to the characters
+                leading to it, and its depth below `start_node`. Nodes come in the order
+                of a depth first walk of the trie.
+        """
+        start_node = start_node or self.trie_dict
+        stop_keys = self.stop_keys
+        stack = [(iter(start_node.items()), range(len(word) + 1), 1)]
+        while stack:
+            items, rows, depth = stack[-1]
+            for char, node in items:
+                if not isinstance(node, dict):
+                    # a clean name
+                    continue
+                cost = rows[0] + 1
+                new_rows = [cost]
+                for word_char, diagonal, above in zip(word, rows, rows[1:]):
+                    # replace, delete, insert
+                    cost = diagonal if word_char == char else diagonal + 1
+                    if above + 1 < cost:
+                        cost = above + 1
+                    if new_rows[-1] + 1 < cost:
+                        cost = new_rows[-1] + 1
+                    new_rows.append(cost)
+                if cost <= max_cost and not stop_keys.isdisjoint(node):
+                    yield node, cost if word else 0, depth
+                elif min(new_rows) <= max_cost:
+                    stack.append((iter(node.items()), new_rows, depth + 1))
+                    break
+            else:
+                stack.pop()
+
+    def best_match(self, word, max_cost, start_node=None, stats=None):
+        """Match with the lowest cost, the first one in the trie if there are several.
+
+        The lowest value of the row of a node is a lower bound of the cost of any match
+        below it. Nodes are visited by increasing bound: the trie is walked depth first
+        through the nodes of bound 0, nodes of a higher bound being put aside in the
+        bucket of their bound, then from the nodes of bound 1, and so on. The search stops
+        at the first bound with a match, so branches more expensive than the best match
+        are never walked. Unlike `search`, the children of a node that matches are visited too.
+
+        Args:
+            word (str): word to find a fuzzy match for
+            max_cost (int): maximum levenshtein distance when performing the fuzzy match
+            start_node (dict): Trie node from which the search is performed, the root if None
+            stats (dict): Counters the number of rows of the levenshtein table computed
+                is added to, under 'dp_rows'
+
+        Returns:
+            match (tuple): node, cost and depth of the match, None if there is none.
+        """
+        start_node = start_node or self.trie_dict
+        stop_keys = self.stop_keys
+        rows_computed = 0
+        # nodes to walk from and first match found, for every cost, with their order in the trie
+        buckets = [[] for _ in range(max_cost + 1)]
+        buckets[0].append(((), start_node, range(len(word) + 1), 0))
+        matches = [None] * (max_cost + 1)
+        for bound, bucket in enumerate(buckets):
+            # nodes of a bucket are not below one another, sorted they are walked in trie order
+            bucket.sort(key=itemgetter(0))
+            match = matches[bound]
+            for order, node, rows, depth in bucket:
+                if match is not None and match[0] < order:
+                    # found while walking cheaper nodes, and before every node left in the trie
+                    break
+                stack = [(order, enumerate(node.items()), rows, depth + 1)]
+                while stack:
+                    order, items, rows, depth = stack[-1]
+                    for child_index, (char, child) in items:
+                        if not isinstance(child, dict):
+                            # a clean name
+                            continue
+                        rows_computed += 1
+                        cost = rows[0] + 1
+                        new_rows = [cost]
+                        for word_char, diagonal, above in zip(word, rows, rows[1:]):
+                            # replace, delete, insert
+                            cost = diagonal if word_char == char else diagonal + 1
+                            if above + 1 < cost:
+                                cost = above + 1
+                            if new_rows[-1] + 1 < cost:
+                                cost = new_rows[-1] + 1
+                            new_rows.append(cost)
+                        child_bound = min(new_rows)
+                        if child_bound > max_cost:
+                            continue
+                        child_order = order + (child_index,)
+                        if cost <= max_cost and not stop_keys.isdisjoint(child):
+                            if matches[cost] is None or child_order < matches[cost][0]:
+                                matches[cost] = (child_order, child, depth)
+                            if cost == bound:
+                                # nothing left can be cheaper, or before it in the trie
+                                match = matches[cost]
+                                if stats is not None:
+                                    stats['dp_rows'] += rows_computed
+                                return match[1], bound if word else 0, match[2]
+                        if child_bound == bound:
+                            stack.append((child_order, enumerate(child.items()), new_rows, depth + 1))
+                            break
+                        buckets[child_bound].append((child_order, child, new_rows, depth))
+                    else:
+                        stack.pop()
+            if match is not None:
+                if stats is not None:
+                    stats['dp_rows'] += rows_computed
+                return match[1], bound if word else 0, match[2]
+        if stats is not None:
+            stats['dp_rows'] += rows_computed
+        return None
+
+
+class DeletionIndexMatcher(TrieWalkMatcher):
+    """Finds the fuzzy matches of a word with an index of deletions, like SymSpell does.
+
+    Every word of the trie, from the root to a node where a word ends, is indexed under
+    the strings left once up to `max_indexed_cost` of its characters are deleted. Two
+    strings at most k edits apart share such a string with k deletions at most on each
+    side, so a search from the root looks up the deletions of the searched word instead
+    of walking the trie, and only computes the distance to the words found.
+
+    Matches are the ones of TrieWalkMatcher, in the same order. Words with more word
+    boundaries than `max_indexed_cost` are not indexed, they are too far from any word
+    searched. Searches from another node than the root, for more than `max_indexed_cost`
+    edits, or for a word that is empty or has a word boundary walk the trie. The index
+    takes much more memory than the trie, and its size grows quickly with
+    `max_indexed_cost`: it is meant for large dictionaries searched with a small `max_cost`.
+
+    Args:
+        trie_dict (dict): Root of the trie, as built by KeywordProcessor.
+        keyword (str): Key under which the clean names are stored in the trie.
+        stop_chars (set(str)): Characters ending a word in the trie.
+        max_indexed_cost (int): Largest `max_cost` answered from the index.
+    """
+
+    def __init__(self, trie_dict, keyword='_keyword_', stop_chars=(), max_indexed_cost=1):
+        super(DeletionIndexMatcher, self).__init__(trie_dict, keyword, stop_chars)
+        self.max_indexed_cost = max_indexed_cost
+        # words of the trie in the order they are walked, with their nodes and the
+        # index of the closest word they continue
+        self.nodes = []
+        self.terms = []
+        self.parents = []
+        self.index = {}
+        stack = [(iter(trie_dict.items()), '', 0, -1)]
+        while stack:
+            items, term_so_far, stops_so_far, parent = stack[-1]
+            for char, node in items:
+                if not isinstance(node, dict):
+                    continue
+                term = term_so_far + char
+                child_parent = parent
+                if char in self.stop_keys:
+                    stops = stops_so_far + 1
+                    if stops > max_indexed_cost:
+                        # every word below is too far from a word without boundaries
+                        continue
+                else:
+                    stops = stops_so_far
+                if not self.stop_keys.isdisjoint(node):
+                    child_parent = len(self.nodes)
+                    for variant in _deletions(term, max_indexed_cost):
+                        self.index.setdefault(variant, []).append(child_parent)
+                    self.nodes.append(node)
+                    self.terms.append(term)
+                    self.parents.append(parent)
+                stack.append((iter(node.items()), term, stops, child_parent))
+                break
+            else:
+                stack.pop()
+
+    def search(self, word, max_cost, start_node=None):
+        start_node = start_node or self.trie_dict
+        if (start_node is not self.trie_dict or not word or max_cost > self.max_indexed_cost
+                or not self.stop_keys.isdisjoint(word)):
+            return super(DeletionIndexMatcher, self).search(word, max_cost, start_node)
+        return self._search_index(word, max_cost)
+
+    def best_match(self, word, max_cost, start_node=None, stats=None):
+        start_node = start_node or self.trie_dict
+        if (start_node is not self.trie_dict or not word or max_cost > self.max_indexed_cost
+                or not self.stop_keys.isdisjoint(word)):
+            return super(DeletionIndexMatcher, self).best_match(word, max_cost, start_node, stats)
+        best = None
+        for term_index in self._candidates(word, max_cost):
+            if stats is not None:
+                # a row for every character of the word of the trie
+                stats['dp_rows'] += len(self.terms[term_index])
+            cost = _distance(word, self.terms[term_index])
+            if cost <= max_cost and (best is None or cost < best[1]):
+                best = self.nodes[term_index], cost, len(self.terms[term_index])
+        return best
+
+    def _candidates(self, word, max_cost):
+        """Indexes of the words that may be at most `max_cost` edits away from `word`, in order."""
+        candidates = set()
+        for variant in _deletions(word, max_cost):
+            candidates.update(self.index.get(variant, ()))
+        return sorted(candidates)
+
+    def _search_index(self, word, max_cost):
+        matched = set()
+        for term_index in self._candidates(word, max_cost):
+            cost = _distance(word, self.terms[term_index])
+            if cost > max_cost:
+                continue
+            # the walk does not go past a word that matched
+            parent = self.parents[term_index]
+            while parent >= 0 and parent not in matched:
+                parent = self.parents[parent]
+            if parent >= 0:
+                continue
+            matched.add(term_index)
+            yield self.nodes[term_index], cost, len(self.terms[term_index])
+
+
+class FuzzyCache(object):
+    """Least recently used best matches of fuzzy searches.
+
+    The same misspelled words come back again and again in real text. The best match
+    of a search, which is what extracting and replacing keywords uses, is kept for
+    every word, trie node searched from and maximum cost, up to `maxsize` searches.
+    The cache empties itself when it is used with another matcher, which KeywordProcessor
+    builds again whenever keywords are added or removed. It can be shared by threads,
+    the entries are only read and changed under a lock, never held while searching.
+
+    Args:
+        maxsize (int): Number of searches kept, 0 to keep none.
+
+    Attributes:
+        hits (int): Number of searches answered from the cache.
+        misses (int): Number of searches run on the matcher.
+
+    Examples:
+        >>> keyword_processor.extract_keywords('I love Big Aple.', max_cost=1)
+        >>> keyword_processor.fuzzy_cache.hits, keyword_processor.fuzzy_cache.misses
+        >>> (0, 1)
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.matcher = None
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        # entries are keyed by node ids, that do not survive pickling
+        state = self.__dict__.copy()
+        state['_entries'] = collections.OrderedDict()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Forget every search, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def best_match(self, matcher, word, max_cost, start_node=None, stats=None):
+        """Match `matcher.best_match` returns, looked up in the cache first.
+
+        Args:
+            matcher (TrieWalkMatcher): Matcher to search with.
+            word (str): word to find a fuzzy match for
+            max_cost (int): maximum levenshtein distance when performing the fuzzy match
+            start_node (dict): Trie node from which the search is performed, the root if None
+            stats (dict): Counters of KeywordProcessor.stats to add the search to, if given
+
+        Returns:
+            match (tuple): node, cost and depth of the best match, None if there is none.
+        """
+        start_node = start_node or matcher.trie_dict
+        key = (word, id(start_node), max_cost)
+        with self._lock:
+            if matcher is not self.matcher:
+                self._entries.clear()
+                self.matcher = matcher
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is start_node:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                if stats is not None:
+                    stats['fuzzy_cache_hits'] += 1
+                return entry[1]
+            self.misses += 1
+        if stats is None:
+            match = matcher.best_match(word, max_cost, start_node)
+        else:
+            match = matcher.best_match(word, max_cost, start_node, stats)
+        if self.maxsize > 0:
+            with self._lock:
+                if matcher is self.matcher:
+                    self._entries[key] = (start_node, match)
+                    if len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+        return match
+
+
+# matchers KeywordProcessor can be asked for by name
+FUZZY_BACKENDS = {
+    'trie': TrieWalkMatcher,
+    'deletions': DeletionIndexMatcher,
+}
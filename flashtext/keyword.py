@@ -1,6 +1,31 @@
 import os
 import string
 import io
+import logging
+import threading
+import time
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from itertools import chain, islice
+from operator import itemgetter
+from flashtext import aio
+from flashtext.automaton import KeywordAutomaton
+from flashtext.columns import extract_column
+from flashtext.dawg import minimize_trie, trie_size
+from flashtext.characters import WordCharacters, lowercase_fold, unchanged_fold
+from flashtext.fuzzy import FUZZY_BACKENDS, FuzzyCache
+from flashtext.parallel import imap_processor, imap_threads
+from flashtext.snapshot import read_snapshot, write_snapshot
+from flashtext.tokens import TokenAutomaton
+
+# counters of `KeywordProcessor.stats`
+logger = logging.getLogger(__name__)
+
+STATS_KEYS = ('calls', 'characters_scanned', 'transitions', 'lookahead_discarded', 'levensthein_calls',
+              'fuzzy_cache_hits', 'dp_rows')
+# stats of a keyword processor can be added to by several threads
+_stats_lock = threading.Lock()
 
 
 class KeywordProcessor(object):
@@ -13,8 +38,16 @@ class KeywordProcessor(object):
             Defaults to set([A-Za-z0-9_])
         keyword_trie_dict (dict): Trie dict built character by character, that is used for lookup
             Defaults to empty dictionary
+        automaton (KeywordAutomaton): Compiled form of keyword_trie_dict, built by compile().
+            Defaults to None, cleared whenever keywords are added or removed
         case_sensitive (boolean): if the search algorithm should be case sensitive or not.
             Defaults to False
+        unicode_words (boolean): if letters, digits and underscores of every script are also
+            considered part of a word, along with non_word_boundaries. Defaults to False
+        observers (list(callable)): Called with the operation, input length, number of matches
+            and time taken of every extract_keywords and replace_keywords call, and with the
+            input too if they have a true `wants_text` attribute, see `_notify_observers`.
+            Defaults to an empty list
 
     Examples:
         >>> # import module
@@ -35,12 +68,37 @@ class KeywordProcessor(object):
         * Idea came from this `Stack Overflow Question <https://stackoverflow.com/questions/44178449/regex-replace-is-taking-time-for-millions-of-documents-how-to-make-it-faster>`_.
     """
 
-    def __init__(self, case_sensitive=False):
+    def __init__(self, case_sensitive=False, unicode_words=False, fuzzy_backend='trie', fuzzy_cache_size=4096,
+                 keyword_ids=False, copy_on_write=False, collect_stats=False):
         """
         Args:
             case_sensitive (boolean): Keyword search should be case sensitive set or not.
                 Defaults to False
+            unicode_words (boolean): Consider letters, digits and underscores of every script
+                as part of a word, so that accented or CJK words are not split. Defaults to False
+            fuzzy_backend (str): How fuzzy matches (max_cost > 0) are searched for: 'trie' walks
+                the trie, 'deletions' also indexes the deletions of every word when keywords are
+                compiled. Can also be a class taking the trie, the clean name key and the word
+                boundaries of the trie, see flashtext.fuzzy. Defaults to 'trie'
+            fuzzy_cache_size (int): Number of fuzzy searches whose result is kept in
+                `fuzzy_cache`, so misspellings seen before are not searched again. 0 disables
+                the cache. Defaults to 4096
+            keyword_ids (boolean): Map keywords to integer ids instead of clean names. Every
+                distinct clean name gets an id, its index in `clean_names`. add_keyword returns
+                the id, and keywords are extracted, counted and looked up as ids. Keywords are
+                still replaced by their clean name. Defaults to False
+            copy_on_write (boolean): Never change the trie dict in place, so that keywords can be
+                extracted from other threads while keywords are added or removed. Every change
+                builds a new version, see `batch_updates`. Defaults to False
+            collect_stats (boolean): Count what every search does in `stats` and `last_stats`,
+                to find out why some sentences are slow. Defaults to False
+
+        Raises:
+            ValueError: If `fuzzy_backend` is not a known backend name.
         """
+        if not callable(fuzzy_backend) and fuzzy_backend not in FUZZY_BACKENDS:
+            raise ValueError("unknown fuzzy backend {!r}, expected one of {}".format(
+                fuzzy_backend, ', '.join(sorted(FUZZY_BACKENDS))))
         self._keyword = '_keyword_'
         self._white_space_chars = set(['.', '\t', '\n', '\a', ' ', ','])
         try:
@@ -49,9 +107,60 @@ class KeywordProcessor(object):
         except AttributeError:
             # python 3.x
             self.non_word_boundaries = set(string.digits + string.ascii_letters + '_')
-        self.keyword_trie_dict = dict()
+        self._keyword_trie_dict = dict()
+        self.automaton = None
         self.case_sensitive = case_sensitive
+        self.unicode_words = unicode_words
+        # built from non_word_boundaries when they are first used
+        self._word_chars = None
         self._terms_in_trie = 0
+        self.fuzzy_backend = fuzzy_backend
+        # built from the trie when fuzzy matching first needs it
+        self._fuzzy_matcher = None
+        self.fuzzy_cache = FuzzyCache(fuzzy_cache_size)
+        self.keyword_ids = keyword_ids
+        # with keyword_ids, clean names by id and the id of every clean name
+        self.clean_names = []
+        self._clean_name_ids = {}
+        # True once the trie is minimized, its nodes can then be shared by several keywords
+        self._shared_nodes = False
+        self.copy_on_write = copy_on_write
+        # number of versions published by batch_updates
+        self.version = 0
+        # while updates are batched, root of the next version, the nodes only it holds by
+        # id, and the number of terms of the current version
+        self._pending_trie = None
+        self._fresh_nodes = None
+        self._published_terms = 0
+        # counters of every search and of the last one, None when not collected
+        self.stats = None
+        self.last_stats = None
+        if collect_stats:
+            self.reset_stats()
+        self.observers = []
+
+    def __getstate__(self):
+        # observers report to the process they were added in
+        state = self.__dict__.copy()
+        state['observers'] = []
+        return state
+
+    @property
+    def keyword_trie_dict(self):
+        """Trie dict built character by character, that is used for lookup.
+
+        If it was released by `compile(keep_trie=False)` it is rebuilt from the automaton.
+        """
+        if self._keyword_trie_dict is None:
+            self._keyword_trie_dict = self.automaton.to_trie(self._keyword)
+        return self._keyword_trie_dict
+
+    @keyword_trie_dict.setter
+    def keyword_trie_dict(self, value):
+        self._keyword_trie_dict = value
+        self._shared_nodes = False
+        self.automaton = None
+        self._fuzzy_matcher = None
 
     def __len__(self):
         """Number of terms present in the keyword_trie_dict
@@ -61,6 +170,8 @@ class KeywordProcessor(object):
                 Count of number of distinct terms in trie dictionary.
 
         """
+        if self._pending_trie is not None:
+            return self._published_terms
         return self._terms_in_trie
 
     def __contains__(self, word):
@@ -81,7 +192,10 @@ class KeywordProcessor(object):
 
         """
         if not self.case_sensitive:
-            word = word.lower()
+            word = lowercase_fold.fold(word)
+        automaton = self.automaton
+        if automaton is not None:
+            return automaton.get(word) is not None
         current_dict = self.keyword_trie_dict
         len_covered = 0
         for char in word:
@@ -109,7 +223,10 @@ class KeywordProcessor(object):
             >>> # New York
         """
         if not self.case_sensitive:
-            word = word.lower()
+            word = lowercase_fold.fold(word)
+        automaton = self.automaton
+        if automaton is not None:
+            return automaton.get(word)
         current_dict = self.keyword_trie_dict
         len_covered = 0
         for char in word:
@@ -136,22 +253,137 @@ class KeywordProcessor(object):
         Examples:
             >>> keyword_processor['Big Apple'] = 'New York'
         """
-        status = False
+        if self.copy_on_write and self._pending_trie is None:
+            with self.batch_updates():
+                return self.__setitem__(keyword, clean_name)
+        status = None if self.keyword_ids else False
         if not clean_name and keyword:
             clean_name = keyword
 
         if keyword and clean_name:
             if not self.case_sensitive:
-                keyword = keyword.lower()
-            current_dict = self.keyword_trie_dict
-            for letter in keyword:
-                current_dict = current_dict.setdefault(letter, {})
+                keyword = lowercase_fold.fold(keyword)
+            if self.keyword_ids:
+                clean_name = status = self._clean_name_id(clean_name)
+            if self._shared_nodes or self._pending_trie is not None:
+                current_dict = self._copy_path(keyword)
+            else:
+                current_dict = self.keyword_trie_dict
+                for letter in keyword:
+                    current_dict = current_dict.setdefault(letter, {})
             if self._keyword not in current_dict:
-                status = True
+                if not self.keyword_ids:
+                    status = True
                 self._terms_in_trie += 1
             current_dict[self._keyword] = clean_name
+            self._discard_compiled()
         return status
 
+    def _copy_path(self, keyword, create=True):
+        """Node of `keyword` in a minimized trie, the nodes on its path copied so that they
+        can be changed without changing the other keywords sharing them.
+
+        Args:
+            keyword (str): keyword, already folded if matching is case insensitive.
+            create (bool): Create the missing nodes, otherwise stop at the first one.
+
+        Returns:
+            current_dict (dict): node of `keyword`, None if it is missing and not created.
+        """
+        current_dict = self._trie_for_update()
+        fresh_nodes = self._fresh_nodes
+        for letter in keyword:
+            child = current_dict.get(letter)
+            if child is None:
+                if not create:
+                    return None
+                child = {}
+            elif fresh_nodes is not None and id(child) in fresh_nodes:
+                # already copied for the pending version
+                current_dict = child
+                continue
+            else:
+                child = dict(child)
+            if fresh_nodes is not None:
+                fresh_nodes[id(child)] = child
+            current_dict[letter] = child
+            current_dict = child
+        return current_dict
+
+    def _discard_compiled(self):
+        """Drop the compiled form and the fuzzy index, out of date once the trie changed.
+
+        While updates are batched they still match the current version, they are dropped
+        when the next version is published.
+        """
+        if self._pending_trie is None:
+            self.automaton = None
+            self._fuzzy_matcher = None
+
+    def _trie_for_update(self):
+        """Root of the trie changes are made to: the pending version while updates are
+        batched, the trie dict otherwise."""
+        if self._pending_trie is not None:
+            return self._pending_trie
+        return self.keyword_trie_dict
+
+    @contextmanager
+    def batch_updates(self):
+        """Make keyword changes in a new version of the trie, published all at once.
+
+        Within the block, keywords added or removed go to a copy of the trie, where only
+        the nodes on their path are copied. The nodes of the current version are never
+        changed: threads extracting keywords keep matching against the version they
+        started with, without any lock. When the block ends the new version replaces
+        the current one in a single assignment, and `version` is incremented. If the
+        block raises, the changes are dropped.
+
+        The compiled form is dropped when the version is published, call compile()
+        again to match the new version with it. Changes (adding, removing, compiling,
+        minimizing) are expected from one thread at a time. With `copy_on_write`, every
+        change made outside of a block is a version of its own.
+
+        Yields:
+            keyword_processor (KeywordProcessor): self
+
+        Examples:
+            >>> keyword_processor = KeywordProcessor(copy_on_write=True)
+            >>> with keyword_processor.batch_updates():
+            >>>     keyword_processor.add_keyword('Big Apple', 'New York')
+            >>>     keyword_processor.remove_keyword('NYC')
+            >>> keyword_processor.compile()
+        """
+        if self._pending_trie is not None:
+            # nested blocks are part of the outer batch
+            yield self
+            return
+        pending_trie = dict(self.keyword_trie_dict)
+        self._published_terms = self._terms_in_trie
+        self._fresh_nodes = {id(pending_trie): pending_trie}
+        self._pending_trie = pending_trie
+        try:
+            yield self
+        except BaseException:
+            self._terms_in_trie = self._published_terms
+            self._pending_trie = None
+            self._fresh_nodes = None
+            raise
+        self._pending_trie = None
+        self._fresh_nodes = None
+        # readers holding the previous version keep walking it
+        self.automaton = None
+        self._fuzzy_matcher = None
+        self._keyword_trie_dict = pending_trie
+        self.version += 1
+
+    def _clean_name_id(self, clean_name):
+        """Id of `clean_name` in `clean_names`, added to it if it is new."""
+        clean_name_id = self._clean_name_ids.get(clean_name)
+        if clean_name_id is None:
+            clean_name_id = self._clean_name_ids[clean_name] = len(self.clean_names)
+            self.clean_names.append(clean_name)
+        return clean_name_id
+
     def __delitem__(self, keyword):
         """To remove keyword from the dictionary
         pass the keyword and the clean name it maps to.
@@ -164,11 +396,16 @@ class KeywordProcessor(object):
             >>> keyword_processor.add_keyword('Big Apple')
             >>> del keyword_processor['Big Apple']
         """
+        if self.copy_on_write and self._pending_trie is None:
+            with self.batch_updates():
+                return self.__delitem__(keyword)
         status = False
         if keyword:
             if not self.case_sensitive:
-                keyword = keyword.lower()
-            current_dict = self.keyword_trie_dict
+                keyword = lowercase_fold.fold(keyword)
+            if self._shared_nodes or self._pending_trie is not None:
+                self._copy_path(keyword, create=False)
+            current_dict = self._trie_for_update()
             character_trie_list = []
             for letter in keyword:
                 if letter in current_dict:
@@ -195,6 +432,7 @@ class KeywordProcessor(object):
                 # successfully removed keyword
                 status = True
                 self._terms_in_trie -= 1
+                self._discard_compiled()
         return status
 
     def __iter__(self):
@@ -237,6 +475,7 @@ class KeywordProcessor(object):
         Returns:
             status : bool
                 The return value. True for success, False otherwise.
+                With keyword_ids, the id of the clean name, None if the keyword is empty.
 
         Examples:
             >>> keyword_processor.add_keyword('Big Apple', 'New York')
@@ -244,6 +483,9 @@ class KeywordProcessor(object):
             >>> # OR
             >>> keyword_processor.add_keyword('Big Apple')
             >>> # This case 'Big Apple' will return 'Big Apple'
+            >>> keyword_processor = KeywordProcessor(keyword_ids=True)
+            >>> keyword_processor.add_keyword('NYC', 'New York')
+            >>> 0
         """
         return self.__setitem__(keyword, clean_name)
 
@@ -311,6 +553,11 @@ class KeywordProcessor(object):
 
             >>> keyword_processor.add_keyword_from_file('keywords.txt')
 
+        Returns:
+            added, duplicates (tuple): Number of new keywords, and of keywords that were
+                given more than once or were already present, the last clean name given
+                winning.
+
         Raises:
             IOError: If `keyword_file` path is not valid
 
@@ -318,13 +565,76 @@ class KeywordProcessor(object):
         if not os.path.isfile(keyword_file):
             raise IOError("Invalid file path {}".format(keyword_file))
         with io.open(keyword_file, encoding=encoding) as f:
-            for line in f:
-                if '=>' in line:
-                    keyword, clean_name = line.split('=>')
-                    self.add_keyword(keyword, clean_name.strip())
-                else:
-                    keyword = line.strip()
-                    self.add_keyword(keyword)
+            return self._add_keywords_bulk(self._read_keyword_lines(f))
+
+    @staticmethod
+    def _read_keyword_lines(lines):
+        for line in lines:
+            if '=>' in line:
+                keyword, clean_name = line.split('=>')
+                yield keyword, clean_name.strip()
+            else:
+                yield line.strip(), None
+
+    def _add_keywords_bulk(self, keywords):
+        """Add many keywords to the trie at once.
+
+        Keywords are folded and deduplicated first, then inserted in the order they
+        come in, so the trie is the one add_keyword would build one keyword at a time.
+        What add_keyword does on every call, like discarding the compiled automaton
+        or updating the number of terms, is done once for all of them.
+
+        Args:
+            keywords (iterable(tuple)): (keyword, clean_name) pairs, the clean name
+                defaulting to the keyword when it is empty, as for add_keyword.
+
+        Returns:
+            added, duplicates (tuple): Number of new keywords, and of keywords that were
+                given more than once or were already present, the last clean name given
+                winning.
+        """
+        if self.copy_on_write and self._pending_trie is None:
+            with self.batch_updates():
+                return self._add_keywords_bulk(keywords)
+        clean_names = {}
+        count = 0
+        for keyword, clean_name in keywords:
+            if not keyword:
+                continue
+            if not clean_name:
+                clean_name = keyword
+            if not self.case_sensitive:
+                keyword = lowercase_fold.fold(keyword)
+            if self.keyword_ids:
+                clean_name = self._clean_name_id(clean_name)
+            clean_names[keyword] = clean_name
+            count += 1
+        keyword_trie_dict = self._trie_for_update()
+        copy_path = self._shared_nodes or self._pending_trie is not None
+        added = 0
+        for keyword, clean_name in clean_names.items():
+            if copy_path:
+                current_dict = self._copy_path(keyword)
+            else:
+                current_dict = keyword_trie_dict
+                depth = 0
+                for letter in keyword:
+                    next_dict = current_dict.get(letter)
+                    if next_dict is None:
+                        break
+                    current_dict = next_dict
+                    depth += 1
+                # the rest of the path is new
+                for letter in keyword[depth:]:
+                    next_dict = current_dict[letter] = {}
+                    current_dict = next_dict
+            if self._keyword not in current_dict:
+                added += 1
+            current_dict[self._keyword] = clean_name
+        self._terms_in_trie += added
+        if clean_names:
+            self._discard_compiled()
+        return added, count - added
 
     def add_keywords_from_dict(self, keyword_dict):
         """To add keywords from a dictionary
@@ -339,6 +649,11 @@ class KeywordProcessor(object):
                 }
             >>> keyword_processor.add_keywords_from_dict(keyword_dict)
 
+        Returns:
+            added, duplicates (tuple): Number of new keywords, and of keywords that were
+                given more than once or were already present, the last clean name given
+                winning.
+
         Raises:
             AttributeError: If value for a key in `keyword_dict` is not a list.
 
@@ -347,8 +662,9 @@ class KeywordProcessor(object):
             if not isinstance(keywords, list):
                 raise AttributeError("Value of key {} should be a list".format(clean_name))
 
-            for keyword in keywords:
-                self.add_keyword(keyword, clean_name)
+        return self._add_keywords_bulk((keyword, clean_name)
+                                       for clean_name, keywords in keyword_dict.items()
+                                       for keyword in keywords)
 
     def remove_keywords_from_dict(self, keyword_dict):
         """To remove keywords from a dictionary
@@ -380,6 +696,11 @@ class KeywordProcessor(object):
         Args:
             keyword_list (list(str)): List of keywords to add
 
+        Returns:
+            added, duplicates (tuple): Number of new keywords, and of keywords that were
+                given more than once or were already present, the last clean name given
+                winning.
+
         Examples:
             >>> keyword_processor.add_keywords_from_list(["java", "python"]})
         Raises:
@@ -389,8 +710,7 @@ class KeywordProcessor(object):
         if not isinstance(keyword_list, list):
             raise AttributeError("keyword_list should be a list")
 
-        for keyword in keyword_list:
-            self.add_keyword(keyword)
+        return self._add_keywords_bulk((keyword, None) for keyword in keyword_list)
 
     def remove_keywords_from_list(self, keyword_list):
         """To remove keywords present in list
@@ -447,17 +767,201 @@ class KeywordProcessor(object):
                     terms_present[key] = sub_values[key]
         return terms_present
 
-    def extract_keywords(self, sentence, span_info=False, max_cost=0):
+    def _character_tables(self):
+        """Tables giving the character every character of a sentence is matched as,
+        and whether a matched character is part of a word.
+
+        Returns:
+            fold, word_chars (tuple): CharacterFold and WordCharacters tables.
+        """
+        word_chars = self._word_chars
+        if word_chars is None or not word_chars.describes(self.non_word_boundaries, self.unicode_words):
+            word_chars = self._word_chars = WordCharacters(self.non_word_boundaries, self.unicode_words)
+        return (unchanged_fold if self.case_sensitive else lowercase_fold), word_chars
+
+    def compile(self, keep_trie=True, aho_corasick=False, tokens=False):
+        """Compile the keyword trie into an immutable KeywordAutomaton.
+
+        Once compiled, exact matching in extract_keywords and replace_keywords runs on
+        flat integer transition tables instead of nested dicts. Adding or removing a
+        keyword discards the compiled form, call compile() again afterwards.
+        Fuzzy matching (max_cost > 0) keeps using the trie dict, the index of the
+        'deletions' fuzzy backend is built along with the automaton.
+
+        Args:
+            keep_trie (bool): Keep the trie dict in memory. If False it is released and
+                rebuilt from the automaton the next time it is needed.
+                Defaults to True
+            aho_corasick (bool): Also build the Aho-Corasick failure links, so sentences
+                are matched in a single pass without looking ahead and back. Same
+                results, but the time spent on a sentence is linear in its length.
+                Defaults to False
+            tokens (bool): Compile into a TokenAutomaton instead, keyed by whole words and
+                word boundaries rather than characters. Same results, much smaller and
+                faster when most keywords are phrases of several words.
+                Defaults to False
+
+        Returns:
+            automaton (KeywordAutomaton): The compiled keywords.
+
+        Raises:
+            ValueError: If both `aho_corasick` and `tokens` are set, or `keep_trie` is False
+                with copy_on_write.
+
+        Examples:
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.compile(keep_trie=False)
+            >>> keyword_processor.extract_keywords('I love big apple.')
+            >>> # ['New York']
+        """
+        if not keep_trie and self.copy_on_write:
+            raise ValueError("the trie dict holds the current version with copy_on_write, it can not be released")
+        if tokens:
+            if aho_corasick:
+                raise ValueError("failure links can not be built on tokens")
+            fold, word_chars = self._character_tables()
+            automaton = TokenAutomaton.from_trie(self.keyword_trie_dict, word_chars, fold, self._keyword)
+        else:
+            automaton = KeywordAutomaton.from_trie(self.keyword_trie_dict, self._keyword)
+        if aho_corasick:
+            automaton.build_failure_links()
+        if keep_trie:
+            self._fuzzy_matcher_for_trie()
+        else:
+            self._keyword_trie_dict = None
+            self._shared_nodes = False
+            self._fuzzy_matcher = None
+        self.automaton = automaton
+        return automaton
+
+    def minimize(self):
+        """Merge the identical subtrees of the keyword trie dict.
+
+        The trie shares the prefixes of keywords, not their suffixes: every inflection
+        like "-ing" or "-ation", and every last word repeated across phrases, is stored
+        again under each keyword. Minimizing turns the trie into a DAWG, where equivalent
+        subtrees are stored once. Clean names are kept: suffixes are merged when they
+        lead to the same clean names, as when many keywords are tagged with a few
+        categories. Matching is unchanged.
+        Keywords added or removed afterwards copy the nodes on their own path first,
+        call minimize() again after many changes.
+
+        The compiled forms need a node per path and keep their size, minimizing saves
+        the memory of the trie kept along with them or used without compiling.
+
+        Returns:
+            sizes (dict): 'nodes_before', 'nodes_after', 'nbytes_before' and 'nbytes_after',
+                the number of dicts in the trie and the memory they use, in bytes.
+
+        Examples:
+            >>> keyword_processor.add_keywords_from_dict({'city': ['springfield', 'greenfield', 'mansfield']})
+            >>> keyword_processor.minimize()
+            >>> {'nodes_before': 31, 'nodes_after': 19, 'nbytes_before': 5704, 'nbytes_after': 3496}
+        """
+        trie_dict = self._trie_for_update()
+        nodes_before, nbytes_before = trie_size(trie_dict, self._keyword)
+        # nodes are only replaced by equivalent ones, readers of the current version
+        # find the same keywords
+        minimize_trie(trie_dict, self._keyword)
+        nodes_after, nbytes_after = trie_size(trie_dict, self._keyword)
+        self._shared_nodes = True
+        if self._pending_trie is not None:
+            # the copied nodes may now be shared with the current version
+            self._fresh_nodes = {id(trie_dict): trie_dict}
+        # the fuzzy index refers to the nodes that were merged
+        self._fuzzy_matcher = None
+        return {
+            'nodes_before': nodes_before,
+            'nodes_after': nodes_after,
+            'nbytes_before': nbytes_before,
+            'nbytes_after': nbytes_after,
+        }
+
+    def save(self, path):
+        """Save the compiled keywords to a binary snapshot file.
+
+        The snapshot holds the automaton, its clean names and the settings of the
+        keyword processor, see `load`. Keywords are compiled first if needed.
+
+        Args:
+            path (str): File to write
+
+        Examples:
+            >>> keyword_processor.add_keyword_from_file('keywords.txt')
+            >>> keyword_processor.save('keywords.flashtext')
+
+        Raises:
+            TypeError: If a clean name is not a string, unless keyword_ids are used.
+        """
+        automaton = self.automaton
+        if automaton is None:
+            automaton = self.compile()
+        elif not isinstance(automaton, KeywordAutomaton):
+            # snapshots hold the double array of characters
+            automaton = KeywordAutomaton.from_trie(self.keyword_trie_dict, self._keyword)
+        metadata = {
+            'case_sensitive': self.case_sensitive,
+            'non_word_boundaries': sorted(self.non_word_boundaries),
+            'unicode_words': self.unicode_words,
+            'terms_in_trie': self._terms_in_trie,
+        }
+        if self.keyword_ids:
+            metadata['keyword_ids'] = True
+            metadata['clean_names'] = self.clean_names
+        write_snapshot(path, automaton, metadata)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load a keyword processor saved with `save`.
+
+        With `mmap` the file is memory mapped and matched against in place: loading is
+        immediate whatever the number of keywords, and processes loading the same file
+        share its memory. The trie dict is only rebuilt if keywords are added or removed.
+
+        Args:
+            path (str): Snapshot file to read
+            mmap (bool): Memory map the file instead of reading it. Defaults to True
+
+        Returns:
+            keyword_processor (KeywordProcessor): compiled keyword processor
+
+        Examples:
+            >>> keyword_processor = KeywordProcessor.load('keywords.flashtext')
+            >>> keyword_processor.extract_keywords('I love Big Apple and Bay Area.')
+
+        Raises:
+            ValueError: If the file is not a snapshot or has an unsupported format version.
+        """
+        automaton, metadata = read_snapshot(path, mmap)
+        keyword_processor = cls(case_sensitive=metadata['case_sensitive'],
+                                unicode_words=metadata['unicode_words'],
+                                keyword_ids=metadata.get('keyword_ids', False))
+        keyword_processor.set_non_word_boundaries(set(metadata['non_word_boundaries']))
+        for clean_name in metadata.get('clean_names', ()):
+            keyword_processor._clean_name_id(clean_name)
+        keyword_processor._terms_in_trie = metadata['terms_in_trie']
+        keyword_processor._keyword_trie_dict = None
+        keyword_processor.automaton = automaton
+        return keyword_processor
+
+    def extract_keywords(self, sentence, span_info=False, max_cost=0, overlapping=False, as_array=False):
         """Searches in the string for all keywords present in corpus.
         Keywords present are added to a list `keywords_extracted` and returned.
 
         Args:
             sentence (str): Line of text where we will search for keywords
             span_info (bool): True if you need to span the boundaries where the extraction has been performed
-            max_cost (int): maximum levensthein distance to accept when extracting keywords
+            max_cost (int): maximum levensthein distance to accept when extracting keywords,
+                the closest keyword is extracted
+            overlapping (bool): True to also get the keywords overlapping a longer one, ordered by
+                their end position. Uses the Aho-Corasick links of the compiled automaton; without
+                one, an automaton is built for the call and dropped, call compile() to reuse it.
+            as_array (bool): With keyword_ids, return an array('i') of the ids instead of a list,
+                or of id, start and end one after the other with `span_info`.
 
         Returns:
-            keywords_extracted (list(str)): List of terms/keywords found in sentence that match our corpus
+            keywords_extracted (list(str)): List of terms/keywords found in sentence that match our corpus,
+                their ids with keyword_ids
 
         Examples:
             >>> from flashtext import KeywordProcessor
@@ -470,14 +974,128 @@ class KeywordProcessor(object):
             >>> keywords_found = keyword_processor.extract_keywords('I love Big Aple and Baay Area.', max_cost=1)
             >>> keywords_found
             >>> ['New York', 'Bay Area']
+            >>> keyword_processor.add_keyword('Big Apple Pie', 'Pie')
+            >>> keyword_processor.extract_keywords('I love Big Apple Pie.', overlapping=True)
+            >>> ['New York', 'Pie']
+            >>> keyword_processor = KeywordProcessor(keyword_ids=True)
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.add_keyword('NYC', 'New York')
+            >>> keyword_processor.extract_keywords('NYC, the Big Apple.', as_array=True)
+            >>> array('i', [0, 0])
+
+        Raises:
+            ValueError: If both `max_cost` and `overlapping` are set, or `as_array` is set
+                without keyword_ids.
         """
-        keywords_extracted = []
+        if not self.observers or not sentence:
+            return self._extract_keywords(sentence, span_info, max_cost, overlapping, as_array)
+        start = time.perf_counter_ns()
+        keywords_extracted = self._extract_keywords(sentence, span_info, max_cost, overlapping, as_array)
+        elapsed_ns = time.perf_counter_ns() - start
+        match_count = len(keywords_extracted) // 3 if as_array and span_info else len(keywords_extracted)
+        self._notify_observers('extract_keywords', sentence, match_count, elapsed_ns)
+        return keywords_extracted
+
+    def _extract_keywords(self, sentence, span_info=False, max_cost=0, overlapping=False, as_array=False):
+        """`extract_keywords`, without telling the `observers`."""
+        if overlapping and max_cost:
+            raise ValueError("overlapping keywords can not be extracted with max_cost")
+        if as_array and not self.keyword_ids:
+            raise ValueError("only keyword ids can be extracted as an array")
         if not sentence:
             # if sentence is empty or none just return empty list
+            return array('i') if as_array else []
+        if as_array:
+            matches = self._iter_matches(sentence, max_cost, overlapping)
+            if span_info:
+                return array('i', chain.from_iterable(matches))
+            return array('i', map(itemgetter(0), matches))
+        keywords_extracted = list(self._iter_matches(sentence, max_cost, overlapping))
+        if span_info:
             return keywords_extracted
-        if not self.case_sensitive:
-            sentence = sentence.lower()
-        current_dict = self.keyword_trie_dict
+        return [value[0] for value in keywords_extracted]
+
+    def _iter_matches(self, sentence, max_cost=0, overlapping=False):
+        """Keywords found in `sentence`, one at a time as soon as they are confirmed.
+
+        Uses the compiled automaton for exact matching, the trie otherwise. Overlapping
+        keywords need an automaton, one is built from the trie for this search only if
+        none was compiled, so that searching never changes the keyword processor.
+
+        Yields:
+            keyword (tuple): (clean_name, start, end) of every keyword found
+        """
+        fold, word_chars = self._character_tables()
+        # read once, another thread may publish a new version meanwhile
+        automaton = self.automaton
+        if overlapping and automaton is None:
+            automaton = KeywordAutomaton.from_trie(self.keyword_trie_dict, self._keyword)
+        if self.stats is not None:
+            return self._iter_matches_counted(sentence, max_cost, overlapping, fold, word_chars, automaton)
+        if automaton is not None and not max_cost:
+            return automaton.iter_matches(sentence, word_chars, overlapping, fold)
+        return self._iter_matches_trie(sentence, max_cost, fold, word_chars)
+
+    def _iter_matches_counted(self, sentence, max_cost, overlapping, fold, word_chars, automaton):
+        """`_iter_matches`, counting what the search does in `stats` once it is over."""
+        counters = dict.fromkeys(STATS_KEYS, 0)
+        counters['calls'] = 1
+        try:
+            if automaton is not None and not max_cost:
+                # the steps of the automaton are not counted
+                counters['characters_scanned'] = len(sentence)
+                yield from automaton.iter_matches(sentence, word_chars, overlapping, fold)
+            else:
+                yield from self._iter_matches_trie_counted(sentence, max_cost, fold, word_chars, counters)
+        finally:
+            self._record_stats(counters)
+
+    def reset_stats(self):
+        """Start counting what searches do from zero, see `stats`.
+
+        `stats` holds the counters of every search since, and `last_stats` the ones of
+        the last search, as plain dicts:
+
+        - calls: number of sentences searched
+        - characters_scanned: characters read, some of them several times
+        - transitions: steps from a trie node to its child
+        - lookahead_discarded: characters read looking for a longer keyword, and read again
+          once none was found
+        - levensthein_calls: fuzzy searches, answered from `fuzzy_cache` or not
+        - fuzzy_cache_hits: fuzzy searches answered from `fuzzy_cache`
+        - dp_rows: rows of the levenshtein tables computed by fuzzy searches
+
+        Searches with compiled keywords only count calls, and the length of the sentence as
+        characters scanned. Searches made in other processes, see `extract_keywords_batch`,
+        are not counted. Set `stats` to None to stop counting.
+
+        Examples:
+            >>> keyword_processor = KeywordProcessor(collect_stats=True)
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.add_keyword('Big Apple Pie', 'Pie')
+            >>> keyword_processor.extract_keywords('I love Big Apple Tart.')
+            >>> keyword_processor.last_stats['lookahead_discarded']
+            >>> 1
+        """
+        self.stats = dict.fromkeys(STATS_KEYS, 0)
+        self.last_stats = None
+
+    def _record_stats(self, counters):
+        """Add the `counters` of a search to `stats`."""
+        with _stats_lock:
+            stats = self.stats
+            if stats is None:
+                return
+            for key, value in counters.items():
+                stats[key] += value
+            self.last_stats = counters
+
+    def _iter_matches_trie(self, sentence, max_cost, fold, word_chars):
+        """Keywords found walking the trie dict, see `_iter_matches`."""
+        # read once: the scan runs on this version of the trie, and locals are faster
+        keyword_trie_dict = self.keyword_trie_dict
+        keyword = self._keyword
+        current_dict = keyword_trie_dict
         sequence_start_pos = 0
         sequence_end_pos = 0
         reset_current_dict = False
@@ -485,19 +1103,19 @@ class KeywordProcessor(object):
         sentence_len = len(sentence)
         curr_cost = max_cost
         while idx < sentence_len:
-            char = sentence[idx]
+            char = fold[sentence[idx]]
             # when we reach a character that might denote word end
-            if char not in self.non_word_boundaries:
+            if not word_chars[char]:
 
                 # if end is present in current_dict
-                if self._keyword in current_dict or char in current_dict:
+                if keyword in current_dict or char in current_dict:
                     # update longest sequence found
                     sequence_found = None
                     longest_sequence_found = None
                     is_longer_seq_found = False
-                    if self._keyword in current_dict:
-                        sequence_found = current_dict[self._keyword]
-                        longest_sequence_found = current_dict[self._keyword]
+                    if keyword in current_dict:
+                        sequence_found = current_dict[keyword]
+                        longest_sequence_found = current_dict[keyword]
                         sequence_end_pos = idx
 
                     # re look for longest_sequence from this position
@@ -506,19 +1124,18 @@ class KeywordProcessor(object):
 
                         idy = idx + 1
                         while idy < sentence_len:
-                            inner_char = sentence[idy]
-                            if inner_char not in self.non_word_boundaries and self._keyword in current_dict_continued:
+                            inner_char = fold[sentence[idy]]
+                            if not word_chars[inner_char] and keyword in current_dict_continued:
                                 # update longest sequence found
-                                longest_sequence_found = current_dict_continued[self._keyword]
+                                longest_sequence_found = current_dict_continued[keyword]
                                 sequence_end_pos = idy
                                 is_longer_seq_found = True
                             if inner_char in current_dict_continued:
                                 current_dict_continued = current_dict_continued[inner_char]
                             elif curr_cost > 0:
-                                next_word = self.get_next_word(sentence[idy:])
-                                current_dict_continued, cost, _ = next(
-                                    self.levensthein(next_word, max_cost=curr_cost, start_node=current_dict_continued),
-                                    ({}, 0, 0),
+                                next_word = fold.fold(self.get_next_word(sentence, idy))
+                                current_dict_continued, cost, _ = self._best_fuzzy_match(
+                                    next_word, curr_cost, current_dict_continued, ({}, 0, 0)
                                 ) # current_dict_continued to empty dict by default, so next iteration goes to a `break`
                                 curr_cost -= cost
                                 idy += len(next_word) - 1
@@ -529,67 +1146,211 @@ class KeywordProcessor(object):
                             idy += 1
                         else:
                             # end of sentence reached.
-                            if self._keyword in current_dict_continued:
+                            if keyword in current_dict_continued:
                                 # update longest sequence found
-                                longest_sequence_found = current_dict_continued[self._keyword]
+                                longest_sequence_found = current_dict_continued[keyword]
                                 sequence_end_pos = idy
                                 is_longer_seq_found = True
                         if is_longer_seq_found:
                             idx = sequence_end_pos
-                    current_dict = self.keyword_trie_dict
-                    if longest_sequence_found:
-                        keywords_extracted.append((longest_sequence_found, sequence_start_pos, idx))
+                    current_dict = keyword_trie_dict
+                    if longest_sequence_found is not None:
+                        yield longest_sequence_found, sequence_start_pos, idx
                         curr_cost = max_cost
                     reset_current_dict = True
                 else:
                     # we reset current_dict
-                    current_dict = self.keyword_trie_dict
+                    current_dict = keyword_trie_dict
                     reset_current_dict = True
             elif char in current_dict:
                 # we can continue from this char
                 current_dict = current_dict[char]
             elif curr_cost > 0:
-                next_word = self.get_next_word(sentence[idx:])
-                current_dict, cost, _ = next(
-                    self.levensthein(next_word, max_cost=curr_cost, start_node=current_dict),
-                    (self.keyword_trie_dict, 0, 0)
+                next_word = fold.fold(self.get_next_word(sentence, idx))
+                current_dict, cost, _ = self._best_fuzzy_match(
+                    next_word, curr_cost, current_dict, (keyword_trie_dict, 0, 0)
                 )
                 curr_cost -= cost
                 idx += len(next_word) - 1
             else:
                 # we reset current_dict
-                current_dict = self.keyword_trie_dict
+                current_dict = keyword_trie_dict
                 reset_current_dict = True
                 # skip to end of word
                 idy = idx + 1
                 while idy < sentence_len:
-                    char = sentence[idy]
-                    if char not in self.non_word_boundaries:
+                    char = fold[sentence[idy]]
+                    if not word_chars[char]:
                         break
                     idy += 1
                 idx = idy
             # if we are end of sentence and have a sequence discovered
             if idx + 1 >= sentence_len:
-                if self._keyword in current_dict:
-                    sequence_found = current_dict[self._keyword]
-                    keywords_extracted.append((sequence_found, sequence_start_pos, sentence_len))
+                if keyword in current_dict:
+                    sequence_found = current_dict[keyword]
+                    yield sequence_found, sequence_start_pos, sentence_len
             idx += 1
             if reset_current_dict:
                 reset_current_dict = False
                 sequence_start_pos = idx
-        if span_info:
-            return keywords_extracted
-        return [value[0] for value in keywords_extracted]
 
-    def replace_keywords(self, sentence, max_cost=0):
+    def _iter_matches_trie_counted(self, sentence, max_cost, fold, word_chars, counters):
+        """`_iter_matches_trie` adding what it does to `counters`, see `reset_stats`.
+
+        A copy of the loop of `_iter_matches_trie` with counters, so that searching
+        without stats does no counting at all. test_kp_stats checks that both find the
+        same keywords. The counts are worked out a word at a time: the characters of a
+        word stepped through before its end are transitions, and every character up to
+        `idx` is read once, plus the ones read ahead and read again.
+        """
+        # read once: the scan runs on this version of the trie, and locals are faster
+        keyword_trie_dict = self.keyword_trie_dict
+        keyword = self._keyword
+        current_dict = keyword_trie_dict
+        sequence_start_pos = 0
+        sequence_end_pos = 0
+        reset_current_dict = False
+        idx = 0
+        sentence_len = len(sentence)
+        curr_cost = max_cost
+        transitions = discarded = fuzzy_searches = fuzzy_skipped = 0
+        try:
+            while idx < sentence_len:
+                char = fold[sentence[idx]]
+                # when we reach a character that might denote word end
+                if not word_chars[char]:
+                    transitions += idx - sequence_start_pos
+
+                    # if end is present in current_dict
+                    if keyword in current_dict or char in current_dict:
+                        # update longest sequence found
+                        sequence_found = None
+                        longest_sequence_found = None
+                        is_longer_seq_found = False
+                        if keyword in current_dict:
+                            sequence_found = current_dict[keyword]
+                            longest_sequence_found = current_dict[keyword]
+                            sequence_end_pos = idx
+
+                        # re look for longest_sequence from this position
+                        if char in current_dict:
+                            current_dict_continued = current_dict[char]
+                            transitions += 1
+
+                            idy = idx + 1
+                            while idy < sentence_len:
+                                inner_char = fold[sentence[idy]]
+                                if not word_chars[inner_char] and keyword in current_dict_continued:
+                                    # update longest sequence found
+                                    longest_sequence_found = current_dict_continued[keyword]
+                                    sequence_end_pos = idy
+                                    is_longer_seq_found = True
+                                if inner_char in current_dict_continued:
+                                    current_dict_continued = current_dict_continued[inner_char]
+                                    transitions += 1
+                                elif curr_cost > 0:
+                                    next_word = fold.fold(self.get_next_word(sentence, idy))
+                                    fuzzy_searches += 1
+                                    current_dict_continued, cost, _ = self._best_fuzzy_match(
+                                        next_word, curr_cost, current_dict_continued, ({}, 0, 0), counters
+                                    ) # current_dict_continued to empty dict by default, so next iteration goes to a `break`
+                                    curr_cost -= cost
+                                    idy += len(next_word) - 1
+                                    if not current_dict_continued:
+                                        if not next_word:
+                                            # back on the character read, for the count of the ones read ahead
+                                            idy += 1
+                                        break
+                                else:
+                                    break
+                                idy += 1
+                            else:
+                                # end of sentence reached.
+                                if keyword in current_dict_continued:
+                                    # update longest sequence found
+                                    longest_sequence_found = current_dict_continued[keyword]
+                                    sequence_end_pos = idy
+                                    is_longer_seq_found = True
+                                else:
+                                    # idy is past the last character read
+                                    discarded -= 1
+                            # characters read ahead up to idy, and read again after the longest
+                            # keyword found, or after idx if there is none
+                            if is_longer_seq_found:
+                                discarded += idy - sequence_end_pos
+                                idx = sequence_end_pos
+                            else:
+                                discarded += idy - idx
+                        current_dict = keyword_trie_dict
+                        if longest_sequence_found is not None:
+                            yield longest_sequence_found, sequence_start_pos, idx
+                            curr_cost = max_cost
+                        reset_current_dict = True
+                    else:
+                        # we reset current_dict
+                        current_dict = keyword_trie_dict
+                        reset_current_dict = True
+                elif char in current_dict:
+                    # we can continue from this char
+                    current_dict = current_dict[char]
+                elif curr_cost > 0:
+                    next_word = fold.fold(self.get_next_word(sentence, idx))
+                    # the characters of the word are matched by the fuzzy search, not stepped through
+                    fuzzy_skipped += len(next_word)
+                    fuzzy_searches += 1
+                    current_dict, cost, _ = self._best_fuzzy_match(
+                        next_word, curr_cost, current_dict, (keyword_trie_dict, 0, 0), counters
+                    )
+                    curr_cost -= cost
+                    idx += len(next_word) - 1
+                else:
+                    # we reset current_dict
+                    current_dict = keyword_trie_dict
+                    reset_current_dict = True
+                    transitions += idx - sequence_start_pos
+                    # skip to end of word
+                    idy = idx + 1
+                    while idy < sentence_len:
+                        char = fold[sentence[idy]]
+                        if not word_chars[char]:
+                            break
+                        idy += 1
+                    idx = idy
+                # if we are end of sentence and have a sequence discovered
+                if idx + 1 >= sentence_len:
+                    if keyword in current_dict:
+                        sequence_found = current_dict[keyword]
+                        yield sequence_found, sequence_start_pos, sentence_len
+                idx += 1
+                if reset_current_dict:
+                    reset_current_dict = False
+                    sequence_start_pos = idx
+            # the last word, if the sentence ends in it
+            transitions += max(sentence_len - sequence_start_pos, 0)
+        finally:
+            counters['characters_scanned'] += min(idx, sentence_len) + discarded
+            counters['transitions'] += transitions - fuzzy_skipped
+            counters['lookahead_discarded'] += discarded
+            counters['levensthein_calls'] += fuzzy_searches
+
+    def replace_keywords(self, sentence, max_cost=0, repl=None, out=None):
         """Searches in the string for all keywords present in corpus.
         Keywords present are replaced by the clean name and a new string is returned.
 
+        The keywords are found with `extract_keywords`, and the text around them is
+        copied as it is. If no keyword is found, `sentence` itself is returned.
+
         Args:
             sentence (str): Line of text where we will replace keywords
+            max_cost (int): maximum levensthein distance to accept when replacing keywords,
+                the closest keyword is used
+            repl (callable): Called as repl(clean_name, matched_text, start, end) for every
+                keyword found, returns the text to replace it with. Defaults to the clean name
+            out (file): Text stream with a `write(text)` method. The new sentence is written to
+                it piece by piece instead of being returned
 
         Returns:
-            new_sentence (str): Line of text with replaced keywords
+            new_sentence (str): Line of text with replaced keywords, None if `out` is given
 
         Examples:
             >>> from flashtext import KeywordProcessor
@@ -599,144 +1360,496 @@ class KeywordProcessor(object):
             >>> new_sentence = keyword_processor.replace_keywords('I love Big Apple and bay area.')
             >>> new_sentence
             >>> 'I love New York and Bay Area.'
+            >>> keyword_processor.replace_keywords('I love Big Apple.',
+            ...     repl=lambda clean_name, text, start, end: '<b>{}</b>'.format(text))
+            >>> 'I love <b>Big Apple</b>.'
 
         """
         if not sentence:
             # if sentence is empty or none just return the same.
-            return sentence
-        new_sentence = []
-        orig_sentence = sentence
-        if not self.case_sensitive:
-            sentence = sentence.lower()
-        current_word = ''
-        current_dict = self.keyword_trie_dict
-        current_white_space = ''
-        sequence_end_pos = 0
-        idx = 0
-        sentence_len = len(sentence)
-        curr_cost = max_cost
-        while idx < sentence_len:
-            char = sentence[idx]
-            # when we reach whitespace
-            if char not in self.non_word_boundaries:
-                current_word += orig_sentence[idx]
-                current_white_space = char
-                # if end is present in current_dict
-                if self._keyword in current_dict or char in current_dict:
-                    # update longest sequence found
-                    sequence_found = None
-                    longest_sequence_found = None
-                    is_longer_seq_found = False
-                    if self._keyword in current_dict:
-                        sequence_found = current_dict[self._keyword]
-                        longest_sequence_found = current_dict[self._keyword]
-                        sequence_end_pos = idx
+            return sentence if out is None else None
+        observers = self.observers
+        if observers:
+            start = time.perf_counter_ns()
+        keywords_extracted = self._extract_keywords(sentence, span_info=True, max_cost=max_cost)
+        if out is not None:
+            self._write_replaced(sentence, keywords_extracted, out.write, repl)
+            new_sentence = None
+        elif not keywords_extracted:
+            new_sentence = sentence
+        else:
+            pieces = []
+            self._write_replaced(sentence, keywords_extracted, pieces.append, repl)
+            new_sentence = "".join(pieces)
+        if observers:
+            self._notify_observers('replace_keywords', sentence, len(keywords_extracted),
+                                   time.perf_counter_ns() - start)
+        return new_sentence
+
+    def _notify_observers(self, operation, text, match_count, elapsed_ns):
+        """Call every observer with what a call did, see `observers`.
+
+        Observers are called as observer(operation, input_length, match_count, elapsed_ns),
+        in the thread that made the call, right after it. `operation` is 'extract_keywords'
+        or 'replace_keywords' and `elapsed_ns` the time the call took in nanoseconds.
+        Observers with a true `wants_text` attribute also get the sentence searched, as
+        the `text` keyword argument. An observer that raises is logged, and neither the
+        call nor the other observers are affected. flashtext.observe has a latency
+        histogram and a record of the slowest inputs. Calls made in other processes, see
+        `extract_keywords_batch`, are not observed.
 
-                    # re look for longest_sequence from this position
-                    if char in current_dict:
-                        current_dict_continued = current_dict[char]
-                        current_word_continued = current_word
-                        idy = idx + 1
-                        while idy < sentence_len:
-                            inner_char = sentence[idy]
-                            if inner_char not in self.non_word_boundaries and self._keyword in current_dict_continued:
-                                current_word_continued += orig_sentence[idy]
-                                # update longest sequence found
-                                current_white_space = inner_char
-                                longest_sequence_found = current_dict_continued[self._keyword]
-                                sequence_end_pos = idy
-                                is_longer_seq_found = True
-                            if inner_char in current_dict_continued:
-                                current_word_continued += orig_sentence[idy]
-                                current_dict_continued = current_dict_continued[inner_char]
-                            elif curr_cost > 0:
-                                next_word = self.get_next_word(sentence[idy:])
-                                current_dict_continued, cost, _ = next(
-                                    self.levensthein(next_word, max_cost=curr_cost, start_node=current_dict_continued),
-                                    ({}, 0, 0)
-                                )
-                                idy += len(next_word) - 1
-                                curr_cost -= cost
-                                current_word_continued += next_word  # just in case of a no match at the end
-                                if not current_dict_continued:
-                                    break
-                            else:
-                                break
-                            idy += 1
-                        else:
-                            # end of sentence reached.
-                            if self._keyword in current_dict_continued:
-                                # update longest sequence found
-                                current_white_space = ''
-                                longest_sequence_found = current_dict_continued[self._keyword]
-                                sequence_end_pos = idy
-                                is_longer_seq_found = True
-                        if is_longer_seq_found:
-                            idx = sequence_end_pos
-                            current_word = current_word_continued
-                    current_dict = self.keyword_trie_dict
-                    if longest_sequence_found:
-                        curr_cost = max_cost
-                        new_sentence.append(longest_sequence_found + current_white_space)
-                        current_word = ''
-                        current_white_space = ''
-                    else:
-                        new_sentence.append(current_word)
-                        current_word = ''
-                        current_white_space = ''
+        Examples:
+            >>> from flashtext.observe import LatencyHistogram
+            >>> histogram = LatencyHistogram()
+            >>> keyword_processor.observers.append(histogram)
+            >>> keyword_processor.observers.append(
+            ...     lambda operation, input_length, match_count, elapsed_ns: print(operation, elapsed_ns))
+        """
+        input_length = len(text)
+        for observer in self.observers:
+            try:
+                if getattr(observer, 'wants_text', False):
+                    observer(operation, input_length, match_count, elapsed_ns, text=text)
                 else:
-                    # we reset current_dict
-                    current_dict = self.keyword_trie_dict
-                    new_sentence.append(current_word)
-                    current_word = ''
-                    current_white_space = ''
-            elif char in current_dict:
-                # we can continue from this char
-                current_word += orig_sentence[idx]
-                current_dict = current_dict[char]
-            elif curr_cost > 0:
-                next_orig_word = self.get_next_word(orig_sentence[idx:])
-                next_word = next_orig_word if self.case_sensitive else str.lower(next_orig_word)
-                current_dict, cost, _ = next(
-                    self.levensthein(next_word, max_cost=curr_cost, start_node=current_dict),
-                    (self.keyword_trie_dict, 0, 0)
-                )
-                idx += len(next_word) - 1
-                curr_cost -= cost
-                current_word += next_orig_word  # just in case of a no match at the end
+                    observer(operation, input_length, match_count, elapsed_ns)
+            except Exception:
+                logger.exception("observer {!r} failed on {}".format(observer, operation))
+
+    def _write_replaced(self, text, spans, write, repl=None, offset=0):
+        """Write `text` with the keywords of `spans` replaced, the text between them a slice at a time.
+
+        Args:
+            text (str): Text the keywords were found in
+            spans (list(tuple)): (clean_name, start, end) of the keywords found in `text`, the
+                id of the clean name with keyword_ids
+            write (callable): Called with every piece of the new text
+            repl (callable): Called as repl(clean_name, matched_text, start, end), None to
+                write the clean names
+            offset (int): Position of `text` in the whole text, added to the positions given to `repl`
+        """
+        clean_names = self.clean_names if self.keyword_ids else None
+        last_end = 0
+        for clean_name, start, end in spans:
+            if clean_names is not None:
+                clean_name = clean_names[clean_name]
+            if last_end < start:
+                write(text[last_end:start])
+            if repl is None:
+                write(clean_name)
             else:
-                current_word += orig_sentence[idx]
-                # we reset current_dict
-                current_dict = self.keyword_trie_dict
-                # skip to end of word
-                idy = idx + 1
-                while idy < sentence_len:
-                    char = sentence[idy]
-                    current_word += orig_sentence[idy]
-                    if char not in self.non_word_boundaries:
-                        break
-                    idy += 1
-                idx = idy
-                new_sentence.append(current_word)
-                current_word = ''
-                current_white_space = ''
-            # if we are end of sentence and have a sequence discovered
-            if idx + 1 >= sentence_len:
-                if self._keyword in current_dict:
-                    sequence_found = current_dict[self._keyword]
-                    new_sentence.append(sequence_found)
-                else:
-                    new_sentence.append(current_word)
-            idx += 1
-        return "".join(new_sentence)
+                write(repl(clean_name, text[start:end], offset + start, offset + end))
+            last_end = end
+        if last_end < len(text):
+            write(text[last_end:])
+
+    def count_keywords(self, sentence, max_cost=0, counter=None):
+        """Count how many times every keyword appears in the string.
+
+        Matches are counted as the scan finds them, no list of keywords is built.
+
+        Args:
+            sentence (str): Line of text where we will search for keywords
+            max_cost (int): maximum levensthein distance to accept when counting keywords
+            counter (Counter): Counter to add the counts to, a new one if None
 
-    def get_next_word(self, sentence):
+        Returns:
+            counter (Counter): Number of keywords found for every clean name
+
+        Examples:
+            >>> from flashtext import KeywordProcessor
+            >>> keyword_processor = KeywordProcessor()
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.add_keyword('NYC', 'New York')
+            >>> keyword_processor.count_keywords('NYC or Big Apple, I love NYC.')
+            >>> Counter({'New York': 3})
+        """
+        if counter is None:
+            counter = Counter()
+        if sentence:
+            counter.update(map(itemgetter(0), self._iter_matches(sentence, max_cost)))
+        return counter
+
+    def contains_any(self, sentence, max_cost=0):
+        """Tell whether the string contains any keyword.
+
+        The scan stops at the first keyword found.
+
+        Args:
+            sentence (str): Line of text where we will search for keywords
+            max_cost (int): maximum levensthein distance to accept when searching for keywords
+
+        Returns:
+            found (bool): True if a keyword was found
+
+        Examples:
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.contains_any('I love Big Apple and Bay Area.')
+            >>> True
+        """
+        if not sentence:
+            return False
+        for _ in self._iter_matches(sentence, max_cost):
+            return True
+        return False
+
+    def find_first(self, sentence, span_info=False, max_cost=0):
+        """Find the first keyword of the string.
+
+        It is the first keyword extract_keywords would return, but the scan stops as
+        soon as it is found.
+
+        Args:
+            sentence (str): Line of text where we will search for keywords
+            span_info (bool): True to also get the span of the keyword
+            max_cost (int): maximum levensthein distance to accept when searching for keywords
+
+        Returns:
+            keyword (str): The clean name of the first keyword found, or a (clean_name, start, end)
+                tuple with `span_info`. None if there is no keyword in the sentence.
+
+        Examples:
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.add_keyword('Bay Area')
+            >>> keyword_processor.find_first('I love Big Apple and Bay Area.', span_info=True)
+            >>> ('New York', 7, 16)
+        """
+        if not sentence:
+            return None
+        for keyword in self._iter_matches(sentence, max_cost):
+            return keyword if span_info else keyword[0]
+        return None
+
+    def extract_keywords_batch(self, sentences, span_info=False, max_cost=0, workers=None, chunksize=64):
+        """Extract keywords from many sentences using a pool of processes.
+
+        The keyword processor is sent to every worker process once, sentences are then
+        sent in chunks and the results are yielded as they come back, in input order.
+        Compile the keywords with `compile(keep_trie=False)` first to make the workers
+        start faster.
+
+        Args:
+            sentences (iterable(str)): Lines of text where we will search for keywords
+            span_info (bool): True if you need to span the boundaries where the extraction has been performed
+            max_cost (int): maximum levensthein distance to accept when extracting keywords
+            workers (int): Number of worker processes, defaults to the number of CPUs.
+                With 1 worker sentences are processed in the calling process.
+            chunksize (int): Number of sentences sent to a worker at once.
+
+        Yields:
+            keywords_extracted (list(str)): List of terms/keywords found in each sentence
+
+        Examples:
+            >>> from flashtext import KeywordProcessor
+            >>> keyword_processor = KeywordProcessor()
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.add_keyword('Bay Area')
+            >>> sentences = ['I love Big Apple.', 'Bay Area is nice.']
+            >>> list(keyword_processor.extract_keywords_batch(sentences, workers=2))
+            >>> [['New York'], ['Bay Area']]
+        """
+        kwargs = {'span_info': span_info, 'max_cost': max_cost}
+        return imap_processor(self, 'extract_keywords', sentences, kwargs, workers, chunksize)
+
+    def extract_keywords_threaded(self, sentences, span_info=False, max_cost=0, threads=None, chunksize=64):
+        """Extract keywords from many sentences using a pool of threads sharing this processor.
+
+        Matching only reads the keywords, so threads can share one keyword processor
+        instead of each process holding a copy, see extract_keywords_batch. Threads
+        scale with their number on a free-threaded build of Python (3.13t and later),
+        with the GIL they run one at a time. Keywords can be changed meanwhile from
+        `batch_updates`, or with `copy_on_write`.
+
+        Args:
+            sentences (iterable(str)): Lines of text where we will search for keywords
+            span_info (bool): True if you need to span the boundaries where the extraction has been performed
+            max_cost (int): maximum levensthein distance to accept when extracting keywords
+            threads (int): Number of threads, defaults to the number of CPUs.
+                With 1 thread sentences are processed in the calling thread.
+            chunksize (int): Number of sentences given to a thread at once.
+
+        Yields:
+            keywords_extracted (list(str)): List of terms/keywords found in each sentence
+
+        Examples:
+            >>> sentences = ['I love Big Apple.', 'Bay Area is nice.']
+            >>> list(keyword_processor.extract_keywords_threaded(sentences, threads=4))
+            >>> [['New York'], ['Bay Area']]
+        """
+        kwargs = {'span_info': span_info, 'max_cost': max_cost}
+        return imap_threads(self, 'extract_keywords', sentences, kwargs, threads, chunksize)
+
+    def aextract_keywords(self, sentence, span_info=False, max_cost=0, executor=None, max_batch=64):
+        """Extract keywords from an asyncio task, without blocking the event loop.
+
+        Keywords are extracted in `executor`. Calls made by many tasks at the same time
+        are grouped, up to `max_batch` sentences, into a single executor call.
+
+        Args:
+            sentence (str): Line of text where we will search for keywords
+            span_info (bool): True if you need to span the boundaries where the extraction has been performed
+            max_cost (int): maximum levensthein distance to accept when extracting keywords
+            executor (concurrent.futures.Executor): Executor to extract in, the default
+                executor of the event loop if None.
+            max_batch (int): Number of sentences extracted in one executor call at most.
+
+        Returns:
+            keywords_extracted (list(str)): Awaitable list of terms/keywords found in sentence
+
+        Examples:
+            >>> keywords_found = await keyword_processor.aextract_keywords('I love Big Apple.')
+            >>> ['New York']
+        """
+        return aio.aextract_keywords(self, sentence, span_info, max_cost, executor, max_batch)
+
+    def aiter_keywords(self, sentences, span_info=False, max_cost=0, executor=None, batch_size=64,
+                       max_pending=4):
+        """Extract keywords from a stream of sentences in asyncio, without blocking the event loop.
+
+        Sentences are read into a bounded queue, the ones waiting are extracted together
+        in `executor`. At most `max_pending` executor calls are in flight, and reading
+        the sentences waits when the keywords are not consumed fast enough.
+
+        Args:
+            sentences (iterable(str)): Lines of text, an async iterable or a plain one
+            span_info (bool): True if you need to span the boundaries where the extraction has been performed
+            max_cost (int): maximum levensthein distance to accept when extracting keywords
+            executor (concurrent.futures.Executor): Executor to extract in, the default
+                executor of the event loop if None.
+            batch_size (int): Number of sentences extracted in one executor call at most.
+            max_pending (int): Number of executor calls in flight at most.
+
+        Yields:
+            keywords_extracted (list(str)): List of terms/keywords found in each sentence, asynchronously
+
+        Examples:
+            >>> async for keywords_found in keyword_processor.aiter_keywords(messages):
+            >>>     print(keywords_found)
+        """
+        return aio.aiter_keywords(self, sentences, span_info, max_cost, executor, batch_size, max_pending)
+
+    def extract_column(self, column, max_cost=0):
+        """Extract keyword ids from every row of a pyarrow or numpy column of strings, as columns.
+
+        Rows are converted to strings by pyarrow or numpy a block at a time, so the
+        column is never held as a list of strings, and the matches are added to flat
+        arrays instead of a list of tuples per row. Null, missing and empty rows have no
+        keyword. pyarrow is only imported when a column of its own is given.
+
+        Args:
+            column: pyarrow StringArray, LargeStringArray or ChunkedArray of them, or
+                1-dimensional numpy array of unicode strings or of objects (None and nan
+                are missing values)
+            max_cost (int): maximum levensthein distance to accept when extracting keywords
+
+        Returns:
+            rows, starts, ends, keyword_ids (tuple(array)): array('i') of the row, the start
+                and end in the row, and the id of every keyword found, in row order
+
+        Examples:
+            >>> import pyarrow
+            >>> keyword_processor = KeywordProcessor(keyword_ids=True)
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> keyword_processor.add_keyword('Bay Area')
+            >>> column = pyarrow.array(['I love Big Apple.', None, 'Bay Area and Big Apple.'])
+            >>> rows, starts, ends, keyword_ids = keyword_processor.extract_column(column)
+            >>> rows, keyword_ids
+            >>> (array('i', [0, 2, 2]), array('i', [0, 1, 0]))
+
+        Raises:
+            ValueError: If keyword_ids is not set.
+            TypeError: If `column` is not a pyarrow or numpy array of strings.
+        """
+        if not self.keyword_ids:
+            raise ValueError("only keyword ids can be extracted from a column")
+        return extract_column(self, column, max_cost)
+
+    def replace_keywords_batch(self, sentences, max_cost=0, workers=None, chunksize=64, repl=None):
+        """Replace keywords in many sentences using a pool of processes.
+
+        Works like extract_keywords_batch, yielding the new sentences in input order.
+
+        Args:
+            sentences (iterable(str)): Lines of text where we will replace keywords
+            max_cost (int): maximum levensthein distance to accept when replacing keywords
+            workers (int): Number of worker processes, defaults to the number of CPUs.
+                With 1 worker sentences are processed in the calling process.
+            chunksize (int): Number of sentences sent to a worker at once.
+            repl (callable): Text to replace every keyword with, see replace_keywords. It is
+                sent to the workers, so it has to be picklable, like a module level function.
+
+        Yields:
+            new_sentence (str): Line of text with replaced keywords, for each sentence
+
+        Examples:
+            >>> sentences = ['I love Big Apple.', 'Bay Area is nice.']
+            >>> list(keyword_processor.replace_keywords_batch(sentences, workers=2))
+            >>> ['I love New York.', 'Bay Area is nice.']
+        """
+        kwargs = {'max_cost': max_cost, 'repl': repl}
+        return imap_processor(self, 'replace_keywords', sentences, kwargs, workers, chunksize)
+
+    def count_keywords_batch(self, sentences, max_cost=0, workers=None, chunksize=64):
+        """Count how many times every keyword appears in many sentences, using a pool of processes.
+
+        Every worker counts the keywords of a whole chunk of sentences, only the counts
+        of the chunks are sent back and added up.
+
+        Args:
+            sentences (iterable(str)): Lines of text where we will search for keywords
+            max_cost (int): maximum levensthein distance to accept when counting keywords
+            workers (int): Number of worker processes, defaults to the number of CPUs.
+                With 1 worker sentences are processed in the calling process.
+            chunksize (int): Number of sentences sent to a worker at once.
+
+        Returns:
+            counter (Counter): Number of keywords found for every clean name, in all the sentences
+
+        Examples:
+            >>> sentences = ['I love Big Apple.', 'Bay Area and Big Apple.']
+            >>> keyword_processor.count_keywords_batch(sentences, workers=2)
+            >>> Counter({'New York': 2, 'Bay Area': 1})
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize should be at least 1")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        counter = Counter()
+        if workers <= 1:
+            for sentence in sentences:
+                self.count_keywords(sentence, max_cost, counter)
+            return counter
+        sentences = iter(sentences)
+        chunks = iter(lambda: list(islice(sentences, chunksize)), [])
+        kwargs = {'max_cost': max_cost, 'workers': 1}
+        for chunk_counter in imap_processor(self, 'count_keywords_batch', chunks, kwargs, workers, chunksize=1):
+            counter.update(chunk_counter)
+        return counter
+
+    def _longest_keyword_length(self):
+        """Length of the longest keyword, in characters."""
+        if self.automaton is not None:
+            return self.automaton.max_depth
+        depth = 0
+        level = [self.keyword_trie_dict]
+        while True:
+            level = [child for node in level for char, child in node.items() if char != self._keyword]
+            if not level:
+                return depth
+            depth += 1
+
+    def _scan_stream(self, fileobj, chunk_size):
+        """Read `fileobj` chunk by chunk and search for keywords.
+
+        The text is only cut where the search would start looking for a keyword anyway:
+        a match is kept once the characters needed to tell whether a longer keyword
+        follows were read, and the unsure tail is carried over to the next chunk. The
+        chunks are searched without telling the `observers`, they are not calls.
+
+        Yields:
+            text, offset, spans (tuple): consecutive slices of the text read, their offset
+                in the stream and the (clean_name, start, end) matches in the slice.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be at least 1")
+        # a keyword starting `lookahead` characters before the end of the buffer
+        # is followed by enough characters to know where it ends
+        lookahead = self._longest_keyword_length() + 1
+        fold, word_chars = self._character_tables()
+        buffer = ''
+        offset = 0
+        in_word = False
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+            if in_word:
+                # no keyword starts before the end of the current word
+                cut = 0
+                while cut < len(buffer) and word_chars[fold[buffer[cut]]]:
+                    cut += 1
+                in_word = cut == len(buffer)
+                if not in_word:
+                    cut += 1
+                yield buffer[:cut], offset, []
+                offset += cut
+                buffer = buffer[cut:]
+            horizon = len(buffer) - lookahead
+            if horizon < 0:
+                continue
+            spans = []
+            cut = 0
+            for clean_name, start, end in self._extract_keywords(buffer, span_info=True):
+                if start > horizon:
+                    break
+                spans.append((clean_name, start, end))
+                # the character at `end` is a word boundary
+                cut = end + 1
+            cut = max(cut, horizon + 1)
+            while cut < len(buffer) and word_chars[fold[buffer[cut - 1]]]:
+                cut += 1
+            in_word = word_chars[fold[buffer[cut - 1]]]
+            yield buffer[:cut], offset, spans
+            offset += cut
+            buffer = buffer[cut:]
+        if buffer:
+            yield buffer, offset, self._extract_keywords(buffer, span_info=True)
+
+    def extract_keywords_from_stream(self, fileobj, chunk_size=65536):
+        """Searches a file-like object for all keywords present in corpus.
+
+        The text is read `chunk_size` characters at a time, so it does not have to fit in
+        memory. Keywords found across two chunks are still matched, and the matches are the
+        same as the ones extract_keywords would find on the whole text.
+
+        Args:
+            fileobj (file): Text stream to read from, with a `read(size)` method
+            chunk_size (int): Number of characters read at once
+
+        Yields:
+            keyword (tuple): (clean_name, start, end) of every keyword found, with `start`
+                and `end` offsets from the beginning of the stream
+
+        Examples:
+            >>> from flashtext import KeywordProcessor
+            >>> keyword_processor = KeywordProcessor()
+            >>> keyword_processor.add_keyword('Big Apple', 'New York')
+            >>> with open('text.txt') as fileobj:
+            >>>     for clean_name, start, end in keyword_processor.extract_keywords_from_stream(fileobj):
+            >>>         print(clean_name, start, end)
+        """
+        for _, offset, spans in self._scan_stream(fileobj, chunk_size):
+            for clean_name, start, end in spans:
+                yield clean_name, offset + start, offset + end
+
+    def replace_keywords_stream(self, fin, fout, chunk_size=65536, repl=None):
+        """Replace the keywords read from `fin` and write the new text to `fout`.
+
+        Text is written as soon as it is known not to be part of a keyword, see
+        extract_keywords_from_stream.
+
+        Args:
+            fin (file): Text stream to read from, with a `read(size)` method
+            fout (file): Text stream to write to, with a `write(text)` method
+            chunk_size (int): Number of characters read at once
+            repl (callable): Text to replace every keyword with, see replace_keywords.
+                `start` and `end` are offsets from the beginning of the stream
+
+        Examples:
+            >>> with open('text.txt') as fin, open('new_text.txt', 'w') as fout:
+            >>>     keyword_processor.replace_keywords_stream(fin, fout)
+        """
+        for text, offset, spans in self._scan_stream(fin, chunk_size):
+            self._write_replaced(text, spans, fout.write, repl, offset)
+
+    def get_next_word(self, sentence, start=0):
         """
         Retrieve the next word in the sequence
         Iterate in the string until finding the first char not in non_word_boundaries
 
         Args:
             sentence (str): Line of text where we will look for the next word
+            start (int): Position of the sentence the word starts at. Defaults to 0
 
         Returns:
             next_word (str): The next word in the sentence
@@ -746,18 +1859,22 @@ class KeywordProcessor(object):
             >>> keyword_processor.add_keyword('Big Apple')
             >>> 'Big'
         """
-        next_word = str()
-        for char in sentence:
-            if char not in self.non_word_boundaries:
-                break
-            next_word += char
-        return next_word
+        fold, word_chars = self._character_tables()
+        end = start
+        sentence_len = len(sentence)
+        while end < sentence_len and word_chars[fold[sentence[end]]]:
+            end += 1
+        return sentence[start:end]
 
     def levensthein(self, word, max_cost=2, start_node=None):
         """
         Retrieve the nodes where there is a fuzzy match,
         via levenshtein distance, and with respect to max_cost
 
+        Nodes come in the order of a depth first walk of the trie. extract_keywords and
+        replace_keywords use the match with the lowest cost instead, see
+        `TrieWalkMatcher.best_match`.
+
         Args:
             word (str): word to find a fuzzy match for
             max_cost (int): maximum levenshtein distance when performing the fuzzy match
@@ -779,29 +1896,18 @@ class KeywordProcessor(object):
             >>> next(keyword_processor.levensthein('Mari', max_cost=1))
             >>> ({' ': {'B': {'l': {'a': {'n': {'c': {'_keyword_': 'Mary'}}}}}}}, 1, 5)
         """
-        start_node = start_node or self.keyword_trie_dict
-        rows = range(len(word) + 1)
-
-        for char, node in start_node.items():
-            yield from self._levenshtein_rec(char, node, word, rows, max_cost, depth=1)
-
-
-    def _levenshtein_rec(self, char, node, word, rows, max_cost, depth=0):
-        n_columns = len(word) + 1
-        new_rows = [rows[0] + 1]
-        cost = 0
-
-        for col in range(1, n_columns):
-            insert_cost = new_rows[col - 1] + 1
-            delete_cost = rows[col] + 1
-            replace_cost = rows[col - 1] + int(word[col - 1] != char)
-            cost = min((insert_cost, delete_cost, replace_cost))
-            new_rows.append(cost)
-
-        stop_crit = isinstance(node, dict) and node.keys() & (self._white_space_chars | {self._keyword})
-        if new_rows[-1] <= max_cost and stop_crit:
-            yield node, cost, depth
-
-        elif isinstance(node, dict) and min(new_rows) <= max_cost:
-            for new_char, new_node in node.items():
-                yield from self._levenshtein_rec(new_char, new_node, word, new_rows, max_cost, depth=depth + 1)
+        yield from self._fuzzy_matcher_for_trie().search(word, max_cost, start_node)
+
+    def _best_fuzzy_match(self, word, max_cost, start_node, default, stats=None):
+        """Node of the lowest cost `levensthein` yields, or `default`, answered from `fuzzy_cache` if possible."""
+        match = self.fuzzy_cache.best_match(self._fuzzy_matcher_for_trie(), word, max_cost, start_node, stats)
+        return default if match is None else match
+
+    def _fuzzy_matcher_for_trie(self):
+        """Fuzzy matcher of the `fuzzy_backend`, built for the current trie if needed."""
+        trie_dict = self.keyword_trie_dict
+        matcher = self._fuzzy_matcher
+        if matcher is None or matcher.trie_dict is not trie_dict:
+            backend = FUZZY_BACKENDS.get(self.fuzzy_backend, self.fuzzy_backend)
+            matcher = self._fuzzy_matcher = backend(trie_dict, self._keyword, self._white_space_chars)
+        return matcher
@@ -0,0 +1,164 @@
+import hashlib
+import heapq
+import itertools
+import threading
+
+
+class LatencyHistogram(object):
+    """Number of calls of every operation of a KeywordProcessor, by how long they took.
+
+    An observer, see `KeywordProcessor.observers`. Latencies are counted in buckets of
+    powers of two nanoseconds: bucket `i` holds the calls that took from 2**(i-1) up to
+    2**i - 1 nanoseconds, so a few dozen buckets cover anything from a nanosecond to
+    minutes, with a relative error of at most two.
+
+    Attributes:
+        buckets (dict): Counts of every bucket, a list by operation name.
+
+    Examples:
+        >>> from flashtext.observe import LatencyHistogram
+        >>> histogram = LatencyHistogram()
+        >>> keyword_processor.observers.append(histogram)
+        >>> keyword_processor.extract_keywords('I love Big Apple.')
+        >>> histogram.percentile('extract_keywords', 0.99)
+        >>> 16384
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, operation, input_length, match_count, elapsed_ns):
+        bucket = max(elapsed_ns, 0).bit_length()
+        with self._lock:
+            counts = self.buckets.get(operation)
+            if counts is None:
+                counts = self.buckets[operation] = []
+            if len(counts) <= bucket:
+                counts.extend([0] * (bucket + 1 - len(counts)))
+            counts[bucket] += 1
+
+    def count(self, operation):
+        """Number of calls of `operation` observed."""
+        return sum(self.buckets.get(operation, ()))
+
+    def percentile(self, operation, fraction):
+        """Upper bound of the latency of the `fraction` fastest calls of `operation`.
+
+        Args:
+            operation (str): Name of the operation, like 'extract_keywords'.
+            fraction (float): Share of the calls, 0.5 for the median, 0.99 for the 99th percentile.
+
+        Returns:
+            elapsed_ns (int): Upper bound, excluded, of the bucket the percentile falls in,
+                in nanoseconds, None if no call was observed.
+        """
+        with self._lock:
+            counts = list(self.buckets.get(operation, ()))
+        total = sum(counts)
+        if not total:
+            return None
+        seen = 0
+        for bucket, count in enumerate(counts):
+            seen += count
+            if seen >= fraction * total:
+                return 2 ** bucket
+        return 2 ** (len(counts) - 1)
+
+    def to_dict(self):
+        """Counts of the buckets that are not empty, by their excluded upper bound in nanoseconds, by operation.
+
+        Returns:
+            histogram (dict): Plain dict like {'extract_keywords': {8192: 10, 16384: 2}}.
+        """
+        with self._lock:
+            return dict((operation, dict((2 ** bucket, count) for bucket, count in enumerate(counts) if count))
+                        for operation, counts in self.buckets.items())
+
+    def clear(self):
+        """Forget every call."""
+        with self._lock:
+            self.buckets.clear()
+
+
+class SlowestInputs(object):
+    """The slowest calls of a KeywordProcessor, with enough of their input to find it again.
+
+    An observer, see `KeywordProcessor.observers`. The `size` slowest calls are kept in
+    a heap, a call slower than the fastest one kept replacing it, so the memory used
+    does not grow with the number of calls. Every call is kept with the sha1 of its
+    input and its first `prefix_length` characters, or the whole input with `keep_text`.
+    It sets `wants_text` to get the input, calls made without it are kept with no
+    sha1 or prefix.
+
+    Args:
+        size (int): Number of calls kept.
+        prefix_length (int): Number of characters of the input kept.
+        keep_text (bool): Keep the whole input, to reproduce the call offline.
+
+    Examples:
+        >>> from flashtext.observe import SlowestInputs
+        >>> slowest_inputs = SlowestInputs(size=10)
+        >>> keyword_processor.observers.append(slowest_inputs)
+        >>> keyword_processor.extract_keywords(document)
+        >>> slowest_inputs.slowest()[0]['sha1']
+    """
+
+    # KeywordProcessor passes the input searched as `text`
+    wants_text = True
+
+    def __init__(self, size=10, prefix_length=200, keep_text=False):
+        if size < 1:
+            raise ValueError("size should be at least 1")
+        self.size = size
+        self.prefix_length = prefix_length
+        self.keep_text = keep_text
+        # (elapsed_ns, order, call), the fastest call kept first
+        self._heap = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __call__(self, operation, input_length, match_count, elapsed_ns, text=None):
+        heap = self._heap
+        with self._lock:
+            if len(heap) >= self.size and elapsed_ns <= heap[0][0]:
+                return
+        # hashed without the lock, whether the call is still kept is checked again
+        call = {
+            'operation': operation,
+            'elapsed_ns': elapsed_ns,
+            'input_length': input_length,
+            'match_count': match_count,
+            'sha1': None,
+            'prefix': None,
+        }
+        if text is not None:
+            call['sha1'] = hashlib.sha1(text.encode('utf-8', 'surrogatepass')).hexdigest()
+            call['prefix'] = text[:self.prefix_length]
+            if self.keep_text:
+                call['text'] = text
+        with self._lock:
+            entry = (elapsed_ns, next(self._order), call)
+            if len(heap) < self.size:
+                heapq.heappush(heap, entry)
+            elif elapsed_ns > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+    def slowest(self):
+        """Calls kept, the slowest first.
+
+        Returns:
+            calls (list(dict)): Plain dicts with the operation, elapsed_ns, input_length,
+                match_count, sha1 and prefix of every call, and its text with `keep_text`.
+        """
+        with self._lock:
+            entries = sorted(self._heap, key=lambda entry: (-entry[0], entry[1]))
+        return [entry[2] for entry in entries]
+
+    def clear(self):
+        """Forget every call."""
+        with self._lock:
+            del self._heap[:]
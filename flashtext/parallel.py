@@ -0,0 +1,106 @@
+import collections
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# KeywordProcessor sent once to every worker of the pool
+_worker_processor = None
+
+
+def _init_worker(keyword_processor):
+    global _worker_processor
+    _worker_processor = keyword_processor
+
+
+def _run_chunk(method, kwargs, sentences):
+    call = getattr(_worker_processor, method)
+    return [call(sentence, **kwargs) for sentence in sentences]
+
+
+def imap_processor(keyword_processor, method, sentences, kwargs, workers=None, chunksize=64):
+    """Call a method of `keyword_processor` on every sentence, in a pool of processes.
+
+    The keyword processor is sent to each worker once, when the pool starts. Sentences
+    are then sent in chunks of `chunksize`, with at most two chunks per worker in flight,
+    so `sentences` can be a long or endless iterator.
+
+    Args:
+        keyword_processor (KeywordProcessor): Keywords to look for.
+        method (str): Name of the KeywordProcessor method to call on every sentence.
+        sentences (iterable(str)): Lines of text.
+        kwargs (dict): Keyword arguments passed to `method` along with every sentence.
+        workers (int): Number of processes, defaults to the number of CPUs. With 1 worker
+            sentences are processed in the calling process.
+        chunksize (int): Number of sentences sent to a worker at once.
+
+    Yields:
+        result: Return value of `method` for every sentence, in the order of `sentences`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunksize < 1:
+        raise ValueError("chunksize should be at least 1")
+    sentences = iter(sentences)
+    if workers <= 1:
+        call = getattr(keyword_processor, method)
+        for sentence in sentences:
+            yield call(sentence, **kwargs)
+        return
+    chunks = iter(lambda: list(itertools.islice(sentences, chunksize)), [])
+    with multiprocessing.Pool(workers, _init_worker, (keyword_processor,)) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_run_chunk, (method, kwargs, chunk)))
+            if len(pending) >= 2 * workers:
+                for result in pending.popleft().get():
+                    yield result
+        while pending:
+            for result in pending.popleft().get():
+                yield result
+
+
+def imap_threads(keyword_processor, method, sentences, kwargs, threads=None, chunksize=64):
+    """Call a method of `keyword_processor` on every sentence, in a pool of threads.
+
+    Works like `imap_processor`, but every thread reads the same keyword processor,
+    nothing is copied. Threads only run in parallel on a free-threaded build of Python,
+    elsewhere they take turns holding the GIL.
+
+    Args:
+        keyword_processor (KeywordProcessor): Keywords to look for.
+        method (str): Name of the KeywordProcessor method to call on every sentence.
+        sentences (iterable(str)): Lines of text.
+        kwargs (dict): Keyword arguments passed to `method` along with every sentence.
+        threads (int): Number of threads, defaults to the number of CPUs. With 1 thread
+            sentences are processed in the calling thread.
+        chunksize (int): Number of sentences given to a thread at once.
+
+    Yields:
+        result: Return value of `method` for every sentence, in the order of `sentences`.
+    """
+    if threads is None:
+        threads = os.cpu_count() or 1
+    if chunksize < 1:
+        raise ValueError("chunksize should be at least 1")
+    sentences = iter(sentences)
+    call = getattr(keyword_processor, method)
+    if threads <= 1:
+        for sentence in sentences:
+            yield call(sentence, **kwargs)
+        return
+
+    def run_chunk(chunk):
+        return [call(sentence, **kwargs) for sentence in chunk]
+
+    chunks = iter(lambda: list(itertools.islice(sentences, chunksize)), [])
+    with ThreadPoolExecutor(threads) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(run_chunk, chunk))
+            if len(pending) >= 2 * threads:
+                for result in pending.popleft().result():
+                    yield result
+        while pending:
+            for result in pending.popleft().result():
+                yield result
@@ -0,0 +1,211 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from flashtext.automaton import KeywordAutomaton
+
+MAGIC = b'FLASHTXT'
+VERSION = 1
+# magic, format version and length of the json header that follows
+_PREAMBLE = struct.Struct('<8sII')
+_ALIGNMENT = 8
+
+
+def _aligned(size):
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _file_id(stat):
+    """What tells a version of a file from another: a new file replacing it gets a new inode."""
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+class MappedCleanNames(object):
+    """Clean names of a snapshot, decoded from the file when they are looked up.
+
+    Args:
+        offsets (memoryview): Start of every clean name in `data`, followed by the end of the last one.
+        data (memoryview): utf-8 encoded clean names, one after the other.
+    """
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("clean name index out of range")
+        return str(self.data[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+
+class MappedKeywordAutomaton(KeywordAutomaton):
+    """KeywordAutomaton whose tables are read in place from a snapshot file.
+
+    When the file is memory mapped, every process loading it shares the same physical
+    pages through the page cache. Pickling the automaton only pickles the path of the
+    snapshot, which is loaded again on the other side, and refused if the file was
+    replaced meanwhile.
+
+    Attributes:
+        path (str): Snapshot file the automaton was loaded from.
+        use_mmap (bool): True if the file is memory mapped rather than read.
+        file_id (list): Inode, size and modification time of the file when it was loaded.
+    """
+
+    def __init__(self, alphabet, base, check, terminals, order, clean_names, path, use_mmap, file_id=None):
+        super(MappedKeywordAutomaton, self).__init__(alphabet, base, check, terminals, order, clean_names)
+        self.path = path
+        self.use_mmap = use_mmap
+        self.file_id = file_id
+
+    def __reduce__(self):
+        return read_automaton, (self.path, self.use_mmap, self.file_id)
+
+
+def write_snapshot(path, automaton, metadata=None):
+    """Write `automaton` to a versioned binary file.
+
+    The file starts with the magic bytes ``FLASHTXT``, the format version and the
+    length of a json header. The header holds `metadata`, the alphabet, and the
+    offset and size of every table; the tables follow, little endian and aligned
+    on 8 bytes so that they can be used in place once the file is memory mapped.
+
+    The snapshot is written to a temporary file next to `path`, which then replaces
+    it: processes that memory mapped the previous snapshot keep reading it unchanged.
+
+    Args:
+        path (str): File to write.
+        automaton (KeywordAutomaton): Automaton to save, with its failure links if they were built.
+        metadata (dict): json serializable values saved along with the automaton.
+
+    Raises:
+        TypeError: If a clean name is not a string, and the clean names are not all keyword ids.
+    """
+    tables = [('base', 'i', automaton.base), ('check', 'i', automaton.check),
+              ('terminals', 'i', automaton.terminals), ('order', 'i', automaton.order)]
+    if automaton.failure_links is not None:
+        fail, outputs, depths = automaton.failure_links
+        tables += [('fail', 'i', fail), ('outputs', 'i', outputs), ('depths', 'i', depths)]
+    clean_names = list(automaton.clean_names)
+    if clean_names and all(type(clean_name) is int for clean_name in clean_names):
+        # keyword ids, the names they stand for are saved by the caller
+        tables.append(('name_ids', 'i', clean_names))
+    else:
+        encoded_names = []
+        name_offsets = array('q', [0])
+        for clean_name in clean_names:
+            if not isinstance(clean_name, str):
+                raise TypeError("only string clean names can be saved, got {!r}".format(clean_name))
+            encoded_names.append(clean_name.encode('utf-8'))
+            name_offsets.append(name_offsets[-1] + len(encoded_names[-1]))
+        tables += [('name_offsets', 'q', name_offsets), ('names', 'B', b''.join(encoded_names))]
+
+    sections = {}
+    chunks = []
+    position = 0
+    for name, typecode, table in tables:
+        if not isinstance(table, array) or table.typecode != typecode:
+            table = array(typecode, table)
+        if sys.byteorder != 'little':
+            table = array(typecode, table)
+            table.byteswap()
+        data = table.tobytes()
+        sections[name] = [position, len(data)]
+        chunks.append(data)
+        chunks.append(bytes(_aligned(len(data)) - len(data)))
+        position += _aligned(len(data))
+    header = json.dumps({
+        'metadata': metadata or {},
+        'alphabet': automaton.alphabet,
+        'sections': sections,
+    }).encode('utf-8')
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.{}.'.format(name), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            f.write(bytes(_aligned(_PREAMBLE.size + len(header)) - _PREAMBLE.size - len(header)))
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file readable by its owner only, give it the usual mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_snapshot(path, use_mmap=True, file_id=None):
+    """Load an automaton written by `write_snapshot`.
+
+    Args:
+        path (str): File to read.
+        use_mmap (bool): Memory map the file and use the tables in place. Otherwise
+            the file is read in memory.
+        file_id (list): `MappedKeywordAutomaton.file_id` of a previous load of the file,
+            to make sure it is the same file.
+
+    Returns:
+        automaton, metadata (tuple): The MappedKeywordAutomaton and the metadata saved with it.
+
+    Raises:
+        ValueError: If the file is not a snapshot, was written in another format version,
+            or is not the file of `file_id` anymore.
+    """
+    with open(path, 'rb') as f:
+        current_file_id = _file_id(os.fstat(f.fileno()))
+        if file_id is not None and list(file_id) != current_file_id:
+            raise ValueError("{} was replaced since the snapshot was loaded".format(path))
+        if use_mmap:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+    view = memoryview(buffer)
+    if len(view) < _PREAMBLE.size:
+        raise ValueError("{} is not a flashtext snapshot".format(path))
+    magic, version, header_size = _PREAMBLE.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("{} is not a flashtext snapshot".format(path))
+    if version != VERSION:
+        raise ValueError("{} has snapshot format version {}, expected {}".format(path, version, VERSION))
+    header = json.loads(bytes(view[_PREAMBLE.size:_PREAMBLE.size + header_size]).decode('utf-8'))
+    data_start = _aligned(_PREAMBLE.size + header_size)
+
+    def table(name, typecode):
+        offset, size = header['sections'][name]
+        section = view[data_start + offset:data_start + offset + size]
+        if sys.byteorder == 'little':
+            return section.cast(typecode)
+        table = array(typecode, bytes(section))
+        table.byteswap()
+        return table
+
+    if 'name_ids' in header['sections']:
+        clean_names = table('name_ids', 'i')
+    else:
+        clean_names = MappedCleanNames(table('name_offsets', 'q'), table('names', 'B'))
+    automaton = MappedKeywordAutomaton(header['alphabet'], table('base', 'i'), table('check', 'i'),
+                                       table('terminals', 'i'), table('order', 'i'), clean_names,
+                                       path, use_mmap, current_file_id)
+    if 'fail' in header['sections']:
+        automaton.failure_links = (table('fail', 'i'), table('outputs', 'i'), table('depths', 'i'))
+    return automaton, header['metadata']
+
+
+def read_automaton(path, use_mmap=True, file_id=None):
+    """Load only the automaton of a snapshot, see `read_snapshot`."""
+    return read_snapshot(path, use_mmap, file_id)[0]
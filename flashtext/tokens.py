@@ -0,0 +1,232 @@
+import re
+from itertools import accumulate, compress, repeat
+from operator import itemgetter
+
+from flashtext.automaton import KeywordAutomaton
+
+
+def tokenize(text, word_chars):
+    """Split `text` into runs of word characters, and single word boundaries.
+
+    Args:
+        text (str): Text to split, already folded.
+        word_chars (WordCharacters): Whether a character is part of a word.
+
+    Returns:
+        tokens (list(str)): tokens of `text`, joining back into `text`.
+    """
+    tokens = []
+    start = 0
+    for idx, char in enumerate(text):
+        if not word_chars[char]:
+            if start < idx:
+                tokens.append(text[start:idx])
+            tokens.append(char)
+            start = idx + 1
+    if start < len(text):
+        tokens.append(text[start:])
+    return tokens
+
+
+def token_pattern(word_chars):
+    """Regular expression splitting folded text the way `tokenize` does.
+
+    Args:
+        word_chars (WordCharacters): Whether a folded character is part of a word.
+    """
+    char_class = ''.join(re.escape(char) for char in sorted(word_chars.non_word_boundaries))
+    if word_chars.unicode_words:
+        # \w is what str.isalnum() accepts, and the underscore
+        char_class = r'\w' + char_class
+    if not char_class:
+        return re.compile('.', re.DOTALL)
+    return re.compile('[{}]+|.'.format(char_class), re.DOTALL)
+
+
+class TokenAutomaton(object):
+    """Compiled form of a keyword trie, keyed by whole tokens instead of characters.
+
+    Keywords and sentences are split into runs of word characters and single word
+    boundaries. The keywords are compiled into a KeywordAutomaton whose alphabet is
+    made of tokens, the code of a token being its interned id. A phrase like
+    "product management techniques" is then five transitions deep instead of
+    twenty nine, and a sentence is walked a token at a time. Matches are the same
+    as on the trie of characters for the `word_chars` and `fold` the automaton was
+    built with; it is rebuilt from its own keywords if it is used with other ones.
+
+    Attributes:
+        automaton (KeywordAutomaton): Keywords compiled over their tokens.
+        token_ids (dict): Id of every token of the keywords, its code in `automaton`.
+        max_depth (int): Length of the longest keyword, in characters.
+        word_chars (WordCharacters): Word characters the keywords were split with.
+        fold (CharacterFold): Folding the sentences are matched with, None if there is none.
+
+    Examples:
+        >>> from flashtext import KeywordProcessor
+        >>> keyword_processor = KeywordProcessor()
+        >>> keyword_processor.add_keyword('product management techniques', 'product management')
+        >>> keyword_processor.compile(tokens=True)
+        >>> keyword_processor.extract_keywords('I know Product Management Techniques.')
+        >>> # ['product management']
+    """
+
+    def __init__(self, automaton, max_depth, word_chars, fold=None):
+        self.automaton = automaton
+        self.token_ids = automaton.codes
+        self.max_depth = max_depth
+        self.word_chars = word_chars
+        self.fold = fold
+        self.pattern = token_pattern(word_chars)
+        root = automaton.base[0]
+        self._first_tokens = set(token_id for token_id in self.token_ids.values()
+                                 if automaton.check[root + token_id] == 0)
+
+    @classmethod
+    def from_trie(cls, trie_dict, word_chars, fold=None, keyword='_keyword_'):
+        """Build the automaton from a trie of nested dicts.
+
+        Args:
+            trie_dict (dict): Root of the trie, as built by KeywordProcessor.
+            word_chars (WordCharacters): Whether a folded character is part of a word.
+            fold (CharacterFold): Folding applied to the sentences, None if there is none.
+            keyword (str): Key under which the clean names are stored in the trie.
+
+        Returns:
+            automaton (TokenAutomaton): compiled copy of `trie_dict`.
+        """
+        token_trie = {}
+        max_depth = 0
+        stack = [('', trie_dict)]
+        while stack:
+            term_so_far, node = stack.pop()
+            for char, child in node.items():
+                if char != keyword:
+                    stack.append((term_so_far + char, child))
+                    continue
+                max_depth = max(max_depth, len(term_so_far))
+                token_node = token_trie
+                for token in tokenize(term_so_far, word_chars):
+                    token_node = token_node.setdefault(token, {})
+                token_node[keyword] = child
+        automaton = KeywordAutomaton.from_trie(token_trie, keyword)
+        return cls(automaton, max_depth, word_chars, fold)
+
+    def __len__(self):
+        """Number of states in the automaton"""
+        return len(self.automaton)
+
+    @property
+    def clean_names(self):
+        return self.automaton.clean_names
+
+    @property
+    def nbytes(self):
+        """Memory used by the transition and terminal tables, in bytes."""
+        return self.automaton.nbytes
+
+    def to_trie(self, keyword='_keyword_'):
+        """Rebuild the trie of nested dicts the automaton was compiled from.
+
+        Args:
+            keyword (str): Key under which the clean names are stored in the trie.
+
+        Returns:
+            trie_dict (dict): Root of the rebuilt trie.
+        """
+        trie_dict = {}
+        stack = [(self.automaton.to_trie(keyword), trie_dict)]
+        while stack:
+            token_node, node = stack.pop()
+            for token, token_child in token_node.items():
+                if token == keyword:
+                    node[keyword] = token_child
+                    continue
+                child = node
+                for char in token:
+                    child = child.setdefault(char, {})
+                stack.append((token_child, child))
+        return trie_dict
+
+    def get(self, word):
+        """Return the clean name mapped to `word`, or None if `word` is not a keyword.
+
+        Args:
+            word (str): keyword to look for, already folded if matching is case insensitive.
+        """
+        return self.automaton.get(tokenize(word, self.word_chars))
+
+    def _split(self, sentence):
+        """Token ids, offsets and kinds of the tokens of `sentence`.
+
+        The sentence is folded and split as a whole, and tokens are looked up in C loops:
+        the scan itself only visits the tokens a keyword starts with.
+        """
+        fold = self.fold
+        if fold is not None and fold.lowercase:
+            folded = sentence.lower()
+            if len(folded) != len(sentence) or '\u03a3' in sentence:
+                # lower() does not fold every character on its own, like the final sigma
+                folded = fold.fold(sentence)
+            sentence = folded
+        tokens = self.pattern.findall(sentence)
+        ids = list(map(self.token_ids.get, tokens, repeat(0)))
+        offsets = [0]
+        offsets.extend(accumulate(map(len, tokens)))
+        in_word = list(map(self.word_chars.__getitem__, map(itemgetter(0), tokens)))
+        starts = compress(range(len(tokens)), map(self._first_tokens.__contains__, ids))
+        return ids, offsets, in_word, starts
+
+    def iter_matches(self, sentence, word_chars, overlapping=False, fold=None):
+        """Scan `sentence` for the longest, non overlapping keywords, a token at a time.
+
+        Args:
+            sentence (str): Line of text.
+            word_chars (WordCharacters): Whether a folded character is part of a word.
+            overlapping (bool): Report every keyword found, including the ones overlapping
+                a longer keyword, ordered by end position.
+            fold (dict): Character each character of the sentence is matched as, for
+                instance its lowercase form. Characters are matched as they are if None.
+
+        Yields:
+            clean_name, start, end (tuple): clean name and span of every keyword found.
+        """
+        tokens = self
+        if word_chars is not self.word_chars or fold is not self.fold:
+            # keywords have to be split again, the scan uses the rebuilt tables even if
+            # another thread rebuilds them meanwhile
+            tokens = TokenAutomaton.from_trie(self.to_trie(), word_chars, fold)
+            self.__dict__.update(tokens.__dict__)
+        ids, offsets, in_word, starts = tokens._split(sentence)
+        automaton = tokens.automaton
+        base, check, terminals = automaton.base, automaton.check, automaton.terminals
+        clean_names = automaton.clean_names
+        token_count = len(ids)
+        found = []
+        next_start = 0
+        for idx in starts:
+            # a keyword starts at idx if it follows a word boundary
+            if idx < next_start or (idx and in_word[idx - 1]):
+                continue
+            state = 0
+            longest = -1
+            end = idx
+            idy = idx
+            while idy < token_count:
+                child = base[state] + ids[idy]
+                if check[child] != state:
+                    break
+                state = child
+                idy += 1
+                if terminals[state] >= 0 and (idy == token_count or not in_word[idy]):
+                    # a keyword ends right before a word boundary
+                    longest = terminals[state]
+                    end = idy
+                    if overlapping:
+                        found.append((offsets[end], offsets[idx], clean_names[longest]))
+            if longest >= 0 and not overlapping:
+                yield clean_names[longest], offsets[idx], offsets[end]
+                # the boundary following the keyword is consumed with it
+                next_start = end + 1
+        found.sort(key=lambda match: match[:2])
+        for end, start, clean_name in found:
+            yield clean_name, start, end
@@ -0,0 +1,106 @@
+from flashtext import KeywordProcessor
+from flashtext import automaton
+from unittest import mock
+import heapq
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPAhoCorasick(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_extract_keywords(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor and compile it with failure links.
+        Extract keywords and check if they match the ones found by looking ahead.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            for case_sensitive in (False, True):
+                keyword_processor = KeywordProcessor(case_sensitive=case_sensitive)
+                keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+                expected = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+                keyword_processor.compile(aho_corasick=True)
+                keywords_extracted = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+                self.assertEqual(keywords_extracted, expected,
+                                 "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+
+    def test_shared_prefixes(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('a a a a b')
+        keyword_processor.add_keyword('a a')
+        sentence = 'a a a a a a a a b'
+        expected = keyword_processor.extract_keywords(sentence, span_info=True)
+        self.assertEqual(expected, [('a a', 0, 3), ('a a', 4, 7), ('a a a a b', 8, 17)])
+        keyword_processor.compile(aho_corasick=True)
+        self.assertEqual(keyword_processor.extract_keywords(sentence, span_info=True), expected)
+        self.assertEqual(keyword_processor.replace_keywords('a a a a b.'), 'a a a a b.')
+
+    def test_overlapping(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('Apple Pie', 'Pie')
+        keyword_processor.add_keyword('Big Apple Pie', 'Dessert')
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple Pie.'), ['Dessert'])
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple Pie.', span_info=True, overlapping=True),
+                         [('New York', 7, 16), ('Dessert', 7, 20), ('Pie', 11, 20)])
+        # keywords inside a word are not reported
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Applesauce.', overlapping=True), [])
+        # searching does not compile the keywords
+        self.assertIsNone(keyword_processor.automaton)
+
+    def test_overlapping_with_max_cost(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        with pytest.raises(ValueError):
+            keyword_processor.extract_keywords('I love Big Aple.', max_cost=1, overlapping=True)
+
+    def test_long_candidate_chains(self):
+        """Keywords waiting for a longer one to fail should not make the scan quadratic.
+
+        Every 'a' is a keyword while 'a a ... a b' is still being matched, so thousands
+        of them wait at once. Each of them should go through the candidate heap once,
+        and the heap should never hold more than the words of the longest keyword.
+        """
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('a')
+        keyword_processor.add_keyword('a ' * 2000 + 'b')
+        keyword_processor.compile(aho_corasick=True)
+        sentence = 'a ' * 10000
+        heap = CountingHeap()
+        with mock.patch.object(automaton, 'heapq', heap):
+            keywords_found = keyword_processor.extract_keywords(sentence)
+        self.assertEqual(len(keywords_found), 10000)
+        self.assertEqual(heap.pushes, 10000)
+        self.assertEqual(heap.pops, 10000)
+        self.assertLessEqual(heap.largest, 2001)
+
+
+class CountingHeap(object):
+    """heapq, counting the pushes and pops and the largest size reached."""
+
+    def __init__(self):
+        self.pushes = self.pops = self.largest = 0
+
+    def heappush(self, candidates, item):
+        self.pushes += 1
+        heapq.heappush(candidates, item)
+        self.largest = max(self.largest, len(candidates))
+
+    def heappop(self, candidates):
+        self.pops += 1
+        return heapq.heappop(candidates)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+from flashtext import KeywordProcessor
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool counting the calls submitted to it."""
+
+    def __init__(self):
+        super(CountingExecutor, self).__init__(1)
+        self.calls = 0
+
+    def submit(self, *args, **kwargs):
+        self.calls += 1
+        return super(CountingExecutor, self).submit(*args, **kwargs)
+
+
+class TestKPAsync(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        self.keyword_processor = KeywordProcessor()
+        for test_case in self.test_cases:
+            self.keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+        self.sentences = [test_case['sentence'] for test_case in self.test_cases]
+        self.expected = [self.keyword_processor.extract_keywords(sentence, span_info=True)
+                         for sentence in self.sentences]
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_aextract_keywords(self):
+        """Keywords extracted by concurrent tasks match the ones extracted one sentence
+        at a time, and are extracted in a few executor calls.
+        """
+        executor = CountingExecutor()
+
+        async def extract_all():
+            return await asyncio.gather(*[
+                self.keyword_processor.aextract_keywords(sentence, span_info=True, executor=executor, max_batch=16)
+                for sentence in self.sentences])
+
+        with executor:
+            self.assertEqual(asyncio.run(extract_all()), self.expected)
+        self.assertEqual(executor.calls, (len(self.sentences) + 15) // 16)
+
+    def test_aextract_keywords_error(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+
+        async def extract_all():
+            return await asyncio.gather(keyword_processor.aextract_keywords('I love Big Apple'),
+                                        keyword_processor.aextract_keywords(42),
+                                        return_exceptions=True)
+
+        results = asyncio.run(extract_all())
+        self.assertEqual(results[0], ['New York'])
+        self.assertIsInstance(results[1], TypeError)
+
+    def test_aiter_keywords(self):
+        async def texts():
+            for sentence in self.sentences:
+                await asyncio.sleep(0)
+                yield sentence
+
+        async def extract_all(texts):
+            return [keywords async for keywords in self.keyword_processor.aiter_keywords(
+                texts, span_info=True, batch_size=3, max_pending=2)]
+
+        self.assertEqual(asyncio.run(extract_all(texts())), self.expected)
+        self.assertEqual(asyncio.run(extract_all(self.sentences)), self.expected)
+
+    def test_aiter_keywords_backpressure(self):
+        """Texts are read ahead of the consumer by a bounded number only."""
+        read = []
+
+        def texts():
+            while True:
+                read.append(None)
+                yield 'I love Big Apple'
+
+        async def extract_some():
+            extracted = []
+            async for keywords in self.keyword_processor.aiter_keywords(texts(), batch_size=4, max_pending=2):
+                extracted.append(keywords)
+                if len(extracted) == 10:
+                    for _ in range(20):
+                        await asyncio.sleep(0.001)
+                    break
+            return extracted
+
+        self.assertEqual(len(asyncio.run(extract_some())), 10)
+        # the 3 batches of 4 reached by the consumer, 1 more in flight and 1 waiting for it,
+        # the queue of 8 texts, and the text waiting to be put in it
+        self.assertLessEqual(len(read), 4 * 3 + 4 + 4 + 8 + 1)
+
+    def test_aiter_keywords_error(self):
+        async def texts():
+            yield 'I love Big Apple'
+            raise IOError('connection lost')
+
+        async def extract_all():
+            return [keywords async for keywords in self.keyword_processor.aiter_keywords(texts())]
+
+        with pytest.raises(IOError):
+            asyncio.run(extract_all())
+        with pytest.raises(ValueError):
+            asyncio.run(self._consume(batch_size=0))
+
+    def test_executor_shut_down(self):
+        """Calls should fail with the error of an executor that can not take them, not hang."""
+        executor = ThreadPoolExecutor(1)
+        executor.shutdown()
+
+        async def extract_one():
+            return await asyncio.wait_for(
+                self.keyword_processor.aextract_keywords('I love Big Apple', executor=executor), 5)
+
+        async def extract_all():
+            return await asyncio.wait_for(self._consume(executor=executor), 5)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(extract_one())
+        with pytest.raises(RuntimeError):
+            asyncio.run(extract_all())
+
+    async def _consume(self, **kwargs):
+        return [keywords async for keywords in self.keyword_processor.aiter_keywords(self.sentences, **kwargs)]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPBatch(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        self.keyword_processor = KeywordProcessor()
+        for test_case in self.test_cases:
+            self.keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+        self.sentences = [test_case['sentence'] for test_case in self.test_cases]
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_extract_keywords_batch(self):
+        """Keywords extracted by the pool of processes should match the ones extracted one
+        sentence at a time, in the same order.
+        """
+        expected = [self.keyword_processor.extract_keywords(sentence, span_info=True)
+                    for sentence in self.sentences]
+        for workers in (1, 2):
+            keywords_extracted = self.keyword_processor.extract_keywords_batch(
+                iter(self.sentences), span_info=True, workers=workers, chunksize=3)
+            self.assertEqual(list(keywords_extracted), expected)
+
+    def test_extract_keywords_batch_compiled(self):
+        expected = [self.keyword_processor.extract_keywords(sentence) for sentence in self.sentences]
+        self.keyword_processor.compile(keep_trie=False)
+        keywords_extracted = self.keyword_processor.extract_keywords_batch(self.sentences, workers=2)
+        self.assertEqual(list(keywords_extracted), expected)
+
+    def test_replace_keywords_batch(self):
+        expected = [self.keyword_processor.replace_keywords(sentence) for sentence in self.sentences]
+        new_sentences = self.keyword_processor.replace_keywords_batch(self.sentences, workers=2, chunksize=1)
+        self.assertEqual(list(new_sentences), expected)
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError):
+            list(self.keyword_processor.extract_keywords_batch(self.sentences, chunksize=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
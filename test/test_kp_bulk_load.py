@@ -0,0 +1,68 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPBulkLoad(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_bulk_load_matches_add_keyword(self):
+        """For each of the test case load the keywords in bulk, and one by one.
+        Both keyword processors should hold the same keywords.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            for case_sensitive in (False, True):
+                keyword_processor = KeywordProcessor(case_sensitive=case_sensitive)
+                keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+                expected_processor = KeywordProcessor(case_sensitive=case_sensitive)
+                for clean_name, keywords in test_case['keyword_dict'].items():
+                    for keyword in keywords:
+                        expected_processor.add_keyword(keyword, clean_name)
+                self.assertEqual(keyword_processor.keyword_trie_dict, expected_processor.keyword_trie_dict,
+                                 "keyword_trie_dict don't match the expected results for test case: {}".format(test_id))
+                self.assertEqual(len(keyword_processor), len(expected_processor))
+
+    def test_bulk_load_keeps_order(self):
+        """Keywords loaded in bulk should come in the order they were given, as with add_keyword."""
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keywords_from_list(['bat', 'bar', 'apple'])
+        self.assertEqual(list(keyword_processor.get_all_keywords()), ['bat', 'bar', 'apple'])
+        # ties go to the first match in the trie
+        self.assertEqual(keyword_processor.extract_keywords('baz', max_cost=1), ['bat'])
+
+    def test_added_and_duplicates(self):
+        keyword_processor = KeywordProcessor()
+        self.assertEqual(keyword_processor.add_keywords_from_list(['java', 'Java', 'python', '']), (2, 1))
+        self.assertEqual(keyword_processor.add_keywords_from_dict({'Python': ['python', 'py']}), (1, 1))
+        self.assertEqual(len(keyword_processor), 3)
+        # the last clean name given for a keyword wins
+        self.assertEqual(keyword_processor.get_keyword('python'), 'Python')
+        self.assertEqual(keyword_processor.get_keyword('java'), 'Java')
+
+    def test_file_added_and_duplicates(self):
+        keyword_processor = KeywordProcessor()
+        self.assertEqual(keyword_processor.add_keyword_from_file('test/keywords_format_one.txt'), (4, 0))
+        self.assertEqual(keyword_processor.add_keyword_from_file('test/keywords_format_two.txt'), (1, 1))
+        self.assertEqual(len(keyword_processor), 5)
+
+    def test_bulk_load_discards_automaton(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('j2ee', 'Java')
+        keyword_processor.compile(keep_trie=False)
+        keyword_processor.add_keywords_from_list(['python'])
+        self.assertIsNone(keyword_processor.automaton)
+        self.assertEqual(keyword_processor.extract_keywords('I use j2ee and python'), ['Java', 'python'])
+
+
+if __name__ == '__main__':
+    unittest.main()
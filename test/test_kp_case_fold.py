@@ -0,0 +1,45 @@
+from flashtext import KeywordProcessor
+from flashtext.characters import CharacterFold
+import logging
+import unittest
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPCaseFold(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_fold_keeps_length(self):
+        fold = CharacterFold()
+        self.assertEqual(fold.fold('Big APPLE'), 'big apple')
+        # 'İ'.lower() is two characters long
+        self.assertEqual(fold.fold('İstanbul'), 'İstanbul')
+        self.assertEqual(CharacterFold(lowercase=False).fold('Big APPLE'), 'Big APPLE')
+
+    def test_spans_index_original_sentence(self):
+        sentence = 'İİ Big Apple and İstanbul'
+        for compile_mode in (None, False, True):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keyword('Big Apple', 'New York')
+            keyword_processor.add_keyword('İSTANBUL', 'Istanbul')
+            if compile_mode is not None:
+                keyword_processor.compile(aho_corasick=compile_mode)
+            keywords_extracted = keyword_processor.extract_keywords(sentence, span_info=True)
+            self.assertEqual(keywords_extracted, [('New York', 3, 12), ('Istanbul', 17, 25)])
+            for clean_name, start, end in keywords_extracted:
+                self.assertEqual(keyword_processor.get_keyword(sentence[start:end]), clean_name)
+            self.assertEqual(keyword_processor.replace_keywords(sentence), 'İİ New York and Istanbul')
+
+    def test_replace_keeps_case_of_other_text(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('big apple', 'New York')
+        self.assertEqual(keyword_processor.replace_keywords('I LOVE BIG APPLE.'), 'I LOVE New York.')
+        self.assertEqual(keyword_processor.replace_keywords('I LOVE BIG APLE.', max_cost=1), 'I LOVE New York.')
+
+
+if __name__ == '__main__':
+    unittest.main()
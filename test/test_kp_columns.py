@@ -0,0 +1,73 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPColumns(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        self.keyword_processor = KeywordProcessor(keyword_ids=True)
+        for test_case in self.test_cases:
+            self.keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+        # a missing row between every sentence
+        self.rows = []
+        for test_case in self.test_cases:
+            self.rows.extend([test_case['sentence'], None])
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def expected_columns(self, rows, max_cost=0):
+        """Columns of the keywords extracted row by row."""
+        columns = ([], [], [], [])
+        for row, sentence in enumerate(rows):
+            for keyword_id, start, end in self.keyword_processor.extract_keywords(
+                    sentence, span_info=True, max_cost=max_cost):
+                for column, value in zip(columns, (row, start, end, keyword_id)):
+                    column.append(value)
+        return columns
+
+    def assert_columns(self, columns, expected):
+        self.assertEqual(tuple(list(column) for column in columns), expected)
+
+    def test_extract_arrow_column(self):
+        pyarrow = pytest.importorskip('pyarrow')
+        expected = self.expected_columns(self.rows)
+        column = pyarrow.array(self.rows)
+        self.assert_columns(self.keyword_processor.extract_column(column), expected)
+        self.assert_columns(self.keyword_processor.extract_column(pyarrow.array(self.rows, pyarrow.large_string())),
+                            expected)
+        chunked = pyarrow.chunked_array([column.slice(0, 7), column.slice(7)])
+        self.assert_columns(self.keyword_processor.extract_column(chunked), expected)
+        self.assert_columns(self.keyword_processor.extract_column(column, max_cost=1),
+                            self.expected_columns(self.rows, max_cost=1))
+        with pytest.raises(TypeError):
+            self.keyword_processor.extract_column(pyarrow.array([1, 2]))
+
+    def test_extract_numpy_column(self):
+        numpy = pytest.importorskip('numpy')
+        expected = self.expected_columns(self.rows)
+        self.assert_columns(self.keyword_processor.extract_column(numpy.array(self.rows, dtype=object)), expected)
+        sentences = [row or '' for row in self.rows]
+        self.assert_columns(self.keyword_processor.extract_column(numpy.array(sentences)), expected)
+        with pytest.raises(TypeError):
+            self.keyword_processor.extract_column(numpy.arange(3))
+        with pytest.raises(ValueError):
+            self.keyword_processor.extract_column(numpy.array([sentences]))
+
+    def test_extract_column_errors(self):
+        with pytest.raises(TypeError):
+            self.keyword_processor.extract_column(self.rows)
+        keyword_processor = KeywordProcessor()
+        with pytest.raises(ValueError):
+            keyword_processor.extract_column(self.rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import json
+import re
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPCompile(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_extract_keywords_compiled(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor and compile it.
+        Extract keywords and check if they match the expected result for the test case.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            for case_sensitive, expected in ((False, 'keywords'), (True, 'keywords_case_sensitive')):
+                keyword_processor = KeywordProcessor(case_sensitive=case_sensitive)
+                keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+                keyword_processor.compile()
+                keywords_extracted = keyword_processor.extract_keywords(test_case['sentence'])
+                self.assertEqual(keywords_extracted, test_case[expected],
+                                 "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+
+    def test_extract_span_compiled(self):
+        """Spans found on the automaton should match the ones found on the trie dict.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            expected = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+            keyword_processor.compile()
+            keywords_extracted = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+            self.assertEqual(keywords_extracted, expected,
+                             "keywords span don't match the expected results for test case: {}".format(test_id))
+
+    def test_replace_keywords_compiled(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor and compile it.
+        Replace keywords and check if they match the expected result for the test case.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_replacer = KeywordProcessor()
+            for key, values in test_case['keyword_dict'].items():
+                for value in values:
+                    keyword_replacer.add_keyword(value, key.replace(" ", "_"))
+            keyword_replacer.compile()
+            new_sentence = keyword_replacer.replace_keywords(test_case['sentence'])
+
+            replaced_sentence = test_case['sentence']
+            keyword_mapping = {}
+            for val in test_case['keyword_dict']:
+                for value in test_case['keyword_dict'][val]:
+                    keyword_mapping[value] = val.replace(" ", "_")
+            for key in sorted(keyword_mapping, key=len, reverse=True):
+                lowercase = re.compile(r'(?<!\w){}(?!\w)'.format(re.escape(key)))
+                replaced_sentence = lowercase.sub(keyword_mapping[key], replaced_sentence)
+
+            self.assertEqual(new_sentence, replaced_sentence,
+                             "new_sentence don't match the expected results for test case: {}".format(test_id))
+
+    def test_compile_without_trie(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('j2ee', 'Java')
+        keyword_processor.add_keyword('colour', 'color')
+        keyword_processor.compile(keep_trie=False)
+        self.assertEqual(len(keyword_processor), 2)
+        self.assertTrue('J2EE' in keyword_processor)
+        self.assertEqual(keyword_processor['colour'], 'color')
+        self.assertIsNone(keyword_processor['colou'])
+        self.assertEqual(keyword_processor.extract_keywords('I use J2EE in colour'), ['Java', 'color'])
+        self.assertEqual(keyword_processor.get_all_keywords(), {'j2ee': 'Java', 'colour': 'color'})
+
+    def test_mutation_discards_automaton(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('j2ee', 'Java')
+        keyword_processor.compile(keep_trie=False)
+        keyword_processor.add_keyword('colour', 'color')
+        self.assertIsNone(keyword_processor.automaton)
+        self.assertEqual(keyword_processor.extract_keywords('I use J2EE in colour'), ['Java', 'color'])
+        keyword_processor.compile()
+        keyword_processor.remove_keyword('j2ee')
+        self.assertIsNone(keyword_processor.automaton)
+        self.assertEqual(keyword_processor.extract_keywords('I use J2EE in colour'), ['color'])
+
+    def test_fuzzy_after_compile(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('skype', 'messenger')
+        keyword_processor.compile(keep_trie=False)
+        self.assertEqual(keyword_processor.extract_keywords('do you have skpe ?', max_cost=1), ['messenger'])
+
+    def test_clean_names_interned(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keywords_from_dict({'java': ['java_2e', 'java programing', 'j2ee']})
+        automaton = keyword_processor.compile()
+        self.assertEqual(automaton.clean_names, ['java'])
+        self.assertGreater(automaton.nbytes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
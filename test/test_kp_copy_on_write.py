@@ -0,0 +1,119 @@
+from flashtext import KeywordProcessor
+import logging
+import threading
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPCopyOnWrite(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_remover_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_remove_keywords(self):
+        """For each of the test case initialize a new KeywordProcessor with copy on write.
+        Add the keywords the test case to KeywordProcessor, remove the keywords in remove_keyword_dict.
+        Check the extracted keywords match the expected result, and the first version is unchanged.
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor(copy_on_write=True)
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            trie_dict = keyword_processor.keyword_trie_dict
+            all_keywords = keyword_processor.get_all_keywords()
+            keyword_processor.remove_keywords_from_dict(test_case['remove_keyword_dict'])
+            keywords_extracted = keyword_processor.extract_keywords(test_case['sentence'])
+            self.assertEqual(keywords_extracted, test_case['keywords'],
+                             "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+            self.assertEqual(keyword_processor.get_all_keywords(current_dict=trie_dict), all_keywords,
+                             "previous version changed for test case: {}".format(test_id))
+
+    def test_batch_updates(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keywords_from_dict({'New York': ['Big Apple', 'NYC'], 'Bay Area': ['SF']})
+        keyword_processor.compile()
+        version = keyword_processor.version
+        with keyword_processor.batch_updates():
+            keyword_processor.add_keyword('Empire City', 'New York')
+            keyword_processor.remove_keyword('NYC')
+            with keyword_processor.batch_updates():
+                keyword_processor.add_keywords_from_list(['LA'])
+            # nothing is visible before the block ends
+            self.assertEqual(keyword_processor.extract_keywords('NYC, Empire City and LA'), ['New York'])
+            self.assertEqual(len(keyword_processor), 3)
+            self.assertIsNotNone(keyword_processor.automaton)
+        self.assertEqual(keyword_processor.version, version + 1)
+        self.assertIsNone(keyword_processor.automaton)
+        self.assertEqual(keyword_processor.extract_keywords('NYC, Empire City and LA'), ['New York', 'LA'])
+        self.assertEqual(len(keyword_processor), 4)
+
+    def test_batch_updates_error(self):
+        keyword_processor = KeywordProcessor(copy_on_write=True)
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        with pytest.raises(KeyError):
+            with keyword_processor.batch_updates():
+                keyword_processor.add_keyword('NYC', 'New York')
+                raise KeyError('NYC')
+        self.assertEqual(keyword_processor.get_all_keywords(), {'big apple': 'New York'})
+        self.assertEqual(len(keyword_processor), 1)
+        self.assertEqual(keyword_processor.version, 1)
+        with pytest.raises(ValueError):
+            keyword_processor.compile(keep_trie=False)
+
+    def test_minimized_versions(self):
+        keyword_processor = KeywordProcessor(copy_on_write=True)
+        keyword_processor.add_keywords_from_dict({'city': ['springfield', 'greenfield', 'mansfield']})
+        keyword_processor.minimize()
+        trie_dict = keyword_processor.keyword_trie_dict
+        with keyword_processor.batch_updates():
+            keyword_processor.add_keyword('greenfields', 'town')
+            keyword_processor.minimize()
+            keyword_processor.add_keyword('springfields', 'town')
+        self.assertEqual(keyword_processor.get_all_keywords(current_dict=trie_dict),
+                         {'springfield': 'city', 'greenfield': 'city', 'mansfield': 'city'})
+        self.assertEqual(keyword_processor.extract_keywords('springfields greenfields mansfields'),
+                         ['town', 'town'])
+
+    def test_concurrent_readers(self):
+        """Readers extracting keywords while a writer adds and removes them in pairs
+        always see both keywords of a pair or none of them.
+        """
+        keyword_processor = KeywordProcessor(copy_on_write=True)
+        sentence = ' '.join('left{0} right{0}'.format(idx) for idx in range(50))
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                keywords = keyword_processor.extract_keywords(sentence)
+                if len(keywords) % 2 or keywords[::2] != [keyword.replace('right', 'left') for keyword in keywords[1::2]]:
+                    errors.append(keywords)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        try:
+            for idx in range(200):
+                with keyword_processor.batch_updates():
+                    keyword_processor.add_keyword('left{}'.format(idx % 50))
+                    keyword_processor.add_keyword('right{}'.format(idx % 50))
+                if idx % 3 == 0:
+                    with keyword_processor.batch_updates():
+                        keyword_processor.remove_keywords_from_list(['left{}'.format(idx % 7), 'right{}'.format(idx % 7)])
+                if idx % 50 == 0:
+                    keyword_processor.compile()
+        finally:
+            done.set()
+            for reader in readers:
+                reader.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
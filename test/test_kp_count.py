@@ -0,0 +1,63 @@
+from flashtext import KeywordProcessor
+from collections import Counter
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPCount(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_count_keywords(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor.
+        Count keywords, before and after compiling, and check they match the extracted keywords.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            expected = Counter(test_case['keywords'])
+            self.assertEqual(keyword_processor.count_keywords(test_case['sentence']), expected,
+                             "keywords counted don't match the expected results for test case: {}".format(test_id))
+            keyword_processor.compile()
+            self.assertEqual(keyword_processor.count_keywords(test_case['sentence']), expected,
+                             "keywords counted don't match the expected results for test case: {}".format(test_id))
+
+    def test_count_keywords_batch(self):
+        keyword_processor = KeywordProcessor()
+        sentences = []
+        expected = Counter()
+        for test_case in self.test_cases:
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+        for test_case in self.test_cases:
+            sentences.append(test_case['sentence'])
+            expected.update(keyword_processor.extract_keywords(test_case['sentence']))
+        for workers in (1, 2):
+            self.assertEqual(keyword_processor.count_keywords_batch(sentences, workers=workers, chunksize=3), expected)
+        self.assertEqual(keyword_processor.count_keywords_batch(iter([]), workers=2), Counter())
+        with pytest.raises(ValueError):
+            keyword_processor.count_keywords_batch(sentences, chunksize=0)
+
+    def test_count_into_counter(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('NYC', 'New York')
+        counter = Counter({'Bay Area': 1})
+        self.assertIs(keyword_processor.count_keywords('NYC or Big Apple.', counter=counter), counter)
+        self.assertEqual(counter, Counter({'New York': 2, 'Bay Area': 1}))
+        self.assertEqual(keyword_processor.count_keywords('Big Aple', max_cost=1), Counter({'New York': 1}))
+        self.assertEqual(keyword_processor.count_keywords(''), Counter())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPFindFirst(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_find_first(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor.
+        Check the first keyword found is the first one extracted, in every compiled form.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            sentence = test_case['sentence']
+            keywords_extracted = keyword_processor.extract_keywords(sentence, span_info=True)
+            expected = keywords_extracted[0] if keywords_extracted else None
+            for compile_kwargs in (None, {}, {'aho_corasick': True}, {'tokens': True}):
+                if compile_kwargs is not None:
+                    keyword_processor.compile(**compile_kwargs)
+                self.assertEqual(keyword_processor.find_first(sentence, span_info=True), expected,
+                                 "first keyword doesn't match for test case: {}".format(test_id))
+                self.assertEqual(keyword_processor.find_first(sentence), expected and expected[0])
+                self.assertEqual(keyword_processor.contains_any(sentence), expected is not None)
+
+    def test_longest_match_first(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('Big Apple Pie', 'Pie')
+        keyword_processor.add_keyword('Bay Area')
+        self.assertEqual(keyword_processor.find_first('Big Apple Pie in the Bay Area', span_info=True),
+                         ('Pie', 0, 13))
+        self.assertEqual(keyword_processor.find_first('a Big Aple in the Bay Area', max_cost=1), 'New York')
+        self.assertTrue(keyword_processor.contains_any('Bay Aea', max_cost=1))
+
+    def test_no_keyword(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        for sentence in ('', None, 'I love Paris.'):
+            self.assertIsNone(keyword_processor.find_first(sentence))
+            self.assertFalse(keyword_processor.contains_any(sentence))
+
+
+if __name__ == '__main__':
+    unittest.main()
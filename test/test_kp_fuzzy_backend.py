@@ -0,0 +1,70 @@
+from flashtext import KeywordProcessor
+from flashtext.fuzzy import DeletionIndexMatcher
+import functools
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPFuzzyBackend(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_backends_agree(self):
+        """For each of the test case initialize a KeywordProcessor per fuzzy backend.
+        Extract and replace keywords with typos in the sentence, and check every
+        backend finds the same keywords.
+
+        """
+        backends = ['trie', 'deletions', functools.partial(DeletionIndexMatcher, max_indexed_cost=2)]
+        for test_id, test_case in enumerate(self.test_cases):
+            # drop a character of every word
+            sentence = ' '.join(word[1:] if len(word) > 3 else word for word in test_case['sentence'].split(' '))
+            for max_cost in (1, 2):
+                results = []
+                for backend in backends:
+                    keyword_processor = KeywordProcessor(fuzzy_backend=backend)
+                    keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+                    keyword_processor.compile()
+                    results.append((keyword_processor.extract_keywords(sentence, span_info=True, max_cost=max_cost),
+                                    keyword_processor.replace_keywords(sentence, max_cost=max_cost)))
+                for result in results[1:]:
+                    self.assertEqual(result, results[0],
+                                     "fuzzy backends disagree for test case: {}".format(test_id))
+
+    def test_deletion_index_search(self):
+        keyword_processor = KeywordProcessor(fuzzy_backend='deletions')
+        keyword_processor.add_keyword('skype', 'messenger')
+        keyword_processor.add_keyword('colour here', 'couleur ici')
+        self.assertEqual(keyword_processor.extract_keywords('do you have kype ?', max_cost=1), ['messenger'])
+        self.assertEqual(keyword_processor.extract_keywords('do you have ype ?', max_cost=1), [])
+        self.assertEqual(keyword_processor.extract_keywords('olor here', max_cost=2), ['couleur ici'])
+        node, cost, depth = next(keyword_processor.levensthein('sktpe', max_cost=1))
+        self.assertEqual((node, cost, depth), ({'_keyword_': 'messenger'}, 1, 5))
+
+    def test_index_follows_keywords(self):
+        keyword_processor = KeywordProcessor(fuzzy_backend='deletions')
+        keyword_processor.add_keyword('skype', 'messenger')
+        keyword_processor.compile()
+        self.assertEqual(keyword_processor.extract_keywords('kype', max_cost=1), ['messenger'])
+        keyword_processor.add_keyword('hype')
+        self.assertEqual(keyword_processor.extract_keywords('ype', max_cost=1), ['hype'])
+        keyword_processor.remove_keyword('hype')
+        keyword_processor.remove_keyword('skype')
+        self.assertEqual(keyword_processor.extract_keywords('ype kype', max_cost=1), [])
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            KeywordProcessor(fuzzy_backend='bk-tree')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPFuzzyBest(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_lowest_cost_match(self):
+        """The first keyword of the trie is two edits away, the second one only one.
+        The closest keyword is extracted and replaced, whatever the backend.
+
+        """
+        for fuzzy_backend in ('trie', 'deletions'):
+            keyword_processor = KeywordProcessor(fuzzy_backend=fuzzy_backend)
+            keyword_processor.add_keyword('abcy', 'far')
+            keyword_processor.add_keyword('cbxy', 'close')
+            self.assertEqual(keyword_processor.extract_keywords('qbxy', span_info=True, max_cost=2),
+                             [('close', 0, 4)])
+            self.assertEqual(keyword_processor.replace_keywords('I said qbxy.', max_cost=2), 'I said close.')
+            # the depth first walk still yields in trie order
+            node, cost, depth = next(keyword_processor.levensthein('qbxy', max_cost=2))
+            self.assertEqual((node, cost, depth), ({'_keyword_': 'far'}, 2, 4))
+
+    def test_match_below_a_match(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('ab', 'short')
+        keyword_processor.add_keyword('ab cd', 'long')
+        matcher = keyword_processor._fuzzy_matcher_for_trie()
+        node, cost, depth = matcher.best_match('abcd', max_cost=2)
+        self.assertEqual((node, cost, depth), ({'_keyword_': 'long'}, 1, 5))
+        node, cost, depth = next(matcher.search('abcd', max_cost=2))
+        self.assertEqual((node['_keyword_'], cost, depth), ('short', 2, 2))
+
+    def test_ties_go_to_trie_order(self):
+        for keywords in (('abcx', 'abcy'), ('abcy', 'abcx')):
+            keyword_processor = KeywordProcessor()
+            for keyword in keywords:
+                keyword_processor.add_keyword(keyword)
+            self.assertEqual(keyword_processor.extract_keywords('qbcz', max_cost=2), [keywords[0]])
+
+    def test_no_match(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('skype')
+        matcher = keyword_processor._fuzzy_matcher_for_trie()
+        self.assertIsNone(matcher.best_match('phone', max_cost=2))
+        self.assertEqual(keyword_processor.extract_keywords('phone', max_cost=2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+from flashtext import KeywordProcessor
+import logging
+import pickle
+import unittest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPFuzzyCache(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_cache_keeps_results(self):
+        """For each of the test case initialize a KeywordProcessor with and without a cache.
+        Extract and replace keywords with typos twice, and check the cached results are
+        the ones found without the cache.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            sentence = ' '.join(word[:-1] if len(word) > 3 else word for word in test_case['sentence'].split(' '))
+            cached = KeywordProcessor()
+            cached.add_keywords_from_dict(test_case['keyword_dict'])
+            uncached = KeywordProcessor(fuzzy_cache_size=0)
+            uncached.add_keywords_from_dict(test_case['keyword_dict'])
+            expected = (uncached.extract_keywords(sentence, span_info=True, max_cost=1),
+                        uncached.replace_keywords(sentence, max_cost=1))
+            for _ in range(2):
+                self.assertEqual((cached.extract_keywords(sentence, span_info=True, max_cost=1),
+                                  cached.replace_keywords(sentence, max_cost=1)), expected,
+                                 "cached fuzzy results differ for test case: {}".format(test_id))
+            self.assertEqual(len(uncached.fuzzy_cache), 0)
+            self.assertEqual(uncached.fuzzy_cache.hits, 0)
+
+    def test_hits_and_misses(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('skype', 'messenger')
+        self.assertEqual(keyword_processor.extract_keywords('skpe', max_cost=1), ['messenger'])
+        self.assertEqual((keyword_processor.fuzzy_cache.hits, keyword_processor.fuzzy_cache.misses), (0, 1))
+        self.assertEqual(keyword_processor.extract_keywords('skpe skpe', max_cost=1), ['messenger', 'messenger'])
+        self.assertEqual((keyword_processor.fuzzy_cache.hits, keyword_processor.fuzzy_cache.misses), (2, 1))
+        keyword_processor.fuzzy_cache.clear()
+        self.assertEqual((keyword_processor.fuzzy_cache.hits, keyword_processor.fuzzy_cache.misses), (0, 0))
+        self.assertEqual(len(keyword_processor.fuzzy_cache), 0)
+
+    def test_invalidated_by_keyword_changes(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('skype', 'messenger')
+        self.assertEqual(keyword_processor.extract_keywords('skpe', max_cost=1), ['messenger'])
+        keyword_processor.remove_keyword('skype')
+        self.assertEqual(keyword_processor.extract_keywords('skpe', max_cost=1), [])
+        keyword_processor.add_keyword('skype', 'phone')
+        self.assertEqual(keyword_processor.extract_keywords('skpe', max_cost=1), ['phone'])
+        keyword_processor.compile(keep_trie=False)
+        self.assertEqual(keyword_processor.extract_keywords('skpe', max_cost=1), ['phone'])
+
+    def test_bounded_size(self):
+        keyword_processor = KeywordProcessor(fuzzy_cache_size=2)
+        keyword_processor.add_keyword('skype', 'messenger')
+        keyword_processor.extract_keywords('skpe skye sype kype', max_cost=1)
+        self.assertEqual(len(keyword_processor.fuzzy_cache), 2)
+        # least recently used searches were dropped
+        keyword_processor.extract_keywords('skpe', max_cost=1)
+        self.assertEqual(keyword_processor.fuzzy_cache.hits, 0)
+
+    def test_pickle(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('skype', 'messenger')
+        keyword_processor.extract_keywords('skpe', max_cost=1)
+        unpickled = pickle.loads(pickle.dumps(keyword_processor))
+        self.assertEqual(len(unpickled.fuzzy_cache), 0)
+        self.assertEqual(unpickled.extract_keywords('skpe', max_cost=1), ['messenger'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+from flashtext import KeywordProcessor
+from array import array
+from collections import Counter
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPKeywordIds(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+        logger.info("Ending.")
+
+    def test_add_keyword_returns_id(self):
+        keyword_processor = KeywordProcessor(keyword_ids=True)
+        self.assertEqual(keyword_processor.add_keyword('Big Apple', 'New York'), 0)
+        self.assertEqual(keyword_processor.add_keyword('Bay Area'), 1)
+        self.assertEqual(keyword_processor.add_keyword('NYC', 'New York'), 0)
+        self.assertEqual(keyword_processor.clean_names, ['New York', 'Bay Area'])
+        self.assertEqual(keyword_processor.get_keyword('nyc'), 0)
+        self.assertEqual(keyword_processor.get_all_keywords(), {'big apple': 0, 'bay area': 1, 'nyc': 0})
+
+    def test_extract_keyword_ids(self):
+        """For each of the test case initialize a new KeywordProcessor with keyword ids.
+        Add the keywords the test case to KeywordProcessor.
+        Extract ids, from the trie and every compiled form, and check their clean names match the expected results.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            for compile_kwargs in (None, {}, {'aho_corasick': True}, {'tokens': True}):
+                keyword_processor = KeywordProcessor(keyword_ids=True)
+                keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+                if compile_kwargs is not None:
+                    keyword_processor.compile(**compile_kwargs)
+                keyword_ids = keyword_processor.extract_keywords(test_case['sentence'])
+                names = [keyword_processor.clean_names[keyword_id] for keyword_id in keyword_ids]
+                self.assertEqual(names, test_case['keywords'],
+                                 "keywords extracted don't match the expected results for test case: {}".format(test_id))
+                self.assertEqual(keyword_processor.extract_keywords(test_case['sentence'], as_array=True),
+                                 array('i', keyword_ids))
+
+    def test_extract_as_array(self):
+        keyword_processor = KeywordProcessor(keyword_ids=True)
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('Bay Area')
+        sentence = 'I love Big Apple and Bay Area.'
+        self.assertEqual(keyword_processor.extract_keywords(sentence, span_info=True), [(0, 7, 16), (1, 21, 29)])
+        self.assertEqual(keyword_processor.extract_keywords(sentence, span_info=True, as_array=True),
+                         array('i', [0, 7, 16, 1, 21, 29]))
+        self.assertEqual(keyword_processor.extract_keywords('', as_array=True), array('i'))
+        with pytest.raises(ValueError):
+            KeywordProcessor().extract_keywords(sentence, as_array=True)
+
+    def test_replace_and_count(self):
+        keyword_processor = KeywordProcessor(keyword_ids=True)
+        keyword_processor.add_keywords_from_dict({'New York': ['Big Apple', 'NYC'], 'Bay Area': ['SF']})
+        sentence = 'NYC, SF and the Big Apple.'
+        self.assertEqual(keyword_processor.replace_keywords(sentence), 'New York, Bay Area and the New York.')
+        self.assertEqual(keyword_processor.replace_keywords(sentence, repl=lambda name, *_: name.upper()),
+                         'NEW YORK, BAY AREA and the NEW YORK.')
+        self.assertEqual(keyword_processor.count_keywords(sentence), Counter({0: 2, 1: 1}))
+        self.assertEqual(keyword_processor.find_first(sentence), 0)
+
+    def test_bulk_add(self):
+        keyword_processor = KeywordProcessor(keyword_ids=True)
+        keyword_processor.add_keywords_from_list(['java', 'python', 'java'])
+        self.assertEqual(keyword_processor.clean_names, ['java', 'python'])
+        self.assertEqual(keyword_processor.extract_keywords('python or java'), [1, 0])
+
+    def test_snapshot(self):
+        keyword_processor = KeywordProcessor(keyword_ids=True)
+        keyword_processor.add_keywords_from_dict({'New York': ['Big Apple', 'NYC'], 'Bay Area': ['SF']})
+        path = os.path.join(self.tmp_dir, 'keywords.flashtext')
+        keyword_processor.save(path)
+        loaded = KeywordProcessor.load(path)
+        self.assertTrue(loaded.keyword_ids)
+        self.assertEqual(loaded.clean_names, ['New York', 'Bay Area'])
+        self.assertEqual(loaded.extract_keywords('SF and NYC'), [1, 0])
+        self.assertEqual(loaded.replace_keywords('SF and NYC'), 'Bay Area and New York')
+        self.assertEqual(loaded.add_keyword('Empire City', 'New York'), 0)
+        self.assertEqual(loaded.extract_keywords('SF and Empire City'), [1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+from flashtext import KeywordProcessor
+from flashtext.dawg import minimize_trie, trie_size
+import logging
+import unittest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPMinimize(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        with open('test/keyword_remover_test_cases.json') as f:
+            self.remover_test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_extract_keywords(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor and minimize the trie.
+        Extract keywords, from the trie and compiled, and check if they match the expected result for the test case.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            all_keywords = keyword_processor.get_all_keywords()
+            keyword_processor.minimize()
+            self.assertEqual(keyword_processor.get_all_keywords(), all_keywords)
+            self.assertEqual(keyword_processor.extract_keywords(test_case['sentence']), test_case['keywords'],
+                             "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+            keyword_processor.compile()
+            self.assertEqual(keyword_processor.extract_keywords(test_case['sentence']), test_case['keywords'],
+                             "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+
+    def test_remove_keywords(self):
+        """For each of the remover test case, minimize the trie before removing the keywords.
+        Removing a keyword must not remove the keywords sharing its nodes.
+
+        """
+        for test_id, test_case in enumerate(self.remover_test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            keyword_processor.minimize()
+            keyword_processor.remove_keywords_from_dict(test_case['remove_keyword_dict'])
+            self.assertEqual(keyword_processor.extract_keywords(test_case['sentence']), test_case['keywords'],
+                             "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+
+    def test_shared_suffixes(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keywords_from_dict({'city': ['springfield', 'greenfield', 'mansfield']})
+        sizes = keyword_processor.minimize()
+        self.assertEqual((sizes['nodes_before'], sizes['nodes_after']), (31, 19))
+        self.assertLess(sizes['nbytes_after'], sizes['nbytes_before'])
+        trie_dict = keyword_processor.keyword_trie_dict
+        self.assertIs(trie_dict['s']['p']['r']['i']['n']['g'], trie_dict['g']['r']['e']['e']['n'])
+        # changing a keyword leaves the keywords it shared nodes with unchanged
+        keyword_processor.add_keyword('greenfields', 'town')
+        keyword_processor.add_keyword('mansfield', 'town')
+        keyword_processor.remove_keyword('springfield')
+        self.assertEqual(keyword_processor.get_all_keywords(),
+                         {'greenfield': 'city', 'greenfields': 'town', 'mansfield': 'town'})
+        keyword_processor.add_keywords_from_list(['springfield'])
+        self.assertEqual(keyword_processor.extract_keywords('Springfield, Greenfield and Mansfield'),
+                         ['springfield', 'city', 'town'])
+
+    def test_clean_names_are_kept(self):
+        trie_dict = {}
+        for keyword, clean_name in [('ab', 'x'), ('cb', 'y'), ('db', 'x')]:
+            node = trie_dict
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node['_keyword_'] = clean_name
+        minimize_trie(trie_dict)
+        self.assertIs(trie_dict['a'], trie_dict['d'])
+        self.assertIsNot(trie_dict['a'], trie_dict['c'])
+        self.assertEqual(trie_size(trie_dict), (5, trie_size(trie_dict)[1]))
+
+    def test_fuzzy_extract(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keywords_from_dict({'city': ['springfield', 'greenfield'], 'town': ['mansfield']})
+        keyword_processor.extract_keywords('springfeld', max_cost=1)
+        keyword_processor.minimize()
+        self.assertEqual(keyword_processor.extract_keywords('Sprinfield and Mansfeld', max_cost=1), ['city', 'town'])
+
+
+if __name__ == '__main__':
+    unittest.main()
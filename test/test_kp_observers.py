@@ -0,0 +1,119 @@
+from flashtext import KeywordProcessor
+from flashtext.observe import LatencyHistogram, SlowestInputs
+import io
+import logging
+import pickle
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPObservers(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        self.keyword_processor = KeywordProcessor()
+        for test_case in self.test_cases:
+            self.keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_observers_called(self):
+        """Observers should get every extract and replace call, with what it returned."""
+        calls = []
+        self.keyword_processor.observers.append(lambda *call: calls.append(call))
+        for test_case in self.test_cases:
+            sentence = test_case['sentence']
+            keywords_extracted = self.keyword_processor.extract_keywords(sentence)
+            self.keyword_processor.replace_keywords(sentence)
+            extract_call, replace_call = calls[-2:]
+            self.assertEqual(extract_call[:3], ('extract_keywords', len(sentence), len(keywords_extracted)))
+            self.assertEqual(replace_call[:3], ('replace_keywords', len(sentence), len(keywords_extracted)))
+            self.assertEqual(len(extract_call), 4)
+            self.assertGreaterEqual(extract_call[3], 0)
+        self.assertEqual(len(calls), 2 * len(self.test_cases))
+
+        # the processor still pickles, without its observers
+        keyword_processor = pickle.loads(pickle.dumps(self.keyword_processor))
+        self.assertEqual(keyword_processor.observers, [])
+
+    def test_observers_streams(self):
+        """Reading a stream should not report every chunk searched as a call."""
+        calls = []
+        self.keyword_processor.observers.append(lambda *call: calls.append(call))
+        text = ' '.join(test_case['sentence'] for test_case in self.test_cases[:5])
+        self.keyword_processor.extract_keywords_from_stream(io.StringIO(text), chunk_size=8)
+        self.keyword_processor.replace_keywords_stream(io.StringIO(text), io.StringIO(), chunk_size=8)
+        self.assertEqual(calls, [])
+
+    def test_observers_text(self):
+        """Only observers that ask for it should get the text searched."""
+        texts = []
+
+        def text_observer(operation, input_length, match_count, elapsed_ns, text=None):
+            texts.append(text)
+        text_observer.wants_text = True
+        self.keyword_processor.observers.append(text_observer)
+        self.keyword_processor.observers.append(lambda operation, input_length, match_count, elapsed_ns: None)
+        self.keyword_processor.replace_keywords('I love Big Apple.')
+        self.assertEqual(texts, ['I love Big Apple.'])
+
+    def test_observers_raising(self):
+        """An observer that raises should be logged, without breaking the call or the other observers."""
+        sentence = self.test_cases[0]['sentence']
+        keywords_extracted = self.keyword_processor.extract_keywords(sentence)
+        calls = []
+
+        def broken_observer(operation, input_length, match_count, elapsed_ns):
+            raise RuntimeError('broken')
+        self.keyword_processor.observers.append(broken_observer)
+        self.keyword_processor.observers.append(lambda *call: calls.append(call))
+        with self.assertLogs('flashtext.keyword', level='ERROR') as logs:
+            self.assertEqual(self.keyword_processor.extract_keywords(sentence), keywords_extracted)
+        self.assertIn('broken', logs.output[0])
+        self.assertEqual(len(calls), 1)
+
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram()
+        for elapsed_ns in (0, 1, 3, 900, 1000, 1100, 10 ** 6):
+            histogram('extract_keywords', 10, 1, elapsed_ns)
+        self.assertEqual(histogram.count('extract_keywords'), 7)
+        self.assertEqual(histogram.to_dict(), {'extract_keywords': {1: 1, 2: 1, 4: 1, 1024: 2, 2048: 1, 2 ** 20: 1}})
+        self.assertEqual(histogram.percentile('extract_keywords', 0.5), 1024)
+        self.assertEqual(histogram.percentile('extract_keywords', 1), 2 ** 20)
+        self.assertIsNone(histogram.percentile('replace_keywords', 0.5))
+
+        self.keyword_processor.observers.append(histogram)
+        self.keyword_processor.replace_keywords('I love Big Apple.')
+        self.assertEqual(histogram.count('replace_keywords'), 1)
+        histogram.clear()
+        self.assertEqual(histogram.to_dict(), {})
+
+    def test_slowest_inputs(self):
+        slowest_inputs = SlowestInputs(size=3, prefix_length=4)
+        for elapsed_ns in (5, 1, 9, 7, 2, 8):
+            slowest_inputs('extract_keywords', 10, 0, elapsed_ns, text='sentence {}'.format(elapsed_ns))
+        calls = slowest_inputs.slowest()
+        self.assertEqual([call['elapsed_ns'] for call in calls], [9, 8, 7])
+        self.assertEqual(calls[0]['prefix'], 'sent')
+        self.assertEqual(len(calls[0]['sha1']), 40)
+        self.assertNotEqual(calls[0]['sha1'], calls[1]['sha1'])
+        slowest_inputs('extract_keywords', 10, 0, 10)
+        self.assertIsNone(slowest_inputs.slowest()[0]['sha1'])
+
+        slowest_inputs = SlowestInputs(size=1, keep_text=True)
+        self.keyword_processor.observers.append(slowest_inputs)
+        self.keyword_processor.extract_keywords('I love Big Apple.')
+        self.assertEqual(slowest_inputs.slowest()[0]['text'], 'I love Big Apple.')
+        slowest_inputs.clear()
+        self.assertEqual(len(slowest_inputs), 0)
+        with pytest.raises(ValueError):
+            SlowestInputs(size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
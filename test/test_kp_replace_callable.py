@@ -0,0 +1,94 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import json
+import io
+
+logger = logging.getLogger(__name__)
+
+
+def highlight(clean_name, matched_text, start, end):
+    return '<mark title="{}">{}</mark>'.format(clean_name, matched_text)
+
+
+class ListWriter(object):
+    def __init__(self):
+        self.pieces = []
+
+    def write(self, text):
+        self.pieces.append(text)
+
+
+class TestKPReplaceCallable(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_repl_gets_matches(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Replace keywords with a callable, and check it is called with the clean name,
+        the matched text and the span of every keyword extracted.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            sentence = test_case['sentence']
+            calls = []
+
+            def repl(clean_name, matched_text, start, end):
+                calls.append((clean_name, matched_text, start, end))
+                return clean_name
+
+            new_sentence = keyword_processor.replace_keywords(sentence, repl=repl)
+            self.assertEqual(new_sentence, keyword_processor.replace_keywords(sentence),
+                             "replaced sentence differs for test case: {}".format(test_id))
+            expected = [(clean_name, sentence[start:end], start, end)
+                        for clean_name, start, end in keyword_processor.extract_keywords(sentence, span_info=True)]
+            self.assertEqual(calls, expected, "repl calls differ for test case: {}".format(test_id))
+
+    def test_highlight(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        self.assertEqual(keyword_processor.replace_keywords('I love big apple.', repl=highlight),
+                         'I love <mark title="New York">big apple</mark>.')
+        self.assertEqual(keyword_processor.replace_keywords('I love big aple.', max_cost=1, repl=highlight),
+                         'I love <mark title="New York">big aple</mark>.')
+
+    def test_out_writer(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        out = ListWriter()
+        self.assertIsNone(keyword_processor.replace_keywords('I love Big Apple and Big Apple.', out=out))
+        self.assertEqual(out.pieces, ['I love ', 'New York', ' and ', 'New York', '.'])
+        out = io.StringIO()
+        keyword_processor.replace_keywords('Big Apple', out=out, repl=highlight)
+        keyword_processor.replace_keywords(' and Paris', out=out)
+        keyword_processor.replace_keywords('', out=out)
+        self.assertEqual(out.getvalue(), '<mark title="New York">Big Apple</mark> and Paris')
+
+    def test_stream_and_batch(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        sentence = 'I love Big Apple, ' * 20
+        fout = io.StringIO()
+        spans = []
+
+        def repl(clean_name, matched_text, start, end):
+            spans.append((start, end))
+            return highlight(clean_name, matched_text, start, end)
+
+        keyword_processor.replace_keywords_stream(io.StringIO(sentence), fout, chunk_size=7, repl=repl)
+        self.assertEqual(fout.getvalue(), keyword_processor.replace_keywords(sentence, repl=highlight))
+        self.assertEqual(spans, [(start, end) for _, start, end in
+                                 keyword_processor.extract_keywords(sentence, span_info=True)])
+        new_sentences = keyword_processor.replace_keywords_batch([sentence] * 3, workers=2, repl=highlight)
+        self.assertEqual(list(new_sentences), [keyword_processor.replace_keywords(sentence, repl=highlight)] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPReplaceSpans(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_replace_matches_extracted_spans(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor.
+        Replace keywords and check the text between the extracted spans is left as it is.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            sentence = test_case['sentence']
+            new_sentence = sentence
+            for clean_name, start, end in reversed(keyword_processor.extract_keywords(sentence, span_info=True)):
+                new_sentence = new_sentence[:start] + clean_name + new_sentence[end:]
+            self.assertEqual(keyword_processor.replace_keywords(sentence), new_sentence,
+                             "replaced sentence differs from the extracted spans for test case: {}".format(test_id))
+
+    def test_same_object_without_keywords(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        sentence = 'I love San Francisco.'
+        self.assertIs(keyword_processor.replace_keywords(sentence), sentence)
+        self.assertIs(keyword_processor.replace_keywords(sentence, max_cost=1), sentence)
+        keyword_processor.compile()
+        self.assertIs(keyword_processor.replace_keywords(sentence), sentence)
+
+    def test_text_around_keywords_is_kept(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        # 'É' is a word boundary, it is copied without being folded
+        self.assertEqual(keyword_processor.replace_keywords('BIG APPLEÉTÉ, Big  Apple'), 'New YorkÉTÉ, Big  Apple')
+        self.assertEqual(keyword_processor.replace_keywords('I love Big Aple!', max_cost=1), 'I love New York!')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import pytest
+import pickle
+import shutil
+import tempfile
+import json
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPSnapshot(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'keywords.flashtext')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        logger.info("Ending.")
+
+    def test_extract_keywords_loaded(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Save it to a snapshot and load it back, with and without mmap.
+        Extract keywords and check if they match the ones found before saving.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            for case_sensitive in (False, True):
+                keyword_processor = KeywordProcessor(case_sensitive=case_sensitive)
+                keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+                expected = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+                keyword_processor.save(self.path)
+                for mmap in (True, False):
+                    loaded_processor = KeywordProcessor.load(self.path, mmap=mmap)
+                    keywords_extracted = loaded_processor.extract_keywords(test_case['sentence'], span_info=True)
+                    self.assertEqual(keywords_extracted, expected,
+                                     "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+                    del loaded_processor
+
+    def test_settings_loaded(self):
+        keyword_processor = KeywordProcessor(case_sensitive=True)
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('Bay Area', 'Área de la Bahía')
+        keyword_processor.add_non_word_boundary('/')
+        keyword_processor.compile(aho_corasick=True)
+        keyword_processor.save(self.path)
+        loaded_processor = KeywordProcessor.load(self.path)
+        self.assertTrue(loaded_processor.case_sensitive)
+        self.assertEqual(loaded_processor.non_word_boundaries, keyword_processor.non_word_boundaries)
+        self.assertEqual(len(loaded_processor), 2)
+        self.assertIsNotNone(loaded_processor.automaton.failure_links)
+        self.assertEqual(loaded_processor['Bay Area'], 'Área de la Bahía')
+        self.assertEqual(loaded_processor.extract_keywords('Big Apple/Bay Area, Big Apple'), ['New York'])
+        self.assertEqual(loaded_processor.get_all_keywords(), keyword_processor.get_all_keywords())
+
+    def test_add_keyword_after_load(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.save(self.path)
+        loaded_processor = KeywordProcessor.load(self.path)
+        loaded_processor.add_keyword('Bay Area')
+        self.assertIsNone(loaded_processor.automaton)
+        self.assertEqual(loaded_processor.extract_keywords('I love big apple and bay area.'), ['New York', 'Bay Area'])
+
+    def test_pickle_loaded(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.save(self.path)
+        loaded_processor = pickle.loads(pickle.dumps(KeywordProcessor.load(self.path)))
+        self.assertEqual(loaded_processor.extract_keywords('I love big apple.'), ['New York'])
+
+    def test_save_over_loaded(self):
+        """Saving over a snapshot that is memory mapped should not change what it maps,
+        and processes loading it again by pickle should refuse the new file.
+        """
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.save(self.path)
+        loaded_processor = KeywordProcessor.load(self.path)
+        pickled = pickle.dumps(loaded_processor)
+
+        other_processor = KeywordProcessor()
+        other_processor.add_keywords_from_list(['keyword {}'.format(index) for index in range(1000)])
+        other_processor.save(self.path)
+        self.assertEqual(loaded_processor.extract_keywords('I love big apple.'), ['New York'])
+        self.assertEqual(KeywordProcessor.load(self.path).extract_keywords('keyword 7'), ['keyword 7'])
+        self.assertEqual(os.listdir(self.directory), ['keywords.flashtext'])
+        with pytest.raises(ValueError):
+            pickle.loads(pickled)
+
+    def test_invalid_snapshot(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'java\npython\n')
+        with pytest.raises(ValueError):
+            KeywordProcessor.load(self.path, mmap=False)
+
+    def test_save_non_string_clean_name(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', ['New York'])
+        with pytest.raises(TypeError):
+            keyword_processor.save(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPStats(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_stats_same_keywords(self):
+        """Keywords extracted and replaced while counting should match the ones found without,
+        exactly and fuzzy, overlapping or not, with both fuzzy backends and either case.
+        """
+        for fuzzy_backend in ('trie', 'deletions'):
+            for case_sensitive in (False, True):
+                for test_id, test_case in enumerate(self.test_cases):
+                    keyword_processor = KeywordProcessor(case_sensitive, fuzzy_backend=fuzzy_backend)
+                    counting_processor = KeywordProcessor(case_sensitive, fuzzy_backend=fuzzy_backend, collect_stats=True)
+                    for processor in (keyword_processor, counting_processor):
+                        processor.add_keywords_from_dict(test_case['keyword_dict'])
+                    sentence = test_case['sentence']
+                    for max_cost in (0, 1, 2):
+                        for overlapping in ((False, True) if not max_cost else (False,)):
+                            self.assertEqual(
+                                counting_processor.extract_keywords(sentence, span_info=True, max_cost=max_cost,
+                                                                    overlapping=overlapping),
+                                keyword_processor.extract_keywords(sentence, span_info=True, max_cost=max_cost,
+                                                                   overlapping=overlapping),
+                                "counted keywords don't match for test {} with max_cost {}".format(test_id, max_cost))
+                        last_stats = counting_processor.last_stats
+                        # every character is read once, and again when a look ahead is discarded
+                        self.assertEqual(last_stats['characters_scanned'],
+                                         len(sentence) + last_stats['lookahead_discarded'])
+                        self.assertEqual(
+                            counting_processor.replace_keywords(sentence, max_cost=max_cost),
+                            keyword_processor.replace_keywords(sentence, max_cost=max_cost),
+                            "counted replacement doesn't match for test {} with max_cost {}".format(test_id, max_cost))
+                    self.assertEqual(counting_processor.stats['calls'], 7)
+
+    def test_stats_counters(self):
+        keyword_processor = KeywordProcessor(collect_stats=True)
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('Big Apple Pie', 'Pie')
+        sentence = 'I love Big Apple Tart.'
+        self.assertEqual(keyword_processor.extract_keywords(sentence), ['New York'])
+        # the space after 'Apple' is read again once 'Pie' is not found
+        self.assertEqual(keyword_processor.last_stats, {
+            'calls': 1, 'characters_scanned': len(sentence) + 1, 'transitions': 10, 'lookahead_discarded': 1,
+            'levensthein_calls': 0, 'fuzzy_cache_hits': 0, 'dp_rows': 0})
+
+        keyword_processor.extract_keywords('I love Big Aple.', max_cost=1)
+        fuzzy_stats = keyword_processor.last_stats
+        self.assertGreater(fuzzy_stats['levensthein_calls'], 0)
+        self.assertGreater(fuzzy_stats['dp_rows'], 0)
+        self.assertEqual(fuzzy_stats['fuzzy_cache_hits'], 0)
+        keyword_processor.extract_keywords('I love Big Aple.', max_cost=1)
+        self.assertEqual(keyword_processor.last_stats['fuzzy_cache_hits'], fuzzy_stats['levensthein_calls'])
+        self.assertEqual(keyword_processor.last_stats['dp_rows'], 0)
+        self.assertEqual(keyword_processor.stats['calls'], 3)
+        self.assertEqual(keyword_processor.stats['dp_rows'], fuzzy_stats['dp_rows'])
+
+        keyword_processor.compile()
+        self.assertEqual(keyword_processor.find_first('I love Big Apple'), 'New York')
+        self.assertEqual(keyword_processor.last_stats['characters_scanned'], len('I love Big Apple'))
+        self.assertEqual(keyword_processor.stats['calls'], 4)
+
+        keyword_processor.reset_stats()
+        self.assertEqual(keyword_processor.stats['calls'], 0)
+        self.assertIsNone(keyword_processor.last_stats)
+
+    def test_stats_off(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.extract_keywords('I love Big Apple.')
+        self.assertIsNone(keyword_processor.stats)
+        self.assertIsNone(keyword_processor.last_stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import pytest
+import json
+import io
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPStream(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_extract_keywords_from_stream(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Read the sentence in chunks of a few characters, keywords cut between
+        two chunks should be found with the same spans as on the whole sentence.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+            expected = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+            for chunk_size in (1, 2, 5, 64):
+                keywords_extracted = keyword_processor.extract_keywords_from_stream(
+                    io.StringIO(test_case['sentence']), chunk_size=chunk_size)
+                self.assertEqual(list(keywords_extracted), expected,
+                                 "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+
+    def test_replace_keywords_stream(self):
+        for test_id, test_case in enumerate(self.test_cases):
+            keyword_replacer = KeywordProcessor()
+            for key, values in test_case['keyword_dict'].items():
+                for value in values:
+                    keyword_replacer.add_keyword(value, key.replace(" ", "_"))
+            expected = keyword_replacer.replace_keywords(test_case['sentence'])
+            for chunk_size in (1, 3, 64):
+                fout = io.StringIO()
+                keyword_replacer.replace_keywords_stream(io.StringIO(test_case['sentence']), fout, chunk_size)
+                self.assertEqual(fout.getvalue(), expected,
+                                 "new_sentence don't match the expected results for test case: {}".format(test_id))
+
+    def test_longer_keyword_across_chunks(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('Big Apple Pie', 'Dessert')
+        keyword_processor.compile()
+        text = 'I love Big Apple Pie. ' * 3 + 'Big Apples are not Big Apple.'
+        keywords_extracted = keyword_processor.extract_keywords_from_stream(io.StringIO(text), chunk_size=4)
+        self.assertEqual(list(keywords_extracted), [('Dessert', 7, 20), ('Dessert', 29, 42),
+                                                    ('Dessert', 51, 64), ('New York', 85, 94)])
+
+    def test_invalid_chunk_size(self):
+        keyword_processor = KeywordProcessor()
+        with pytest.raises(ValueError):
+            list(keyword_processor.extract_keywords_from_stream(io.StringIO('text'), chunk_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+from flashtext import KeywordProcessor
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPThreaded(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+        self.keyword_processor = KeywordProcessor()
+        for test_case in self.test_cases:
+            self.keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+        self.sentences = [test_case['sentence'] for test_case in self.test_cases]
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_extract_keywords_threaded(self):
+        """Keywords extracted by the pool of threads should match the ones extracted one
+        sentence at a time, in the same order, from the trie and compiled.
+        """
+        expected = [self.keyword_processor.extract_keywords(sentence, span_info=True)
+                    for sentence in self.sentences]
+        for compile_kwargs in (None, {}, {'tokens': True}):
+            if compile_kwargs is not None:
+                self.keyword_processor.compile(**compile_kwargs)
+            for threads in (1, 4):
+                keywords_extracted = self.keyword_processor.extract_keywords_threaded(
+                    iter(self.sentences * 10), span_info=True, threads=threads, chunksize=3)
+                self.assertEqual(list(keywords_extracted), expected * 10)
+
+    def test_fuzzy_cache_shared(self):
+        expected = [self.keyword_processor.extract_keywords(sentence, max_cost=1) for sentence in self.sentences]
+        self.keyword_processor.fuzzy_cache.clear()
+        keywords_extracted = self.keyword_processor.extract_keywords_threaded(
+            self.sentences * 20, max_cost=1, threads=4, chunksize=1)
+        self.assertEqual(list(keywords_extracted), expected * 20)
+        fuzzy_cache = self.keyword_processor.fuzzy_cache
+        self.assertGreater(fuzzy_cache.hits, fuzzy_cache.misses)
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError):
+            list(self.keyword_processor.extract_keywords_threaded(self.sentences, chunksize=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
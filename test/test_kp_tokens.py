@@ -0,0 +1,86 @@
+from flashtext import KeywordProcessor
+from flashtext.characters import WordCharacters
+from flashtext.tokens import tokenize
+import logging
+import unittest
+import pytest
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPTokens(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+        with open('test/keyword_extractor_test_cases.json') as f:
+            self.test_cases = json.load(f)
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_tokenize(self):
+        word_chars = WordCharacters(set('abcdefghijklmnopqrstuvwxyz'))
+        self.assertEqual(tokenize('new-york  city.', word_chars), ['new', '-', 'york', ' ', ' ', 'city', '.'])
+        self.assertEqual(tokenize('', word_chars), [])
+
+    def test_extract_keywords_tokens(self):
+        """For each of the test case initialize a new KeywordProcessor.
+        Add the keywords the test case to KeywordProcessor and compile it on tokens.
+        Extract keywords and check if they match the ones found on characters.
+
+        """
+        for test_id, test_case in enumerate(self.test_cases):
+            for case_sensitive in (False, True):
+                keyword_processor = KeywordProcessor(case_sensitive=case_sensitive)
+                keyword_processor.add_keywords_from_dict(test_case['keyword_dict'])
+                expected = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+                expected_sentence = keyword_processor.replace_keywords(test_case['sentence'])
+                keyword_processor.compile(tokens=True)
+                keywords_extracted = keyword_processor.extract_keywords(test_case['sentence'], span_info=True)
+                self.assertEqual(keywords_extracted, expected,
+                                 "keywords_extracted don't match the expected results for test case: {}".format(test_id))
+                self.assertEqual(keyword_processor.replace_keywords(test_case['sentence']), expected_sentence,
+                                 "new_sentence don't match the expected results for test case: {}".format(test_id))
+
+    def test_phrases_are_shallow(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('product management techniques', 'product management')
+        keyword_processor.add_keyword('product management', 'product management')
+        automaton = keyword_processor.compile(tokens=True)
+        # root, then 'product', ' ', 'management', ' ', 'techniques'
+        self.assertEqual(len(automaton), 6)
+        self.assertEqual(automaton.max_depth, len('product management techniques'))
+        self.assertTrue('Product Management' in keyword_processor)
+        self.assertEqual(keyword_processor.extract_keywords('I know PRODUCT MANAGEMENT TECHNIQUES.', span_info=True),
+                         [('product management', 7, 36)])
+        self.assertEqual(keyword_processor.get_all_keywords(), {'product management techniques': 'product management',
+                                                                'product management': 'product management'})
+
+    def test_overlapping_tokens(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple', 'New York')
+        keyword_processor.add_keyword('Apple Pie', 'Pie')
+        keyword_processor.add_keyword('Big Apple Pie', 'Dessert')
+        keyword_processor.compile(tokens=True)
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple Pie.', span_info=True, overlapping=True),
+                         [('New York', 7, 16), ('Dessert', 7, 20), ('Pie', 11, 20)])
+
+    def test_non_word_boundaries_changed_after_compile(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple')
+        keyword_processor.add_keyword('Apple/Bay')
+        keyword_processor.compile(tokens=True, keep_trie=False)
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple/Bay Area.'), ['Big Apple'])
+        keyword_processor.add_non_word_boundary('/')
+        # 'Apple/Bay' is now a single token
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple/Bay Area.'), ['Apple/Bay'])
+
+    def test_tokens_with_aho_corasick(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple')
+        with pytest.raises(ValueError):
+            keyword_processor.compile(tokens=True, aho_corasick=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
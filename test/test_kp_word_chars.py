@@ -0,0 +1,56 @@
+from flashtext import KeywordProcessor
+from flashtext.characters import WordCharacters
+import logging
+import unittest
+
+logger = logging.getLogger(__name__)
+
+
+class TestKPWordChars(unittest.TestCase):
+    def setUp(self):
+        logger.info("Starting...")
+
+    def tearDown(self):
+        logger.info("Ending.")
+
+    def test_word_characters(self):
+        word_chars = WordCharacters(set('ab'), unicode_words=True)
+        self.assertEqual([word_chars[char] for char in 'aé中_ -'], [True, True, True, True, False, False])
+        word_chars = WordCharacters(set('ab'))
+        self.assertEqual([word_chars[char] for char in 'aé中_ -'], [True, False, False, False, False, False])
+        self.assertTrue(word_chars.describes(set('ab'), False))
+        self.assertFalse(word_chars.describes(set('abc'), False))
+
+    def test_unicode_words(self):
+        sentence = 'Un café à la cafétéria de Zürich'
+        for compile_mode in (None, False, True):
+            keyword_processor = KeywordProcessor()
+            keyword_processor.add_keyword('café', 'coffee')
+            keyword_processor.add_keyword('caf', 'CAF')
+            keyword_processor.add_keyword('rich', 'RICH')
+            if compile_mode is not None:
+                keyword_processor.compile(aho_corasick=compile_mode)
+            # with ASCII word characters 'é' and 'ü' are word boundaries
+            self.assertEqual(keyword_processor.extract_keywords(sentence), ['coffee', 'CAF', 'RICH'])
+            keyword_processor.unicode_words = True
+            self.assertEqual(keyword_processor.extract_keywords(sentence, span_info=True), [('coffee', 3, 7)])
+            self.assertEqual(keyword_processor.replace_keywords(sentence), 'Un coffee à la cafétéria de Zürich')
+
+    def test_unicode_words_cjk(self):
+        keyword_processor = KeywordProcessor(unicode_words=True)
+        keyword_processor.add_keyword('東京', 'Tokyo')
+        self.assertEqual(keyword_processor.extract_keywords('東京 と 東京都'), ['Tokyo'])
+
+    def test_non_word_boundaries_changed_after_use(self):
+        keyword_processor = KeywordProcessor()
+        keyword_processor.add_keyword('Big Apple')
+        keyword_processor.compile()
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple/Bay Area.'), ['Big Apple'])
+        keyword_processor.add_non_word_boundary('/')
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple/Bay Area.'), [])
+        keyword_processor.set_non_word_boundaries(set('abcdefghijklmnopqrstuvwxyz'))
+        self.assertEqual(keyword_processor.extract_keywords('I love Big Apple/Bay Area.'), ['Big Apple'])
+
+
+if __name__ == '__main__':
+    unittest.main()